@@ -11,6 +11,7 @@ Features:
 
 import sys
 import json
+import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -19,6 +20,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from polymarket.client import PolymarketClient
 from alerts.telegram_notifier import TelegramNotifier
+from utils.json_io import read_json, write_json
+
+logger = logging.getLogger(__name__)
+# No output unless the application configures logging (print already shows it)
+logger.addHandler(logging.NullHandler())
+
+
+def _report(message: str, level: int = logging.INFO):
+    """Print a user-facing message and log it too."""
+    print(message)
+    logger.log(level, message.strip())
 
 
 class ExitTracker:
@@ -37,21 +49,18 @@ class ExitTracker:
         """Load open positions from paper trades."""
         if not self.trades_file.exists():
             return []
-        with open(self.trades_file, "r") as f:
-            trades = json.load(f)
+        trades = read_json(self.trades_file)
         return [t for t in trades if t.get("status") == "OPEN"]
     
     def load_targets(self) -> Dict[str, Dict]:
         """Load exit targets for positions."""
         if not self.targets_file.exists():
             return {}
-        with open(self.targets_file, "r") as f:
-            return json.load(f)
+        return read_json(self.targets_file)
     
     def save_targets(self, targets: Dict):
         """Save exit targets."""
-        with open(self.targets_file, "w") as f:
-            json.dump(targets, f, indent=2)
+        write_json(self.targets_file, targets, indent=True)
     
     def set_exit_target(self, 
                         position_id: int,
@@ -78,13 +87,13 @@ class ExitTracker:
         }
         
         self.save_targets(targets)
-        print(f"✅ Exit targets set for position #{position_id}")
+        _report(f"✅ Exit targets set for position #{position_id}")
         if take_profit:
-            print(f"   Take profit: {take_profit:.1f}%")
+            _report(f"   Take profit: {take_profit:.1f}%")
         if stop_loss:
-            print(f"   Stop loss: {stop_loss:.1f}%")
+            _report(f"   Stop loss: {stop_loss:.1f}%")
         if trailing_stop:
-            print(f"   Trailing stop: {trailing_stop:.1f}pp")
+            _report(f"   Trailing stop: {trailing_stop:.1f}pp")
     
     def get_current_price(self, market_slug: str) -> Optional[float]:
         """Fetch current price for a market."""
@@ -101,7 +110,7 @@ class ExitTracker:
                     if prices:
                         return float(prices[0]) * 100
         except Exception as e:
-            print(f"Error fetching price: {e}")
+            _report(f"Error fetching price: {e}", logging.WARNING)
         return None
     
     def check_exits(self) -> List[Dict]:
@@ -113,7 +122,7 @@ class ExitTracker:
         targets = self.load_targets()
         
         if not positions:
-            print("No open positions to track.")
+            _report("No open positions to track.")
             return []
         
         triggered = []
@@ -132,7 +141,7 @@ class ExitTracker:
             
             current = self.get_current_price(slug)
             if current is None:
-                print(f"⚠️ Could not fetch: {question[:40]}...")
+                _report(f"⚠️ Could not fetch: {question[:40]}...", logging.WARNING)
                 continue
             
             # Calculate P&L
@@ -241,7 +250,7 @@ class ExitTracker:
 
 Consider closing this position."""
         
-        self.notifier.send_message(message)
+        self.notifier.send(message)
     
     def portfolio_summary(self) -> Dict:
         """Get full portfolio summary with real-time P&L."""
@@ -5,6 +5,7 @@ Runs periodically to detect news and track market movements.
 """
 import json
 import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +25,8 @@ AI_KEYWORDS = [
     "google ai", "gemini", "deepmind", "meta ai", "llama",
     "ai regulation", "ai safety", "agi"
 ]
+# All keywords in one case-insensitive pattern (plain substring matches)
+AI_KEYWORDS_RE = re.compile("|".join(map(re.escape, AI_KEYWORDS)), re.IGNORECASE)
 
 # Markets we're tracking
 TRACKED_MARKETS = {
@@ -75,20 +78,35 @@ def get_market_prices():
     
     return prices
 
+def _read_seen() -> set:
+    """Load headlines already reported by previous runs."""
+    seen_file = DATA_DIR / "seen_headlines.json"
+    if seen_file.exists():
+        with open(seen_file) as f:
+            return set(json.load(f))
+    return set()
+
+def _write_seen(seen: set) -> None:
+    """Persist seen headlines for the next run."""
+    with open(DATA_DIR / "seen_headlines.json", 'w') as f:
+        json.dump(list(seen)[-100:], f)  # Keep last 100
+
 def check_pending_events():
     """Check price updates for events logged in the last 24h."""
     data = load_events()
     prices = get_market_prices()
     
-    now = datetime.now()
+    now_ts = datetime.now().timestamp()
     
     for event in data["events"]:
         if event.get("market_price_1h_later"):
             continue  # Already has update
         
-        # Check if 1+ hour has passed
-        news_time = datetime.fromisoformat(event["news_time"])
-        hours_passed = (now - news_time).total_seconds() / 3600
+        # Check if 1+ hour has passed (older events only carry the ISO string)
+        news_ts = event.get("_news_time_ts")
+        if news_ts is None:
+            news_ts = datetime.fromisoformat(event["news_time"]).timestamp()
+        hours_passed = (now_ts - news_ts) / 3600
         
         if hours_passed >= 1:
             slug = event.get("market_slug")
@@ -112,24 +130,18 @@ def run_monitor():
     news = search_news()
     
     # Save seen headlines to avoid duplicates
-    seen_file = DATA_DIR / "seen_headlines.json"
-    seen = set()
-    if seen_file.exists():
-        with open(seen_file) as f:
-            seen = set(json.load(f))
+    seen = _read_seen()
     
     new_items = []
     for item in news:
         title = item.get("title", "")
         if title and title not in seen:
             # Check if it's relevant
-            title_lower = title.lower()
-            if any(kw in title_lower for kw in AI_KEYWORDS):
+            if AI_KEYWORDS_RE.search(title):
                 new_items.append(item)
                 seen.add(title)
     
-    with open(seen_file, 'w') as f:
-        json.dump(list(seen)[-100:], f)  # Keep last 100
+    _write_seen(seen)
     
     if new_items:
         print(f"\nFound {len(new_items)} new relevant headlines:")
@@ -14,12 +14,22 @@ import json
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 from dataclasses import dataclass
 
+from utils.json_io import fold_event_log, read_json, read_jsonl
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 DATA_DIR = Path(__file__).parent / "data"
 PAPER_TRADES_FILE = DATA_DIR / "paper_trades.json"
-EDGE_EVENTS_FILE = DATA_DIR / "edge_events.json"
+EDGE_EVENTS_FILE = DATA_DIR / "edge_events.jsonl"
+EDGE_STATS_FILE = DATA_DIR / "edge_stats.json"
+LEGACY_EDGE_EVENTS_FILE = DATA_DIR / "edge_events.json"
 
 
 @dataclass
@@ -53,10 +63,13 @@ def load_trades() -> list:
 
 def load_edge_events() -> dict:
     """Load edge events for timing analysis"""
-    if not EDGE_EVENTS_FILE.exists():
-        return {"events": [], "stats": {}}
-    with open(EDGE_EVENTS_FILE) as f:
-        return json.load(f)
+    if EDGE_EVENTS_FILE.exists():
+        stats = read_json(EDGE_STATS_FILE) if EDGE_STATS_FILE.exists() else {}
+        return {"events": fold_event_log(read_jsonl(EDGE_EVENTS_FILE)), "stats": stats}
+    if LEGACY_EDGE_EVENTS_FILE.exists():
+        with open(LEGACY_EDGE_EVENTS_FILE) as f:
+            return json.load(f)
+    return {"events": [], "stats": {}}
 
 
 def calculate_unrealized_pnl(trade: dict, current_price: Optional[float] = None) -> float:
@@ -80,6 +93,29 @@ def calculate_unrealized_pnl(trade: dict, current_price: Optional[float] = None)
         return (entry_price - current) * shares
 
 
+def calculate_unrealized_pnl_batch(entry_prices: Sequence[float], current_prices: Sequence[float],
+                                   shares: Sequence[float], is_yes: Sequence[bool]):
+    """
+    Vectorized calculate_unrealized_pnl for many open positions at once.
+    
+    Uses the same per-position arithmetic as the scalar version, with the sign
+    flipped for No positions, so results match it exactly.
+    
+    Returns:
+        NumPy array of P&L values (a list if NumPy isn't installed)
+    """
+    if not NUMPY_AVAILABLE:
+        return [
+            ((cur / 100 - entry / 100) if yes else (entry / 100 - cur / 100)) * n
+            for entry, cur, n, yes in zip(entry_prices, current_prices, shares, is_yes)
+        ]
+    
+    entry = np.asarray(entry_prices, dtype=np.float64) / 100
+    cur = np.asarray(current_prices, dtype=np.float64) / 100
+    diff = np.where(np.asarray(is_yes, dtype=bool), cur - entry, entry - cur)
+    return diff * np.asarray(shares, dtype=np.float64)
+
+
 def analyze_trades(trades: list, current_prices: Optional[dict] = None) -> TradeStats:
     """Analyze trading performance"""
     stats = TradeStats()
@@ -90,6 +126,7 @@ def analyze_trades(trades: list, current_prices: Optional[dict] = None) -> Trade
     wins = []
     losses = []
     hold_times = []
+    priced_open = []  # (trade, current price) for open positions with a quote
     
     for trade in trades:
         stats.total_trades += 1
@@ -118,10 +155,19 @@ def analyze_trades(trades: list, current_prices: Optional[dict] = None) -> Trade
                     pass
         else:
             stats.open_trades += 1
-            # Calculate unrealized P&L
+            # Unrealized P&L is computed for all priced positions in one batch
             slug = trade.get("market_slug", "")
             current = current_prices.get(slug) if current_prices else None
-            stats.unrealized_pnl += calculate_unrealized_pnl(trade, current)
+            if trade.get("status") == "OPEN" and current is not None:
+                priced_open.append((trade, current))
+    
+    if priced_open:
+        stats.unrealized_pnl = float(sum(calculate_unrealized_pnl_batch(
+            [t["entry_price"] for t, _ in priced_open],
+            [cur for _, cur in priced_open],
+            [t["shares"] for t, _ in priced_open],
+            [t.get("outcome", "Yes") == "Yes" for t, _ in priced_open],
+        )))
     
     # Calculate derived stats
     stats.total_pnl = stats.realized_pnl + stats.unrealized_pnl
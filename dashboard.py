@@ -11,9 +11,23 @@ Usage:
 
 import argparse
 import json
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -22,6 +36,9 @@ from paper_trader import PaperTrader, STARTING_BALANCE
 
 DATA_DIR = Path(__file__).parent / "data"
 
+# Trade statuses that count as an open position
+_OPEN_STATUSES = frozenset({"OPEN"})
+
 
 def get_live_prices(client: PolymarketClient, slugs: list) -> dict:
     """Get live prices for a list of market slugs"""
@@ -38,34 +55,129 @@ def get_live_prices(client: PolymarketClient, slugs: list) -> dict:
     return prices
 
 
-def calculate_unrealized_pnl(trades: list, prices: dict) -> list:
-    """Calculate unrealized P&L for open positions"""
-    results = []
-    for t in trades:
-        if t["status"] != "OPEN":
-            continue
-        
-        slug = t["market_slug"]
-        if slug not in prices:
-            continue
-        
-        current_price = prices[slug]["yes"] if t["outcome"] == "Yes" else prices[slug]["no"]
-        entry_price = t["entry_price"]
-        shares = t["shares"]
-        
-        # P&L = price change * shares
-        price_change = current_price - entry_price
-        unrealized_pnl = (price_change / 100) * shares
-        pnl_pct = (unrealized_pnl / t["amount"]) * 100 if t["amount"] > 0 else 0
-        
-        results.append({
-            **t,
-            "current_price": current_price,
-            "unrealized_pnl": unrealized_pnl,
-            "unrealized_pnl_pct": pnl_pct,
-        })
-    
-    return results
+# Fields PnLRow adds on top of the trade it wraps
+_PNL_FIELDS = ("current_price", "unrealized_pnl", "unrealized_pnl_pct")
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class PnLRow(Mapping):
+    """
+    An open trade with its live price and unrealized P&L.
+    
+    A read-only mapping view equal to {**trade, current_price, ...} without
+    copying the trade: the computed fields are looked up first and
+    everything else falls through to the trade dict. Use dict(row) where a
+    real dict is needed (e.g. json.dumps).
+    """
+    trade: dict
+    current_price: float
+    unrealized_pnl: float
+    unrealized_pnl_pct: float
+    
+    def __getitem__(self, key):
+        if key in _PNL_FIELDS:
+            return getattr(self, key)
+        return self.trade[key]
+    
+    def __iter__(self):
+        yield from self.trade
+        for key in _PNL_FIELDS:
+            if key not in self.trade:
+                yield key
+    
+    def __len__(self):
+        return len(self.trade) + sum(key not in self.trade for key in _PNL_FIELDS)
+
+
+def _pnl_kernel(entry, current, shares, amount):
+    """
+    P&L and P&L % for parallel float64 arrays.
+    
+    Array-only NumPy ops so the same body runs under numba.njit when it's
+    installed. No fastmath: results must match the scalar formula exactly.
+    """
+    pnl = ((current - entry) / 100) * shares
+    has_amount = amount > 0
+    safe_amount = np.where(has_amount, amount, np.ones_like(amount))
+    pct = np.where(has_amount, (pnl / safe_amount) * 100, np.zeros_like(pnl))
+    return pnl, pct
+
+
+if NUMBA_AVAILABLE:
+    _pnl_kernel = njit(cache=True)(_pnl_kernel)
+    # Compile at import so the first dashboard refresh doesn't pay for the JIT
+    _pnl_kernel(np.zeros(1), np.zeros(1), np.zeros(1), np.ones(1))
+
+
+def prepare_price_table(prices: dict) -> tuple:
+    """
+    Index a live-prices snapshot as (slug_to_row, table).
+    
+    table[row] holds the (yes, no) prices for that slug; with NumPy it is an
+    (N, 2) float64 array so the vectorized path can gather every trade's
+    price with whole-column indexing. Build it once per snapshot and pass it to
+    calculate_unrealized_pnl to reuse it across calls.
+    """
+    slug_to_row = {slug: row for row, slug in enumerate(prices)}
+    pairs = [(p["yes"], p["no"]) for p in prices.values()]
+    if NUMPY_AVAILABLE:
+        return slug_to_row, np.array(pairs, dtype=np.float64).reshape(-1, 2)
+    return slug_to_row, pairs
+
+
+def calculate_unrealized_pnl(trades: list, prices: dict, price_table: tuple = None) -> list:
+    """
+    Calculate unrealized P&L for open positions, as PnLRow objects.
+    
+    price_table is prepare_price_table(prices), built here if not given.
+    With NumPy available, entry/current/shares/amount for every priced open
+    position are packed into parallel arrays and the P&L math runs as a few
+    vectorized ops; rows are only wrapped as PnLRow on the way out.
+    """
+    if not prices or not trades:
+        return []
+    
+    slug_to_row, table = price_table if price_table is not None else prepare_price_table(prices)
+    
+    if not NUMPY_AVAILABLE:
+        # One pass: filter to priced open trades, P&L = price change * shares
+        return [
+            PnLRow(
+                t,
+                current_price := table[row][0 if t["outcome"] == "Yes" else 1],
+                unrealized_pnl := ((current_price - t["entry_price"]) / 100) * t["shares"],
+                (unrealized_pnl / t["amount"]) * 100 if t["amount"] > 0 else 0,
+            )
+            for t in trades
+            if t.get("status") in _OPEN_STATUSES
+            and (row := slug_to_row.get(t["market_slug"])) is not None
+        ]
+    
+    open_trades = [t for t in trades if t.get("status") in _OPEN_STATUSES]
+    n = len(open_trades)
+    rows = np.fromiter(
+        (slug_to_row.get(t["market_slug"], -1) for t in open_trades), dtype=np.int64, count=n
+    )
+    # Anything but "Yes" prices off the "no" column, as in the scalar path
+    is_no = np.fromiter((t["outcome"] != "Yes" for t in open_trades), dtype=np.bool_, count=n)
+    has_price = rows >= 0
+    if not has_price.all():
+        open_trades = [t for t, keep in zip(open_trades, has_price.tolist()) if keep]
+        rows, is_no = rows[has_price], is_no[has_price]
+        n = len(open_trades)
+    
+    current = np.where(is_no, table[rows, 1], table[rows, 0])
+    entry = np.fromiter((t["entry_price"] for t in open_trades), dtype=np.float64, count=n)
+    shares = np.fromiter((t["shares"] for t in open_trades), dtype=np.float64, count=n)
+    amount = np.fromiter((t["amount"] for t in open_trades), dtype=np.float64, count=n)
+    
+    pnl, pct = _pnl_kernel(entry, current, shares, amount)
+    
+    return [
+        PnLRow(t, current_price, unrealized_pnl, pnl_pct)
+        for t, current_price, unrealized_pnl, pnl_pct
+        in zip(open_trades, current.tolist(), pnl.tolist(), pct.tolist())
+    ]
 
 
 def print_header(title: str):
@@ -79,7 +191,7 @@ def get_dashboard_data() -> dict:
     client = PolymarketClient()
     trader = PaperTrader()
     
-    open_trades = [t for t in trader.trades if t["status"] == "OPEN"]
+    open_trades = [t for t in trader.trades if t.get("status") in _OPEN_STATUSES]
     closed_trades = [t for t in trader.trades if t["status"] in ["CLOSED", "RESOLVED"]]
     
     position_slugs = list(set(t["market_slug"] for t in open_trades))
@@ -179,7 +291,7 @@ def main():
     trader = PaperTrader()
     
     # Get open positions
-    open_trades = [t for t in trader.trades if t["status"] == "OPEN"]
+    open_trades = [t for t in trader.trades if t.get("status") in _OPEN_STATUSES]
     closed_trades = [t for t in trader.trades if t["status"] in ["CLOSED", "RESOLVED"]]
     
     # Get live prices for positions
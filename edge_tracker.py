@@ -3,56 +3,249 @@
 Edge Validation Tracker
 Tracks news events and corresponding market movements to validate the lag hypothesis.
 """
-import json
+import io
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from utils.json_io import (
+    read_json, write_json, dump_jsonl, parse_jsonl, read_jsonl, write_jsonl, append_jsonl,
+    fold_event_log,
+)
+
 DATA_DIR = Path("/home/rafa/clawd/trading-system/data")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-EDGE_LOG = DATA_DIR / "edge_events.json"
+# One event per line, plus {"_update": id, ...} lines appended by update_event
+EDGE_LOG = DATA_DIR / "edge_events.jsonl"
+EDGE_STATS = DATA_DIR / "edge_stats.json"
+LEGACY_EDGE_LOG = DATA_DIR / "edge_events.json"  # pre-JSONL format, migrated on load
+
+# event id -> position in the events list it was built from
+_id_index = {"events": None, "index": {}}
+
+def _build_index(events: list) -> dict:
+    index = {}
+    for i, e in enumerate(events):
+        index.setdefault(e["id"], i)  # first match wins, like a linear scan
+    return index
+
+def _find_event(events: list, event_id: int):
+    """Return the event with this id, via the id index (rebuilt if stale)."""
+    if _id_index["events"] is not events:
+        _id_index["events"] = events
+        _id_index["index"] = _build_index(events)
+    i = _id_index["index"].get(event_id)
+    if i is None or i >= len(events) or events[i]["id"] != event_id:
+        # List was changed behind the index's back: rebuild once
+        _id_index["index"] = _build_index(events)
+        i = _id_index["index"].get(event_id)
+    return events[i] if i is not None else None
+
+def _file_key(path: Path):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+class FileBackend:
+    """Event log in EDGE_LOG, stats in EDGE_STATS (paths read on every call)."""
+    
+    def key(self):
+        """Changes whenever the stored log changes; None if there is no log."""
+        log_key = _file_key(EDGE_LOG)
+        return None if log_key is None else (log_key, _file_key(EDGE_STATS))
+    
+    def read(self) -> tuple:
+        stats = read_json(EDGE_STATS) if EDGE_STATS.exists() else {}
+        return read_jsonl(EDGE_LOG), stats
+    
+    def read_legacy(self):
+        return read_json(LEGACY_EDGE_LOG) if LEGACY_EDGE_LOG.exists() else None
+    
+    def write(self, events: list, stats: dict):
+        write_jsonl(EDGE_LOG, events)
+        write_json(EDGE_STATS, stats, indent=True)
+    
+    def append(self, records: list):
+        append_jsonl(EDGE_LOG, records)
+    
+    def open_log(self):
+        return open(EDGE_LOG, "rb")
+    
+    def dump_raw(self) -> tuple:
+        stats = EDGE_STATS.read_bytes() if EDGE_STATS.exists() else None
+        return EDGE_LOG.read_bytes(), stats
+
+class MemoryBackend:
+    """Same log format kept in process memory, for tests and embedding."""
+    
+    def __init__(self):
+        self._log = None  # JSONL bytes, None until first write
+        self._stats = None
+        self._version = 0
+    
+    def key(self):
+        return None if self._log is None else (self, self._version)
+    
+    def read(self) -> tuple:
+        stats = parse_jsonl(self._stats)[0] if self._stats else {}
+        return parse_jsonl(self._log), stats
+    
+    def read_legacy(self):
+        return None
+    
+    def write(self, events: list, stats: dict):
+        self._log = dump_jsonl(events)
+        self._stats = dump_jsonl([stats])
+        self._version += 1
+    
+    def append(self, records: list):
+        self._log = (self._log or b"") + dump_jsonl(records)
+        self._version += 1
+    
+    def open_log(self):
+        return io.BytesIO(self._log)
+    
+    def dump_raw(self) -> tuple:
+        return self._log, self._stats
+
+_BACKEND = FileBackend()
+
+def _dump_raw() -> tuple:
+    """(log bytes, stats bytes or None) exactly as the backend stores them."""
+    return _BACKEND.dump_raw()
+
+# Last parsed log, reused while the backend's key is unchanged.
+# "agg" holds running totals for calculate_stats, built lazily for "data".
+_cache = {"data": None, "key": None, "lines": 0, "agg": None}
 
 def load_events():
-    if EDGE_LOG.exists():
-        with open(EDGE_LOG) as f:
-            return json.load(f)
-    return {"events": [], "stats": {}}
+    """
+    Return {"events": [...], "stats": {...}} folded from the log.
+    
+    While the log is unchanged this is the same cached dict on every call, not
+    a copy: edits made to it show up in later loads without being written. Pass
+    an edited dict to save_events, or copy it before changing it locally.
+    """
+    key = _BACKEND.key()
+    if key is None:
+        data = _BACKEND.read_legacy()
+        if data is not None:
+            save_events(data)
+            return data
+        return {"events": [], "stats": {}}
+    if _cache["key"] == key:
+        return _cache["data"]
+    records, stats = _BACKEND.read()
+    data = {"events": fold_event_log(records), "stats": stats}
+    _cache.update(data=data, key=key, lines=len(records), agg=None)
+    return data
 
 def save_events(data):
-    with open(EDGE_LOG, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Rewrite the log compactly (one line per event) and the stats sidecar."""
+    _BACKEND.write(data["events"], data.get("stats", {}))
+    # Events may have been edited in place; _aggregates rebuilds the totals lazily
+    _cache.update(data=data, key=_BACKEND.key(), lines=len(data["events"]), agg=None)
+
+def _append_records(data, records: list):
+    """Append records to the log, compacting once updates outnumber events."""
+    _BACKEND.append(records)
+    if _cache["data"] is data:
+        lines, agg = _cache["lines"] + len(records), _cache["agg"]
+    else:
+        lines, agg = len(data["events"]), None
+    _cache.update(data=data, key=_BACKEND.key(), lines=lines, agg=agg)
+    if lines > 2 * len(data["events"]):
+        save_events(data)
+
+def _tally(agg: dict, e: dict, sign: int = 1):
+    """Add (sign=1) or remove (sign=-1) one event's share of the running stats."""
+    if e.get("market_price_at_news") and e.get("market_price_1h_later"):
+        agg["with_prices"] += sign
+        p0 = float(e["market_price_at_news"])
+        p1 = float(e["market_price_1h_later"])
+        if p0 > 0:
+            agg["sum_move"] += sign * (p1 - p0) / p0 * 100
+            agg["n_moves"] += sign
+    if e.get("final_resolution"):
+        agg["resolved"] += sign
+        if e.get("trade_result") == "win":
+            agg["wins"] += sign
+
+def _aggregates(data) -> dict:
+    """Running totals for data, computed in one pass the first time."""
+    if _cache["data"] is data and _cache["agg"] is not None:
+        return _cache["agg"]
+    agg = {"with_prices": 0, "sum_move": 0.0, "n_moves": 0, "resolved": 0, "wins": 0}
+    for e in data["events"]:
+        _tally(agg, e)
+    if _cache["data"] is data:
+        _cache["agg"] = agg
+    return agg
+
+def log_news_events_bulk(items: list) -> list:
+    """
+    Log several news events with a single append to the log.
+    
+    items are (headline, source) or (headline, source, market_slug) tuples;
+    returns the new event ids in order.
+    """
+    data = load_events()
+    events = data["events"]
+    now = datetime.now()
+    news_time, news_ts = now.isoformat(), now.timestamp()
+    agg = _cache["agg"] if _cache["data"] is data else None
+    indexed = _id_index["events"] is events
+    
+    new_events = []
+    for headline, source, *rest in items:
+        event = {
+            "id": len(events) + 1,
+            "type": "news",
+            "headline": headline,
+            "source": source,
+            "market_slug": rest[0] if rest else None,
+            "news_time": news_time,
+            "_news_time_ts": news_ts,  # same instant, no re-parsing downstream
+            "market_price_at_news": None,  # Fill in manually or via API
+            "market_price_1h_later": None,
+            "market_price_24h_later": None,
+            "final_resolution": None,  # "yes" or "no"
+            "notes": ""
+        }
+        events.append(event)
+        new_events.append(event)
+        if agg is not None:
+            _tally(agg, event)
+        if indexed:
+            _id_index["index"].setdefault(event["id"], len(events) - 1)
+    
+    if new_events:
+        _append_records(data, new_events)
+    for event in new_events:
+        print(f"Logged event #{event['id']}: {event['headline'][:50]}...")
+    return [event["id"] for event in new_events]
 
 def log_news_event(headline: str, source: str, market_slug: str = None):
     """Log a news event when detected."""
-    data = load_events()
-    event = {
-        "id": len(data["events"]) + 1,
-        "type": "news",
-        "headline": headline,
-        "source": source,
-        "market_slug": market_slug,
-        "news_time": datetime.now().isoformat(),
-        "market_price_at_news": None,  # Fill in manually or via API
-        "market_price_1h_later": None,
-        "market_price_24h_later": None,
-        "final_resolution": None,  # "yes" or "no"
-        "notes": ""
-    }
-    data["events"].append(event)
-    save_events(data)
-    print(f"Logged event #{event['id']}: {headline[:50]}...")
-    return event["id"]
+    return log_news_events_bulk([(headline, source, market_slug)])[0]
 
 def update_event(event_id: int, **kwargs):
     """Update an event with new data."""
     data = load_events()
-    for event in data["events"]:
-        if event["id"] == event_id:
-            event.update(kwargs)
-            save_events(data)
-            print(f"Updated event #{event_id}")
-            return
+    event = _find_event(data["events"], event_id)
+    if event is not None:
+        agg = _cache["agg"] if _cache["data"] is data else None
+        if agg is not None:
+            _tally(agg, event, -1)
+        event.update(kwargs)
+        if agg is not None:
+            _tally(agg, event)
+        _append_records(data, [{"_update": event_id, **kwargs}])
+        print(f"Updated event #{event_id}")
+        return
     print(f"Event #{event_id} not found")
 
 def calculate_stats():
@@ -65,36 +258,53 @@ def calculate_stats():
         return
     
     total = len(events)
-    with_prices = [e for e in events if e.get("market_price_at_news") and e.get("market_price_1h_later")]
-    resolved = [e for e in events if e.get("final_resolution")]
+    agg = _aggregates(data)
     
     print(f"\n=== Edge Tracking Stats ===")
     print(f"Total events: {total}")
-    print(f"With price data: {len(with_prices)}")
-    print(f"Resolved: {len(resolved)}")
-    
-    if with_prices:
-        # Calculate average price movement
-        movements = []
-        for e in with_prices:
-            p0 = float(e["market_price_at_news"])
-            p1 = float(e["market_price_1h_later"])
-            if p0 > 0:
-                movements.append((p1 - p0) / p0 * 100)
-        
-        if movements:
-            avg_move = sum(movements) / len(movements)
-            print(f"Avg 1h price move: {avg_move:+.1f}%")
-    
-    if resolved:
-        # Calculate win rate
-        wins = len([e for e in resolved if e.get("trade_result") == "win"])
-        print(f"Win rate: {wins}/{len(resolved)} ({wins/len(resolved)*100:.0f}%)")
+    print(f"With price data: {agg['with_prices']}")
+    print(f"Resolved: {agg['resolved']}")
+    
+    if agg["n_moves"]:
+        avg_move = agg["sum_move"] / agg["n_moves"]
+        print(f"Avg 1h price move: {avg_move:+.1f}%")
+    
+    if agg["resolved"]:
+        wins, resolved = agg["wins"], agg["resolved"]
+        print(f"Win rate: {wins}/{resolved} ({wins/resolved*100:.0f}%)")
+
+def _tail_events(n: int, block: int = 1 << 16) -> list:
+    """
+    Last n events, reading the log backwards only as far as needed.
+    
+    Update lines always come after the event they change, so every update
+    for the last n events lies after the n-th event line from the end.
+    """
+    with _BACKEND.open_log() as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while True:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            # Unless at the start of the file, the first line may be partial
+            lines = buf if pos == 0 else buf.partition(b"\n")[2]
+            records = parse_jsonl(lines)
+            starts = [i for i, rec in enumerate(records) if "_update" not in rec]
+            if pos == 0 or len(starts) >= n:
+                break
+    first = starts[-n] if len(starts) >= n else 0
+    return fold_event_log(records[first:])[-n:]
 
 def show_events(n: int = 10):
     """Show recent events."""
-    data = load_events()
-    events = data["events"][-n:]
+    if n <= 0:
+        events = []
+    elif _cache["key"] != (key := _BACKEND.key()) and key is not None:
+        events = _tail_events(n)  # cold start: don't parse the whole log
+    else:
+        events = load_events()["events"][-n:]
     
     print(f"\n=== Recent {len(events)} Events ===\n")
     for e in events:
@@ -9,6 +9,7 @@ Read-only market data may be available without auth.
 """
 
 import os
+import re
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -26,6 +27,12 @@ class KalshiMarketClient:
     # Kalshi API endpoint
     BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
     
+    # Substrings (case-insensitive) that mark a market as AI-related
+    AI_KEYWORDS = ["AI", "GPT", "LLM", "artificial intelligence", "machine learning",
+                   "OpenAI", "Anthropic", "Google AI", "ChatGPT", "Claude"]
+    # One scan per string instead of one substring search per keyword
+    _AI_RE = re.compile("|".join(re.escape(kw) for kw in AI_KEYWORDS), re.IGNORECASE)
+    
     def __init__(self, api_key_id: Optional[str] = None, private_key_path: Optional[str] = None):
         """
         Initialize Kalshi client.
@@ -139,9 +146,6 @@ class KalshiMarketClient:
         Returns:
             List of AI market dicts
         """
-        ai_keywords = ["AI", "GPT", "LLM", "artificial intelligence", "machine learning", 
-                       "OpenAI", "Anthropic", "Google AI", "ChatGPT", "Claude"]
-        
         all_markets = []
         cursor = None
         
@@ -159,8 +163,8 @@ class KalshiMarketClient:
                 # Handle both dict and Pydantic model responses
                 if hasattr(market, 'title'):
                     # Pydantic model
-                    title = (market.title or "").lower()
-                    subtitle = (market.subtitle or "").lower() if hasattr(market, 'subtitle') else ""
+                    title = market.title or ""
+                    subtitle = (market.subtitle or "") if hasattr(market, 'subtitle') else ""
                     ticker = market.ticker if hasattr(market, 'ticker') else None
                     yes_bid = market.yes_bid if hasattr(market, 'yes_bid') else None
                     no_bid = market.no_bid if hasattr(market, 'no_bid') else None
@@ -168,19 +172,20 @@ class KalshiMarketClient:
                     close_time = market.close_time if hasattr(market, 'close_time') else None
                 else:
                     # Dict
-                    title = market.get("title", "").lower()
-                    subtitle = market.get("subtitle", "").lower()
+                    title = market.get("title", "")
+                    subtitle = market.get("subtitle", "")
                     ticker = market.get("ticker")
                     yes_bid = market.get("yes_bid")
                     no_bid = market.get("no_bid")
                     volume = market.get("volume", 0)
                     close_time = market.get("close_time")
                 
-                if any(kw.lower() in title or kw.lower() in subtitle for kw in ai_keywords):
+                # Case-insensitive match, so only the kept markets get lowercased
+                if self._AI_RE.search(title) or self._AI_RE.search(subtitle):
                     all_markets.append({
                         "ticker": ticker,
-                        "title": title,
-                        "subtitle": subtitle,
+                        "title": title.lower(),
+                        "subtitle": subtitle.lower(),
                         "yes_price": yes_bid,
                         "no_price": no_bid,
                         "volume": volume,
@@ -6,28 +6,41 @@ This module analyzes trade opportunities against historical failure patterns
 to warn about common mistakes before capital is deployed.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from correlation_tracker import CorrelationTracker
+from utils.json_io import read_json
 
 DATA_DIR = Path(__file__).parent / "data"
 TRADE_ANALYSIS_FILE = DATA_DIR / "trade_analysis.json"
 
+VAGUE_TERMS = (
+    "coming soon", "in the coming weeks", "shortly", "imminent",
+    "around the corner", "in the near future", "expected soon",
+    "any day now", "later this month",
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CheckResult:
-    """Result of a single check."""
+    """Result of a single check (immutable, hashable value object)."""
     passed: bool
     check_name: str
     message: str
     severity: str  # 'warning', 'critical', 'info'
 
 
-@dataclass
+@dataclass(slots=True)
 class ChecklistResult:
     """Combined result of all checks."""
     all_passed: bool
@@ -65,7 +78,7 @@ class ChecklistResult:
 def load_trade_analysis() -> dict:
     """Load historical trade analysis if available."""
     if TRADE_ANALYSIS_FILE.exists():
-        return json.loads(TRADE_ANALYSIS_FILE.read_text())
+        return read_json(TRADE_ANALYSIS_FILE)
     return {}
 
 
@@ -95,6 +108,34 @@ def check_asymmetric_risk(entry_price: float, threshold: float = 85.0) -> CheckR
     )
 
 
+def check_asymmetric_risk_batch(entry_prices: Sequence[float], threshold: float = 85.0):
+    """
+    Vectorized check_asymmetric_risk for screening many markets at once.
+    
+    Returns:
+        (failed, severity, max_upside, max_downside, ratio) arrays, one
+        element per price. Callers only need to build CheckResults for the
+        rows where failed is True. Plain lists if NumPy isn't installed.
+    """
+    if not NUMPY_AVAILABLE:
+        results = [check_asymmetric_risk(p, threshold) for p in entry_prices]
+        upside = [100 - p for p in entry_prices]
+        return (
+            [not r.passed for r in results],
+            [r.severity for r in results],
+            upside,
+            list(entry_prices),
+            [p / u if u > 0 else float('inf') for p, u in zip(entry_prices, upside)],
+        )
+    
+    prices = np.asarray(entry_prices, dtype=np.float64)
+    failed = prices > threshold
+    severity = np.where(failed, np.where(prices < 92, "warning", "critical"), "info")
+    upside = 100 - prices
+    ratio = np.divide(prices, upside, out=np.full_like(prices, np.inf), where=upside > 0)
+    return failed, severity, upside, prices, ratio
+
+
 def check_vague_timeline(
     news_text: str, 
     deadline: Optional[datetime] = None,
@@ -105,29 +146,27 @@ def check_vague_timeline(
     
     Learned from: Trade #1 - "Coming soon" rarely means "next week".
     """
-    vague_terms = [
-        "coming soon", "in the coming weeks", "shortly", "imminent",
-        "around the corner", "in the near future", "expected soon",
-        "any day now", "later this month"
-    ]
-    
     news_lower = news_text.lower()
-    found_vague = [term for term in vague_terms if term in news_lower]
     
-    if found_vague and days_until_deadline is not None and days_until_deadline <= 14:
-        return CheckResult(
-            passed=False,
-            check_name="Vague Timeline",
-            message=f"Found vague language ({', '.join(found_vague)}) with only {days_until_deadline} days until deadline",
-            severity="critical"
-        )
-    elif found_vague:
-        return CheckResult(
-            passed=False,
-            check_name="Vague Timeline",
-            message=f"Found vague language: {', '.join(found_vague)}. Companies often miss vague deadlines.",
-            severity="warning"
-        )
+    if days_until_deadline is not None and days_until_deadline <= 14:
+        # Critical severity only needs one hit
+        for term in VAGUE_TERMS:
+            if term in news_lower:
+                return CheckResult(
+                    passed=False,
+                    check_name="Vague Timeline",
+                    message=f"Found vague language ({term}) with only {days_until_deadline} days until deadline",
+                    severity="critical"
+                )
+    else:
+        found_vague = [term for term in VAGUE_TERMS if term in news_lower]
+        if found_vague:
+            return CheckResult(
+                passed=False,
+                check_name="Vague Timeline",
+                message=f"Found vague language: {', '.join(found_vague)}. Companies often miss vague deadlines.",
+                severity="warning"
+            )
     
     return CheckResult(
         passed=True,
@@ -353,10 +392,18 @@ def run_checklist(
     has_stop_loss: bool = False,
     has_take_profit: bool = False,
     has_trailing_stop: bool = False,
+    parallel: bool = False,
+    stop_on_critical: bool = False,
 ) -> ChecklistResult:
     """
     Run all pre-trade checks and return combined result.
     
+    Args:
+        parallel: Run the checks on a thread pool so the disk-bound ones
+            (trade analysis, correlation DB) overlap with the rest
+        stop_on_critical: Stop at the first critical failure instead of
+            collecting every result
+    
     Example:
         result = run_checklist(
             entry_price=95.0,
@@ -371,16 +418,34 @@ def run_checklist(
         )
         print(result.get_summary())
     """
-    checks = [
-        check_asymmetric_risk(entry_price),
-        check_vague_timeline(news_text, days_until_deadline=days_until_deadline),
-        check_confirmation_bias(position_direction, entry_price, thesis),
-        check_position_size(trade_amount, portfolio_value),
-        check_exit_strategy(has_stop_loss, has_take_profit, has_trailing_stop),
-        check_thesis_clarity(thesis),
-        check_recent_losses(),
-        check_correlation(market_name, market_slug, trade_amount),
-    ]
+    checks_spec = (
+        (check_asymmetric_risk, (entry_price,), {}),
+        (check_vague_timeline, (news_text,), {"days_until_deadline": days_until_deadline}),
+        (check_confirmation_bias, (position_direction, entry_price, thesis), {}),
+        (check_position_size, (trade_amount, portfolio_value), {}),
+        (check_exit_strategy, (has_stop_loss, has_take_profit, has_trailing_stop), {}),
+        (check_thesis_clarity, (thesis,), {}),
+        (check_recent_losses, (), {}),
+        (check_correlation, (market_name, market_slug, trade_amount), {}),
+    )
+    
+    def _run(spec):
+        check_fn, args, kwargs = spec
+        return check_fn(*args, **kwargs)
+    
+    checks = []
+    if parallel:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for check in executor.map(_run, checks_spec):
+                checks.append(check)
+                if stop_on_critical and not check.passed and check.severity == 'critical':
+                    break
+    else:
+        for spec in checks_spec:
+            check = _run(spec)
+            checks.append(check)
+            if stop_on_critical and not check.passed and check.severity == 'critical':
+                break
     
     critical = [c for c in checks if not c.passed and c.severity == 'critical']
     warnings = [c for c in checks if not c.passed and c.severity == 'warning']
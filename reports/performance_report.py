@@ -4,16 +4,24 @@ Performance Report Generator
 Generates markdown reports from trading data for marketing and transparency.
 """
 
+import functools
+import hashlib
 import json
 import os
+import re
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
-from collections import defaultdict
+
+from utils.json_io import read_json, write_json
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 TRADES_FILE = os.path.join(DATA_DIR, 'paper_trades.json')
 REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'generated')
+STATS_CACHE_FILE = os.path.join(os.path.dirname(__file__), '.stats_cache.json')
+
+# Case-insensitive match without allocating a lowercased copy of the question
+TEST_QUESTION_RE = re.compile(r'test', re.IGNORECASE | re.ASCII)
 
 
 @dataclass
@@ -46,15 +54,14 @@ def load_trades() -> List[Dict[str, Any]]:
     """Load trades from paper_trades.json"""
     if not os.path.exists(TRADES_FILE):
         return []
-    with open(TRADES_FILE, 'r') as f:
-        return json.load(f)
+    return read_json(TRADES_FILE)
 
 
 def is_test_trade(trade: Dict[str, Any]) -> bool:
     """Check if a trade is a test trade"""
-    slug = trade.get('market_slug', '')
-    question = trade.get('question', '')
-    return slug.startswith('test') or 'test' in question.lower()
+    if trade.get('market_slug', '').startswith('test'):
+        return True
+    return TEST_QUESTION_RE.search(trade.get('question', '')) is not None
 
 
 def calculate_hold_days(trade: Dict[str, Any]) -> float:
@@ -88,88 +95,228 @@ def get_trade_month(trade: Dict[str, Any]) -> str:
         return 'Unknown'
 
 
-def calculate_stats(trades: List[Dict[str, Any]], include_test: bool = False) -> TradeStats:
-    """Calculate aggregate statistics from trades"""
-    if not include_test:
-        trades = [t for t in trades if not is_test_trade(t)]
-    
-    by_status = defaultdict(int)
-    by_month = defaultdict(lambda: {'trades': 0, 'pnl': 0.0, 'invested': 0.0})
-    
-    total_invested = 0.0
-    total_pnl = 0.0
-    wins = 0
-    losses = 0
-    hold_days = []
-    pnls = []
-    
-    open_count = 0
-    closed_count = 0
-    resolved_count = 0
-    
-    for trade in trades:
-        status = trade.get('status', 'UNKNOWN')
-        by_status[status] += 1
-        
-        month = get_trade_month(trade)
-        by_month[month]['trades'] += 1
-        
-        amount = trade.get('amount', 0) or 0
-        pnl = trade.get('pnl') or 0
-        
-        total_invested += amount
-        by_month[month]['invested'] += amount
-        
-        if status == 'OPEN':
-            open_count += 1
-        elif status == 'CLOSED':
-            closed_count += 1
-            total_pnl += pnl
-            pnls.append(pnl)
-            by_month[month]['pnl'] += pnl
-            if pnl >= 0:
-                wins += 1
-            else:
-                losses += 1
-            hold_days.append(calculate_hold_days(trade))
-        elif status == 'RESOLVED':
-            resolved_count += 1
-            total_pnl += pnl
-            pnls.append(pnl)
-            by_month[month]['pnl'] += pnl
-            if trade.get('won', False):
-                wins += 1
-            else:
-                losses += 1
-            hold_days.append(calculate_hold_days(trade))
-    
-    completed = wins + losses
-    win_rate = (wins / completed * 100) if completed > 0 else 0.0
-    avg_hold = sum(hold_days) / len(hold_days) if hold_days else 0.0
-    avg_pnl = total_pnl / completed if completed > 0 else 0.0
-    pnl_pct = (total_pnl / total_invested * 100) if total_invested > 0 else 0.0
-    
+def _new_accumulator() -> Dict[str, Any]:
+    """Empty running totals for calculate_stats (JSON-serializable)"""
+    return {
+        'total_trades': 0,
+        'real_trades': 0,
+        'open_trades': 0,
+        'closed_trades': 0,
+        'resolved_trades': 0,
+        'total_invested': 0.0,
+        'total_pnl': 0.0,
+        'wins': 0,
+        'losses': 0,
+        'hold_days_sum': 0.0,
+        'hold_days_count': 0,
+        'hold_open_since': [],  # entry timestamps of completed trades with no exit time
+        'best_trade_pnl': None,
+        'worst_trade_pnl': None,
+        'by_status': {},
+        'by_month': {},
+    }
+
+
+def _fold_trade(acc: Dict[str, Any], trade: Dict[str, Any], sign: int = 1) -> None:
+    """
+    Add a trade to the running totals, or remove it with sign=-1.
+
+    Removal is only supported for OPEN trades, which never touch the
+    P&L extremes.
+    """
+    status = trade.get('status', 'UNKNOWN')
+    month = get_trade_month(trade)
+    amount = trade.get('amount', 0) or 0
+    pnl = trade.get('pnl') or 0
+
+    acc['total_trades'] += sign
+    if not is_test_trade(trade):
+        acc['real_trades'] += sign
+    acc['by_status'][status] = acc['by_status'].get(status, 0) + sign
+
+    month_data = acc['by_month'].setdefault(month, {'trades': 0, 'pnl': 0.0, 'invested': 0.0})
+    month_data['trades'] += sign
+    month_data['invested'] += sign * amount
+    acc['total_invested'] += sign * amount
+
+    if status == 'OPEN':
+        acc['open_trades'] += sign
+        return
+    if status not in ('CLOSED', 'RESOLVED'):
+        return
+
+    if status == 'CLOSED':
+        acc['closed_trades'] += 1
+        won = pnl >= 0
+    else:
+        acc['resolved_trades'] += 1
+        won = trade.get('won', False)
+
+    acc['total_pnl'] += pnl
+    month_data['pnl'] += pnl
+    if won:
+        acc['wins'] += 1
+    else:
+        acc['losses'] += 1
+    if trade.get('timestamp') and not (trade.get('closed_at') or trade.get('resolved_at')):
+        # Held "until now": measured when stats are derived, not frozen in the cache
+        acc['hold_open_since'].append(trade['timestamp'])
+    else:
+        acc['hold_days_sum'] += calculate_hold_days(trade)
+    acc['hold_days_count'] += 1
+    if acc['best_trade_pnl'] is None or pnl > acc['best_trade_pnl']:
+        acc['best_trade_pnl'] = pnl
+    if acc['worst_trade_pnl'] is None or pnl < acc['worst_trade_pnl']:
+        acc['worst_trade_pnl'] = pnl
+
+
+def _stats_from_accumulator(acc: Dict[str, Any]) -> TradeStats:
+    """Derive TradeStats from running totals"""
+    completed = acc['wins'] + acc['losses']
+    total_pnl = acc['total_pnl']
+    total_invested = acc['total_invested']
+    hold_count = acc['hold_days_count']
+    hold_sum = acc['hold_days_sum'] + sum(
+        calculate_hold_days({'timestamp': ts}) for ts in acc['hold_open_since']
+    )
+
     return TradeStats(
-        total_trades=len(trades),
-        real_trades=len([t for t in trades if not is_test_trade(t)]),
-        open_trades=open_count,
-        closed_trades=closed_count,
-        resolved_trades=resolved_count,
+        total_trades=acc['total_trades'],
+        real_trades=acc['real_trades'],
+        open_trades=acc['open_trades'],
+        closed_trades=acc['closed_trades'],
+        resolved_trades=acc['resolved_trades'],
         total_invested=total_invested,
         total_pnl=total_pnl,
-        total_pnl_pct=pnl_pct,
-        wins=wins,
-        losses=losses,
-        win_rate=win_rate,
-        avg_hold_days=avg_hold,
-        avg_pnl_per_trade=avg_pnl,
-        best_trade_pnl=max(pnls) if pnls else 0.0,
-        worst_trade_pnl=min(pnls) if pnls else 0.0,
-        by_status=dict(by_status),
-        by_month=dict(by_month)
+        total_pnl_pct=(total_pnl / total_invested * 100) if total_invested > 0 else 0.0,
+        wins=acc['wins'],
+        losses=acc['losses'],
+        win_rate=(acc['wins'] / completed * 100) if completed > 0 else 0.0,
+        avg_hold_days=hold_sum / hold_count if hold_count else 0.0,
+        avg_pnl_per_trade=total_pnl / completed if completed > 0 else 0.0,
+        best_trade_pnl=acc['best_trade_pnl'] if acc['best_trade_pnl'] is not None else 0.0,
+        worst_trade_pnl=acc['worst_trade_pnl'] if acc['worst_trade_pnl'] is not None else 0.0,
+        by_status={k: v for k, v in acc['by_status'].items() if v},
+        by_month={k: v for k, v in acc['by_month'].items() if v['trades']},
     )
 
 
+def calculate_stats(trades: List[Dict[str, Any]], include_test: bool = False) -> TradeStats:
+    """Calculate aggregate statistics from trades"""
+    acc = _new_accumulator()
+    for trade in trades:
+        if include_test or not is_test_trade(trade):
+            _fold_trade(acc, trade)
+    return _stats_from_accumulator(acc)
+
+
+# Bump when the cache layout or accumulator fields change; older caches are rebuilt
+STATS_CACHE_VERSION = 3
+
+
+def _load_stats_cache(cache_file: str) -> Optional[Dict[str, Any]]:
+    """Load the stats cache, or None if missing, corrupt or not the current layout"""
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        cache = read_json(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get('version') != STATS_CACHE_VERSION:
+        return None
+    folded, pending, stats = cache.get('folded'), cache.get('pending'), cache.get('stats')
+    if not (
+        isinstance(folded, int)
+        and isinstance(pending, list)
+        and all(
+            isinstance(entry, list) and len(entry) == 3
+            and isinstance(entry[0], int) and 0 <= entry[0] < folded
+            and isinstance(entry[1], str) and isinstance(entry[2], str)
+            for entry in pending
+        )
+        and isinstance(stats, dict)
+        and stats.keys() == _new_accumulator().keys()
+    ):
+        return None
+    return cache
+
+
+def _trade_digest(trade: Dict[str, Any]) -> str:
+    """Fingerprint of a trade, to notice when it is rewritten in place"""
+    return hashlib.sha1(json.dumps(trade, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def calculate_stats_cached(
+    trades: List[Dict[str, Any]],
+    include_test: bool = False,
+    cache_file: Optional[str] = None,
+) -> TradeStats:
+    """
+    Same as calculate_stats, but only folds in trades added since the last call.
+
+    paper_trades.json is append-mostly, so the running totals are cached along
+    with how many trades were folded in and the last one's id/timestamp. Trades
+    not yet RESOLVED are fingerprinted and re-checked: an OPEN position closed in
+    place is folded in directly, while any other change (e.g. CLOSED -> RESOLVED
+    with a new pnl) or a prefix that no longer matches triggers a full recompute.
+    """
+    cache_file = cache_file or STATS_CACHE_FILE
+    cache = _load_stats_cache(cache_file)
+
+    folded = cache['folded'] if cache else 0
+    valid = (
+        cache is not None
+        and cache.get('include_test') == include_test
+        and 0 < folded <= len(trades)
+        and trades[folded - 1].get('id') == cache.get('last_id')
+        and trades[folded - 1].get('timestamp') == cache.get('last_timestamp')
+    )
+
+    pending = []
+    if valid:
+        acc = cache['stats']
+        for idx, status, digest in cache['pending']:
+            trade = trades[idx]
+            if _trade_digest(trade) == digest:
+                pending.append([idx, status, digest])
+                continue
+            if status != 'OPEN':
+                # Settled P&L can't be unfolded (best/worst trade), so start over
+                valid = False
+                break
+            _fold_trade(acc, {**trade, 'status': 'OPEN'}, sign=-1)
+            _fold_trade(acc, trade)
+            if trade.get('status') != 'RESOLVED':
+                pending.append([idx, trade.get('status', 'UNKNOWN'), _trade_digest(trade)])
+
+    if not valid:
+        acc = _new_accumulator()
+        folded = 0
+        pending = []
+
+    for idx in range(folded, len(trades)):
+        trade = trades[idx]
+        if include_test or not is_test_trade(trade):
+            _fold_trade(acc, trade)
+            if trade.get('status') != 'RESOLVED':
+                pending.append([idx, trade.get('status', 'UNKNOWN'), _trade_digest(trade)])
+
+    if trades:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        write_json(cache_file, {
+            'version': STATS_CACHE_VERSION,
+            'include_test': include_test,
+            'folded': len(trades),
+            'last_id': trades[-1].get('id'),
+            'last_timestamp': trades[-1].get('timestamp'),
+            'pending': pending,
+            'stats': acc,
+        })
+
+    return _stats_from_accumulator(acc)
+
+
+@functools.lru_cache(maxsize=4096)
 def format_currency(amount: float) -> str:
     """Format as USD currency"""
     if amount >= 0:
@@ -177,6 +324,7 @@ def format_currency(amount: float) -> str:
     return f"-${abs(amount):,.2f}"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_percent(pct: float) -> str:
     """Format as percentage"""
     sign = "+" if pct >= 0 else ""
@@ -324,7 +472,7 @@ def main():
     args = parser.parse_args()
     
     trades = load_trades()
-    stats = calculate_stats(trades, include_test=args.include_test)
+    stats = calculate_stats_cached(trades, include_test=args.include_test)
     
     if args.type == 'summary' or args.type == 'all':
         report = generate_summary_report(stats)
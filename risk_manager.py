@@ -1,7 +1,15 @@
+import re
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Mapping, Sequence
 from datetime import datetime, date
 from collections import defaultdict
+from types import MappingProxyType
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 # Common narratives/themes for correlation tracking
@@ -14,9 +22,33 @@ NARRATIVE_KEYWORDS = {
 }
 
 
-@dataclass
+def _build_narrative_matcher(narrative_keywords: Dict[str, List[str]]):
+    """
+    Compile all narrative keywords into one regex so a title is scanned once.
+
+    Each lookahead match is the longest keyword starting at that position;
+    shorter keywords that are prefixes of it inherit its tags, so the result
+    is identical to testing every keyword as a substring.
+    """
+    tags: Dict[str, set] = defaultdict(set)
+    for narrative, keywords in narrative_keywords.items():
+        for kw in keywords:
+            tags[kw].add(narrative)
+    for kw in tags:
+        for other in tags:
+            if kw != other and kw.startswith(other):
+                tags[kw] |= tags[other]
+
+    alternation = "|".join(re.escape(kw) for kw in sorted(tags, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), {kw: frozenset(t) for kw, t in tags.items()}
+
+
+NARRATIVE_PATTERN, NARRATIVE_TAGS = _build_narrative_matcher(NARRATIVE_KEYWORDS)
+
+
+@dataclass(slots=True, frozen=True)
 class RiskConfig:
-    """Risk management configuration"""
+    """Risk management configuration (immutable, safe to share between managers)"""
     max_position_size: float = 100.0
     max_daily_loss: float = 50.0
     max_open_positions: int = 5
@@ -30,34 +62,67 @@ class RiskConfig:
     max_daily_loss_pct: float = 5.0  # Stop trading if down X% of bankroll
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
-    """Represents an open position for exposure tracking"""
+    """
+    Represents an open position for exposure tracking.
+    
+    RiskManager keeps running narrative totals from amount and narratives as
+    they were at add_position; to change either, add_position the updated
+    position again rather than editing a tracked one in place.
+    """
     market_slug: str
     market_title: str
     amount: float
     entry_price: float
     side: str  # "yes" or "no"
     narratives: List[str] = field(default_factory=list)
+    market_title_lower: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.market_title_lower = self.market_title.lower()
 
 
 class RiskManager:
     def __init__(self, config: Optional[RiskConfig] = None):
         self.config = config or RiskConfig()
         self._positions: Dict[str, Position] = {}  # market_slug -> Position
-        self._daily_pnl: Dict[str, float] = {}  # date string -> P&L
+        self._positions_view = MappingProxyType(self._positions)
+        self._narrative_exposure: Dict[str, float] = defaultdict(float)  # narrative -> $
     
     def add_position(self, position: Position) -> None:
-        """Track a new position for exposure calculations."""
+        """
+        Track a new position for exposure calculations.
+        
+        Replaces any tracked position in the same market, which is also how
+        a position's amount or narratives should be changed.
+        """
+        if not position.narratives:
+            position.narratives = self._detect_narratives(
+                position.market_title, position.market_title_lower
+            )
+        
+        self.remove_position(position.market_slug)
         self._positions[position.market_slug] = position
+        for narrative in position.narratives:
+            self._narrative_exposure[narrative] += position.amount
     
     def remove_position(self, market_slug: str) -> None:
         """Remove a closed position from tracking."""
-        self._positions.pop(market_slug, None)
+        position = self._positions.pop(market_slug, None)
+        if position is None:
+            return
+        
+        for narrative in position.narratives:
+            remaining = self._narrative_exposure[narrative] - position.amount
+            if abs(remaining) < 1e-9:
+                del self._narrative_exposure[narrative]
+            else:
+                self._narrative_exposure[narrative] = remaining
     
-    def get_positions(self) -> Dict[str, Position]:
-        """Get all tracked positions."""
-        return self._positions.copy()
+    def get_positions(self) -> Mapping[str, Position]:
+        """Get a live, read-only view of all tracked positions."""
+        return self._positions_view
 
     def check_trade_limits(self, amount: float, open_positions_count: int, 
                           daily_pnl: float) -> tuple[bool, str]:
@@ -65,16 +130,19 @@ class RiskManager:
         Check if a trade passes hard risk limits (size, count, drawdown).
         Used primarily by RealTrader.
         """
+        cfg = self.config
+        max_position_size = cfg.max_position_size
+        
         # 1. Position Size
-        if amount > self.config.max_position_size:
-            return False, f"Amount ${amount} exceeds max position size ${self.config.max_position_size}"
+        if amount > max_position_size:
+            return False, f"Amount ${amount} exceeds max position size ${max_position_size}"
             
         # 2. Max Open Positions
-        if open_positions_count >= self.config.max_open_positions:
+        if open_positions_count >= cfg.max_open_positions:
             return False, f"Already at max positions ({open_positions_count})"
             
         # 3. Daily Loss Limit
-        if daily_pnl <= -self.config.max_daily_loss:
+        if daily_pnl <= -cfg.max_daily_loss:
             return False, f"Daily loss limit reached (${daily_pnl:.2f})"
             
         return True, "OK"
@@ -90,16 +158,16 @@ class RiskManager:
         Returns:
             (allowed, message) tuple
         """
-        current_exposure = 0.0
-        if market_slug in self._positions:
-            current_exposure = self._positions[market_slug].amount
+        max_market_exposure = self.config.max_market_exposure
+        position = self._positions.get(market_slug)
+        current_exposure = position.amount if position is not None else 0.0
         
         new_exposure = current_exposure + additional_amount
         
-        if new_exposure > self.config.max_market_exposure:
+        if new_exposure > max_market_exposure:
             return False, (
                 f"Market exposure ${new_exposure:.2f} would exceed limit "
-                f"${self.config.max_market_exposure:.2f} for {market_slug}"
+                f"${max_market_exposure:.2f} for {market_slug}"
             )
         
         return True, "OK"
@@ -121,18 +189,18 @@ class RiskManager:
         if not detected_narratives:
             return True, "OK"  # No narrative detected, allow
         
-        # Calculate current exposure per narrative
-        narrative_exposure = self._calculate_narrative_exposure()
+        max_narrative_exposure = self.config.max_narrative_exposure
+        narrative_exposure = self._narrative_exposure
         
-        # Check each detected narrative
+        # Check each detected narrative against the running exposure totals
         for narrative in detected_narratives:
             current = narrative_exposure.get(narrative, 0.0)
             new_exposure = current + additional_amount
             
-            if new_exposure > self.config.max_narrative_exposure:
+            if new_exposure > max_narrative_exposure:
                 return False, (
                     f"Narrative '{narrative}' exposure ${new_exposure:.2f} would exceed "
-                    f"limit ${self.config.max_narrative_exposure:.2f}"
+                    f"limit ${max_narrative_exposure:.2f}"
                 )
         
         return True, "OK"
@@ -158,27 +226,29 @@ class RiskManager:
             "position_count": len(self._positions),
         }
     
-    def _detect_narratives(self, text: str) -> List[str]:
-        """Detect which narratives a market title belongs to."""
-        text_lower = text.lower()
-        detected = []
+    def _detect_narratives(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """
+        Detect which narratives a market title belongs to.
+        
+        Pass text_lower when the caller already has the lowercased title.
+        """
+        hits = set()
         
-        for narrative, keywords in NARRATIVE_KEYWORDS.items():
-            if any(kw in text_lower for kw in keywords):
-                detected.append(narrative)
+        for match in NARRATIVE_PATTERN.finditer(text_lower or text.lower()):
+            hits |= NARRATIVE_TAGS[match.group(1)]
+            if len(hits) == len(NARRATIVE_KEYWORDS):
+                break
         
-        return detected
+        return [narrative for narrative in NARRATIVE_KEYWORDS if narrative in hits]
     
     def _calculate_narrative_exposure(self) -> Dict[str, float]:
-        """Calculate total exposure per narrative across all positions."""
-        exposure = defaultdict(float)
-        
-        for pos in self._positions.values():
-            narratives = pos.narratives or self._detect_narratives(pos.market_title)
-            for narrative in narratives:
-                exposure[narrative] += pos.amount
+        """
+        Total exposure per narrative across all positions.
         
-        return dict(exposure)
+        Maintained incrementally by add_position/remove_position, since
+        narratives are resolved once when a position is added.
+        """
+        return dict(self._narrative_exposure)
 
     def check_asymmetric_risk(self, entry_price: float) -> Optional[str]:
         """
@@ -224,7 +294,7 @@ Consider smaller position size or skip.
         # p = probability of winning
         # q = probability of losing (1-p)
         
-        if win_prob <= 0 or win_prob >= 1:
+        if win_prob <= 0 or win_prob >= 1 or odds <= 1:
             return 0.0
             
         b = odds - 1
@@ -241,6 +311,28 @@ Consider smaller position size or skip.
             
         return bankroll * f_safe
     
+    def calculate_kelly_sizes(self, win_probs: Sequence[float], odds: Sequence[float],
+                              bankroll: float):
+        """
+        Vectorized calculate_kelly_size for screening many candidates at once.
+        
+        Invalid inputs (win_prob outside (0, 1), odds <= 1) and negative-edge
+        bets size to 0 without branching, so the whole batch is a handful of
+        NumPy ufunc calls.
+        
+        Returns:
+            NumPy array of dollar amounts (a list if NumPy isn't installed)
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.calculate_kelly_size(p, o, bankroll) for p, o in zip(win_probs, odds)]
+        
+        p = np.asarray(win_probs, dtype=np.float64)
+        o = np.asarray(odds, dtype=np.float64)
+        valid = (p > 0) & (p < 1) & (o > 1)
+        b = np.where(valid, o - 1, 1.0)  # keep the division defined for invalid rows
+        f = np.where(valid, (b * p - (1 - p)) / b, 0.0) * self.config.kelly_fraction
+        return bankroll * np.clip(f, 0.0, None)
+    
     def check_daily_loss_percentage(self, daily_pnl: float, bankroll: float) -> tuple[bool, str]:
         """
         Check if daily loss exceeds percentage of bankroll.
@@ -255,11 +347,15 @@ Consider smaller position size or skip.
         if bankroll <= 0:
             return False, "Invalid bankroll"
         
-        loss_pct = abs(min(0, daily_pnl)) / bankroll * 100
+        if daily_pnl >= 0:
+            return True, "OK"
         
-        if loss_pct >= self.config.max_daily_loss_pct:
+        max_daily_loss_pct = self.config.max_daily_loss_pct
+        loss_pct = -daily_pnl / bankroll * 100.0
+        
+        if loss_pct >= max_daily_loss_pct:
             return False, (
-                f"Daily loss {loss_pct:.1f}% exceeds limit {self.config.max_daily_loss_pct:.1f}%. "
+                f"Daily loss {loss_pct:.1f}% exceeds limit {max_daily_loss_pct:.1f}%. "
                 "Stop trading for today."
             )
         
@@ -273,41 +369,39 @@ Consider smaller position size or skip.
         entry_price: float,
         open_positions_count: int,
         daily_pnl: float,
-        bankroll: float
+        bankroll: float,
+        collect_all: bool = False
     ) -> tuple[bool, List[str]]:
         """
         Run all risk checks for a proposed trade.
         
+        Args:
+            collect_all: Keep running after the first hard failure so every
+                error is reported (diagnostics). By default the check stops at
+                the first failure and skips the remaining, costlier checks.
+        
         Returns:
             (allowed, messages) - allowed is False if any hard limit hit,
-            messages contains all warnings and errors
+            messages contains the warnings and errors found
         """
         messages = []
         allowed = True
         
-        # 1. Basic trade limits
-        ok, msg = self.check_trade_limits(amount, open_positions_count, daily_pnl)
-        if not ok:
-            allowed = False
-            messages.append(f"❌ {msg}")
-        
-        # 2. Market exposure
-        ok, msg = self.check_market_exposure(market_slug, amount)
-        if not ok:
-            allowed = False
-            messages.append(f"❌ {msg}")
-        
-        # 3. Narrative exposure
-        ok, msg = self.check_narrative_exposure(market_title, amount)
-        if not ok:
-            allowed = False
-            messages.append(f"❌ {msg}")
-        
-        # 4. Daily loss percentage
-        ok, msg = self.check_daily_loss_percentage(daily_pnl, bankroll)
-        if not ok:
-            allowed = False
-            messages.append(f"❌ {msg}")
+        # 1. Basic trade limits, 2. market exposure, 3. narrative exposure,
+        # 4. daily loss percentage
+        hard_checks = (
+            (self.check_trade_limits, (amount, open_positions_count, daily_pnl)),
+            (self.check_market_exposure, (market_slug, amount)),
+            (self.check_narrative_exposure, (market_title, amount)),
+            (self.check_daily_loss_percentage, (daily_pnl, bankroll)),
+        )
+        for check, args in hard_checks:
+            ok, msg = check(*args)
+            if not ok:
+                allowed = False
+                messages.append(f"❌ {msg}")
+                if not collect_all:
+                    return False, messages
         
         # 5. Asymmetric risk (warning only, doesn't block)
         warning = self.check_asymmetric_risk(entry_price)
@@ -4,9 +4,16 @@ Trading Edge Scanner
 Combines news monitoring + Polymarket tracking to find opportunities
 """
 
+import io
 import sys
 import json
+import re
 import argparse
+import queue
+import threading
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -21,40 +28,218 @@ from correlation_tracker import CorrelationTracker, NewsEvent
 
 # Market mappings: keywords -> relevant Polymarket searches
 MARKET_MAPPINGS = {
-    "OpenAI": ["OpenAI", "ChatGPT", "GPT"],
-    "ads": ["OpenAI ads", "ChatGPT advertising"],
-    "IPO": ["OpenAI IPO", "Anthropic IPO"],
-    "Anthropic": ["Anthropic", "Claude"],
-    "regulation": ["AI regulation", "AI ban"],
-    "Google": ["Google AI", "Gemini"],
-    "Microsoft": ["Microsoft AI", "Copilot"],
+    "OpenAI": ("OpenAI", "ChatGPT", "GPT"),
+    "ads": ("OpenAI ads", "ChatGPT advertising"),
+    "IPO": ("OpenAI IPO", "Anthropic IPO"),
+    "Anthropic": ("Anthropic", "Claude"),
+    "regulation": ("AI regulation", "AI ban"),
+    "Google": ("Google AI", "Gemini"),
+    "Microsoft": ("Microsoft AI", "Copilot"),
 }
 
+# Entities/keywords detected in scraped headlines
+SCRAPE_ENTITIES = ("OpenAI", "Anthropic", "Google", "Microsoft", "Meta", "xAI")
+SCRAPE_KEYWORDS = ("ads", "launch", "funding", "acquisition", "billion", "partnership")
+
+
+def _build_scrape_matcher():
+    """
+    One lookahead regex over every lowercased entity/keyword, so a title is
+    scanned once. Each match is the longest term at that position; shorter
+    terms that prefix it inherit its tags to keep plain substring semantics.
+    """
+    tags = {e.lower(): {("entities", e)} for e in SCRAPE_ENTITIES}
+    for kw in SCRAPE_KEYWORDS:
+        tags.setdefault(kw, set()).add(("keywords", kw))
+    for term in tags:
+        for other in tags:
+            if term != other and term.startswith(other):
+                tags[term] |= tags[other]
+    alternation = "|".join(re.escape(t) for t in sorted(tags, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), {t: frozenset(v) for t, v in tags.items()}
+
+
+SCRAPE_TERMS_RE, SCRAPE_TERM_TAGS = _build_scrape_matcher()
+
+
+# Per-thread print buffer used while scan stages run concurrently
+_stage_output = threading.local()
+
+
+class _PerThreadStdout:
+    """sys.stdout stand-in: threads inside _buffered write to their own buffer"""
+    
+    def __init__(self, default):
+        self._default = default
+    
+    def _target(self):
+        return getattr(_stage_output, "buffer", None) or self._default
+    
+    def write(self, text):
+        return self._target().write(text)
+    
+    def flush(self):
+        self._target().flush()
+    
+    def __getattr__(self, name):
+        # encoding, isatty(), fileno() etc. come from the real stream
+        return getattr(self._default, name)
+
+
+def _buffered(fn):
+    """
+    Call fn with this thread's prints captured; returns (result, output).
+    
+    If fn raises, the prints so far ride along on the exception as stage_output.
+    """
+    _stage_output.buffer = io.StringIO()
+    try:
+        return fn(), _stage_output.buffer.getvalue()
+    except Exception as exc:
+        exc.stage_output = _stage_output.buffer.getvalue()
+        raise
+    finally:
+        del _stage_output.buffer
+
+
+def _replay(headers, futures) -> list:
+    """
+    Print each _buffered future's header and output in order and collect results.
+    
+    Every stage's output is printed even if one failed; the first failure is
+    re-raised afterwards.
+    """
+    results, error = [], None
+    for header, future in zip(headers, futures):
+        if header is not None:
+            print(header)
+        try:
+            result, output = future.result()
+        except Exception as exc:
+            result, output = None, getattr(exc, "stage_output", "")
+            error = error or exc
+        print(output, end="")
+        results.append(result)
+    if error is not None:
+        raise error
+    return results
+
+
+def _outcome_prices(market: dict, decoded: dict):
+    """A market's outcomePrices, decoded at most once per id into decoded"""
+    mid = market.get("id")
+    if mid is not None and mid in decoded:
+        return decoded[mid]
+    raw_prices = market.get("outcomePrices")
+    prices = json.loads(raw_prices) if isinstance(raw_prices, str) else raw_prices
+    if mid is not None:  # markets without an id can't share a memo slot
+        decoded[mid] = prices
+    return prices
+
 
 class TradingScanner:
-    def __init__(self, notify: bool = False, chat_id: str = None):
+    def __init__(self, notify: bool = False, chat_id: str = None, client_factory=None):
         self.news_monitor = NewsMonitor()
         self.web_scraper = WebScraper()
-        self.polymarket = PolymarketClient()
+        self._client_factory = client_factory or PolymarketClient
+        self.polymarket = self._client_factory()
+        # Idle clients for concurrent searches, kept across scans for connection reuse
+        self._search_clients = queue.SimpleQueue()
+        self._search_clients.put(self.polymarket)
         self.data_dir = Path(__file__).parent / "data"
         self.data_dir.mkdir(exist_ok=True)
         self.notify = notify
         self.notifier = TelegramNotifier(chat_id) if (notify and chat_id) else TelegramNotifier() if notify else None
-        self.seen_file = self.data_dir / "seen_scraped.json"
+        self.seen_file = self.data_dir / "seen_scraped.jsonl"
+        self.legacy_seen_file = self.data_dir / "seen_scraped.json"
         self._load_seen_scraped()
     
     def _load_seen_scraped(self):
-        """Load previously seen scraped articles"""
-        try:
-            with open(self.seen_file) as f:
-                self.seen_scraped = set(json.load(f))
-        except:
-            self.seen_scraped = set()
+        """Load previously seen scraped articles (one JSON string per line)"""
+        self._seen_new = set()
+        self.seen_scraped = set()
+        if self.seen_file.exists():
+            # Parse line by line so one torn append doesn't forget everything else
+            bad_lines = 0
+            try:
+                with self.seen_file.open() as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            self.seen_scraped.add(json.loads(line))
+                        except (json.JSONDecodeError, TypeError):
+                            bad_lines += 1
+            except OSError:
+                pass
+            if bad_lines:
+                print(f"⚠️ Skipped {bad_lines} unreadable line(s) in {self.seen_file.name}")
+        elif self.legacy_seen_file.exists():
+            # Migrate the old whole-file JSON list on first run
+            try:
+                with self.legacy_seen_file.open() as f:
+                    self.seen_scraped = set(json.load(f))
+                self._seen_new = set(self.seen_scraped)
+            except (OSError, json.JSONDecodeError):
+                self.seen_scraped = set()
     
     def _save_seen_scraped(self):
-        """Save seen scraped articles"""
-        with open(self.seen_file, "w") as f:
-            json.dump(list(self.seen_scraped), f)
+        """Append articles seen since the last save instead of rewriting the file"""
+        if not self._seen_new:
+            return
+        with open(self.seen_file, "a") as f:
+            f.writelines(json.dumps(url_hash) + "\n" for url_hash in self._seen_new)
+        self._seen_new.clear()
+    
+    def _prefetch_searches(self, articles: list, search_cache: dict, max_workers: int = 8) -> None:
+        """Run every uncached search term for the given articles concurrently"""
+        terms = list(dict.fromkeys(
+            search_term
+            for article in articles
+            for entity in article["entities"]
+            for search_term in MARKET_MAPPINGS.get(entity, ())
+            if search_term not in search_cache
+        ))
+        if not terms:
+            return
+        
+        # requests.Session isn't documented as thread-safe, so each search
+        # checks a client out of the pool, making another only when all are busy
+        def search(term):
+            try:
+                client = self._search_clients.get_nowait()
+            except queue.Empty:
+                client = self._client_factory()
+            try:
+                return client.search_markets(term, limit=5)
+            finally:
+                self._search_clients.put(client)
+        
+        with redirect_stdout(_PerThreadStdout(sys.stdout)), \
+                ThreadPoolExecutor(max_workers=min(max_workers, len(terms))) as executor:
+            futures = [executor.submit(_buffered, lambda term=term: search(term)) for term in terms]
+        # search errors are printed in term order
+        search_cache.update(zip(terms, _replay([None] * len(terms), futures)))
+    
+    def _find_related_markets(self, article: dict, search_cache: dict, limit: int = 5) -> list:
+        """
+        Search markets for an article's entities, deduped by id, stopping at limit.
+        
+        search_cache memoizes search_markets per term for the current scan, so
+        articles with overlapping entities don't repeat the same HTTP request.
+        """
+        unique_markets = {}  # market id -> market, in first-seen order
+        for entity in article["entities"]:
+            for search_term in MARKET_MAPPINGS.get(entity, ()):
+                if search_term not in search_cache:
+                    search_cache[search_term] = self.polymarket.search_markets(search_term, limit=5)
+                for m in search_cache[search_term]:
+                    mid = m.get("id")
+                    if mid not in unique_markets:
+                        unique_markets[mid] = m
+                        if len(unique_markets) >= limit:
+                            return list(unique_markets.values())
+        return list(unique_markets.values())
     
     def scan(self) -> dict:
         """Run full scan: news + markets"""
@@ -62,13 +247,20 @@ class TradingScanner:
         print(f"🔍 TRADING SCANNER - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
         
-        # 1. Check RSS feeds
-        print("\n📰 Checking RSS feeds...")
-        new_articles = self.news_monitor.check_all_feeds()
+        # 1. RSS feeds, web scrape (official blogs, etc) and AI market state are
+        # independent network fetches, so run them concurrently. Each stage's
+        # prints are buffered and replayed in a fixed order once all finish.
+        stages = [
+            ("\n📰 Checking RSS feeds...", self.news_monitor.check_all_feeds),
+            ("\n🕸️ Scraping news sites...", self.web_scraper.scrape_all),
+            ("\n📊 Fetching AI markets...", self.polymarket.get_tracked_ai_markets),
+        ]
+        with redirect_stdout(_PerThreadStdout(sys.stdout)), \
+                ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [executor.submit(_buffered, fetch) for _, fetch in stages]
+        new_articles, scraped_articles, markets = _replay([header for header, _ in stages], futures)
         
-        # 2. Web scrape for additional coverage (official blogs, etc)
-        print("\n🕸️ Scraping news sites...")
-        scraped_articles = self.web_scraper.scrape_all()
+        # 2. Filter scraped articles
         tradeable_scraped = self.web_scraper.filter_tradeable(scraped_articles)
         
         # Filter out already-seen scraped articles and convert to standard format
@@ -76,6 +268,7 @@ class TradingScanner:
             url_hash = article.url[:100]  # Use URL as unique key
             if url_hash not in self.seen_scraped:
                 self.seen_scraped.add(url_hash)
+                self._seen_new.add(url_hash)
                 score = self.web_scraper.score_article(article)
                 if score >= 20:  # Only high-score articles
                     # Convert to standard article format
@@ -90,15 +283,12 @@ class TradingScanner:
                         "is_tradeable": True,
                         "scraped": True,
                     }
-                    # Detect entities from title
-                    title_lower = article.title.lower()
-                    for entity in ["OpenAI", "Anthropic", "Google", "Microsoft", "Meta", "xAI"]:
-                        if entity.lower() in title_lower:
-                            converted["entities"].append(entity)
-                    # Detect keywords
-                    for kw in ["ads", "launch", "funding", "acquisition", "billion", "partnership"]:
-                        if kw in title_lower:
-                            converted["keywords"].append(kw)
+                    # Detect entities and keywords from title in a single pass
+                    found = set()
+                    for match in SCRAPE_TERMS_RE.finditer(article.title.lower()):
+                        found |= SCRAPE_TERM_TAGS[match.group(1)]
+                    converted["entities"] = [e for e in SCRAPE_ENTITIES if ("entities", e) in found]
+                    converted["keywords"] = [k for k in SCRAPE_KEYWORDS if ("keywords", k) in found]
                     
                     if converted["entities"]:  # Only if we found relevant entities
                         new_articles.append(converted)
@@ -106,46 +296,34 @@ class TradingScanner:
         
         self._save_seen_scraped()
         
-        # 2. Get current AI market state
-        print("\n📊 Fetching AI markets...")
-        markets = self.polymarket.get_tracked_ai_markets()
-        
-        # Sort by volume
-        markets.sort(key=lambda x: float(x.get("volume", 0)), reverse=True)
-        top_markets = markets[:15]
+        # Sort AI markets by volume (parse each volume once, sort on the float)
+        by_volume = [(float(m.get("volume", 0) or 0), m) for m in markets]
+        by_volume.sort(key=itemgetter(0), reverse=True)
+        top_markets = [m for _, m in by_volume[:15]]
         
         print(f"\n📈 Top {len(top_markets)} AI Markets by Volume:\n")
         for m in top_markets:
             print(self.polymarket.format_market(m))
         
         # 3. If we have tradeable news, find relevant markets
+        # (one timestamp shared by every opportunity and the saved state)
+        scan_ts = datetime.now(timezone.utc).isoformat()
         opportunities = []
         if new_articles:
             print("\n" + "🚨" * 20)
             print("⚡ POTENTIAL OPPORTUNITIES DETECTED ⚡")
             print("🚨" * 20 + "\n")
             
+            search_cache = {}
+            decoded_prices = {}  # market id -> outcomePrices, kept out of the API dicts
+            self._prefetch_searches(new_articles, search_cache)
             for article in new_articles:
-                # Find related markets
-                related_markets = []
-                for entity in article["entities"]:
-                    if entity in MARKET_MAPPINGS:
-                        for search_term in MARKET_MAPPINGS[entity]:
-                            results = self.polymarket.search_markets(search_term, limit=5)
-                            related_markets.extend(results)
-                
-                # Dedupe
-                seen_ids = set()
-                unique_markets = []
-                for m in related_markets:
-                    if m.get("id") not in seen_ids:
-                        seen_ids.add(m.get("id"))
-                        unique_markets.append(m)
+                unique_markets = self._find_related_markets(article, search_cache)
                 
                 opp = {
                     "news": article,
                     "markets": unique_markets[:5],
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": scan_ts,
                 }
                 opportunities.append(opp)
                 
@@ -155,10 +333,9 @@ class TradingScanner:
                 print(f"\n   Related Markets:")
                 for m in unique_markets[:5]:
                     print(f"   • {m.get('question', 'Unknown')[:60]}...")
-                    if "outcomePrices" in m:
-                        prices = json.loads(m["outcomePrices"]) if isinstance(m["outcomePrices"], str) else m["outcomePrices"]
-                        if prices:
-                            print(f"     Current: {float(prices[0])*100:.1f}%")
+                    prices = _outcome_prices(m, decoded_prices)
+                    if prices:
+                        print(f"     Current: {float(prices[0])*100:.1f}%")
                 print()
                 
                 # Send notification if enabled
@@ -170,7 +347,7 @@ class TradingScanner:
         
         # Save state
         state = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": scan_ts,
             "new_articles": len(new_articles),
             "markets_tracked": len(top_markets),
             "opportunities": len(opportunities),
@@ -2,11 +2,16 @@
 """
 Setup cron jobs for the trading system to run automated scans
 """
+import re
 import subprocess
 import sys
 import os
 from pathlib import Path
 
+# Appended to every job we install so re-runs can replace them
+CRON_MARKER = "# Trading System"
+CRON_MARKER_RE = re.compile(rb"(?m)^.*" + re.escape(CRON_MARKER.encode()) + rb".*(?:\n|\Z)")
+
 def setup_cron_jobs():
     """Setup cron jobs for the trading system"""
     
@@ -29,37 +34,25 @@ def setup_cron_jobs():
         f"0 * * * * cd {trading_dir} && {venv_python} auto_monitor.py >> logs/auto_monitor.log 2>&1"
     ]
     
-    # Read current crontab
+    # Read current crontab as bytes and strip our previous entries in one regex pass
     try:
-        current_crontab = subprocess.run(['crontab', '-l'], capture_output=True, text=True, check=False)
-        if current_crontab.returncode == 0:
-            current_lines = current_crontab.stdout.strip().split('\n')
-        else:
-            current_lines = []
+        current_crontab = subprocess.run(['crontab', '-l'], capture_output=True, check=False)
+        current = current_crontab.stdout if current_crontab.returncode == 0 else b""
     except Exception:
-        current_lines = []
+        current = b""
     
-    # Filter out any existing trading system cron jobs
-    filtered_lines = []
-    for line in current_lines:
-        if line.strip() and '# Trading System' not in line:
-            filtered_lines.append(line)
+    new_crontab = CRON_MARKER_RE.sub(b"", current)
+    if new_crontab and not new_crontab.endswith(b"\n"):
+        new_crontab += b"\n"
     
     # Add our new cron jobs
-    filtered_lines.extend(cron_jobs)
-    
-    # Write the new crontab
-    new_crontab = '\n'.join(filtered_lines) + '\n'
+    new_crontab += "".join(f"{job} {CRON_MARKER}\n" for job in cron_jobs).encode()
     
     try:
-        # Write to a temporary file and install
-        with open('/tmp/trading_crontab', 'w') as f:
-            f.write(new_crontab)
-        
-        # Install the crontab
-        result = subprocess.run(['crontab', '/tmp/trading_crontab'], capture_output=True, text=True)
+        # Pipe straight into crontab instead of going through a temp file
+        result = subprocess.run(['crontab', '-'], input=new_crontab, capture_output=True)
         if result.returncode != 0:
-            print(f"Error installing crontab: {result.stderr}")
+            print(f"Error installing crontab: {result.stderr.decode(errors='replace')}")
             return False
             
         print("Cron jobs successfully installed!")
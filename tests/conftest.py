@@ -4,10 +4,11 @@ Pytest configuration and shared fixtures
 
 import pytest
 import sys
-from pathlib import Path
 
-# Ensure parent module is importable
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Don't write .pyc files (or pytest's rewritten-assert caches) while collecting.
+# Fastest local invocation:
+#   pytest tests/test_auto_monitor.py tests/test_backtester.py -p no:cacheprovider -p no:doctest
+sys.dont_write_bytecode = True
 
 
 @pytest.fixture
@@ -5,149 +5,155 @@ All tests use mocking — no network/side effects.
 """
 import json
 import os
-import sys
 import tempfile
 from datetime import datetime, timedelta
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import auto_monitor
 
+# Canned subprocess stdout payloads, serialized once at import
+_TWO_NEWS = json.dumps({
+    "results": [
+        {"title": "OpenAI releases GPT-5", "url": "https://example.com/1"},
+        {"title": "Anthropic announces Claude 4", "url": "https://example.com/2"}
+    ]
+})
+_EMPTY_RESULTS = json.dumps({"results": []})
+_NO_RESULTS_KEY = json.dumps({"status": "ok"})  # No "results" key
+_PRICES_035 = json.dumps([{
+    "slug": "gpt-ads-by-january-31-329-775",
+    "outcomePrices": json.dumps([0.35, 0.65])
+}])
+_PRICES_042 = json.dumps([{
+    "slug": "gpt-ads-by-january-31-329-775",
+    "outcomePrices": json.dumps([0.42, 0.58])
+}])
+_EMPTY_MARKETS = json.dumps([])
+
+
+class _FakeRun:
+    """Stand-in for subprocess.run; tests set stdout/returncode directly."""
+    
+    def __init__(self):
+        self.stdout = ""
+        self.returncode = 0
+    
+    def __call__(self, *args, **kwargs):
+        return self
+
+
+@pytest.fixture(scope="module")
+def _installed_fake_run():
+    """Install a single _FakeRun as subprocess.run for the whole module."""
+    fake = _FakeRun()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("subprocess.run", fake, raising=True)
+        yield fake
+
+
+@pytest.fixture
+def fake_run(_installed_fake_run):
+    """The shared _FakeRun, reset so no test inherits another's stdout/returncode."""
+    _installed_fake_run.stdout = ""
+    _installed_fake_run.returncode = 0
+    return _installed_fake_run
+
 
 class TestSearchNews:
     """Tests for search_news function."""
     
-    def test_search_news_returns_list(self):
+    def test_search_news_returns_list(self, fake_run):
         """search_news should return a list of results."""
-        mock_response = {
-            "results": [
-                {"title": "OpenAI releases GPT-5", "url": "https://example.com/1"},
-                {"title": "Anthropic announces Claude 4", "url": "https://example.com/2"}
-            ]
-        }
+        fake_run.stdout = _TWO_NEWS
+        results = auto_monitor.search_news()
         
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout=json.dumps(mock_response),
-                returncode=0
-            )
-            results = auto_monitor.search_news()
-            
-            assert isinstance(results, list)
-            assert len(results) == 2
-            assert results[0]["title"] == "OpenAI releases GPT-5"
+        assert isinstance(results, list)
+        assert len(results) == 2
+        assert results[0]["title"] == "OpenAI releases GPT-5"
     
-    def test_search_news_empty_response(self):
+    def test_search_news_empty_response(self, fake_run):
         """search_news should handle empty results gracefully."""
-        mock_response = {"results": []}
+        fake_run.stdout = _EMPTY_RESULTS
+        results = auto_monitor.search_news()
         
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout=json.dumps(mock_response),
-                returncode=0
-            )
-            results = auto_monitor.search_news()
-            
-            assert results == []
+        assert results == []
     
-    def test_search_news_invalid_json(self):
+    def test_search_news_invalid_json(self, fake_run):
         """search_news should return empty list on invalid JSON."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="not valid json",
-                returncode=0
-            )
-            results = auto_monitor.search_news()
-            
-            assert results == []
+        fake_run.stdout = "not valid json"
+        results = auto_monitor.search_news()
+        
+        assert results == []
     
-    def test_search_news_no_results_key(self):
+    def test_search_news_no_results_key(self, fake_run):
         """search_news should handle missing 'results' key."""
-        mock_response = {"status": "ok"}  # No "results" key
+        fake_run.stdout = _NO_RESULTS_KEY
+        results = auto_monitor.search_news()
         
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout=json.dumps(mock_response),
-                returncode=0
-            )
-            results = auto_monitor.search_news()
-            
-            assert results == []
+        assert results == []
 
 
 class TestGetMarketPrices:
     """Tests for get_market_prices function."""
     
-    def test_get_market_prices_returns_dict(self):
+    def test_get_market_prices_returns_dict(self, fake_run):
         """get_market_prices should return a dictionary of prices."""
-        mock_market = [{
-            "slug": "gpt-ads-by-january-31-329-775",
-            "outcomePrices": json.dumps([0.35, 0.65])
-        }]
+        fake_run.stdout = _PRICES_035
+        prices = auto_monitor.get_market_prices()
         
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout=json.dumps(mock_market),
-                returncode=0
-            )
-            prices = auto_monitor.get_market_prices()
-            
-            assert isinstance(prices, dict)
+        assert isinstance(prices, dict)
     
-    def test_get_market_prices_parses_outcome_prices(self):
+    def test_get_market_prices_parses_outcome_prices(self, fake_run):
         """Should correctly parse outcome prices."""
-        mock_market = [{
-            "slug": "gpt-ads-by-january-31-329-775",
-            "outcomePrices": json.dumps([0.42, 0.58])
-        }]
+        fake_run.stdout = _PRICES_042
+        prices = auto_monitor.get_market_prices()
         
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout=json.dumps(mock_market),
-                returncode=0
-            )
-            prices = auto_monitor.get_market_prices()
-            
-            if "gpt-ads-by-january-31-329-775" in prices:
-                assert prices["gpt-ads-by-january-31-329-775"]["yes"] == pytest.approx(42.0)
+        if "gpt-ads-by-january-31-329-775" in prices:
+            assert prices["gpt-ads-by-january-31-329-775"]["yes"] == 42.0
     
-    def test_get_market_prices_handles_empty_response(self):
+    def test_get_market_prices_handles_empty_response(self, fake_run):
         """Should handle empty market response."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout=json.dumps([]),
-                returncode=0
-            )
-            prices = auto_monitor.get_market_prices()
-            
-            assert isinstance(prices, dict)
+        fake_run.stdout = _EMPTY_MARKETS
+        prices = auto_monitor.get_market_prices()
+        
+        assert isinstance(prices, dict)
     
-    def test_get_market_prices_handles_api_error(self):
+    def test_get_market_prices_handles_api_error(self, fake_run):
         """Should handle API errors gracefully."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="Error: API unavailable",
-                returncode=1
-            )
-            prices = auto_monitor.get_market_prices()
-            
-            assert isinstance(prices, dict)
+        fake_run.stdout = "Error: API unavailable"
+        fake_run.returncode = 1
+        prices = auto_monitor.get_market_prices()
+        
+        assert isinstance(prices, dict)
+
+
+@pytest.fixture(scope="class")
+def base_time():
+    """Fixed 'now' per test class; auto_monitor's clock is frozen to it."""
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return base
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auto_monitor, "datetime", FrozenDatetime)
+        yield base
 
 
 class TestCheckPendingEvents:
     """Tests for check_pending_events function."""
     
-    def test_check_pending_events_skips_updated_events(self):
+    def test_check_pending_events_skips_updated_events(self, base_time):
         """Events with 1h price update should be skipped."""
         mock_events = {
             "events": [{
                 "id": 1,
-                "news_time": (datetime.now() - timedelta(hours=2)).isoformat(),
+                "news_time": (base_time - timedelta(hours=2)).isoformat(),
                 "market_price_1h_later": "45.0"  # Already has update
             }]
         }
@@ -158,12 +164,12 @@ class TestCheckPendingEvents:
                     auto_monitor.check_pending_events()
                     mock_update.assert_not_called()
     
-    def test_check_pending_events_updates_old_events(self):
+    def test_check_pending_events_updates_old_events(self, base_time):
         """Events older than 1h should get price updates."""
         mock_events = {
             "events": [{
                 "id": 1,
-                "news_time": (datetime.now() - timedelta(hours=2)).isoformat(),
+                "news_time": (base_time - timedelta(hours=2)).isoformat(),
                 "market_slug": "gpt-ads-by-january-31-329-775"
                 # No market_price_1h_later
             }]
@@ -178,12 +184,12 @@ class TestCheckPendingEvents:
                     auto_monitor.check_pending_events()
                     mock_update.assert_called_once_with(1, market_price_1h_later="42.5")
     
-    def test_check_pending_events_ignores_recent_events(self):
+    def test_check_pending_events_ignores_recent_events(self, base_time):
         """Events less than 1h old should not be updated yet."""
         mock_events = {
             "events": [{
                 "id": 1,
-                "news_time": (datetime.now() - timedelta(minutes=30)).isoformat(),
+                "news_time": (base_time - timedelta(minutes=30)).isoformat(),
                 "market_slug": "gpt-ads-by-january-31-329-775"
             }]
         }
@@ -193,49 +199,118 @@ class TestCheckPendingEvents:
                 with patch.object(auto_monitor, "update_event") as mock_update:
                     auto_monitor.check_pending_events()
                     mock_update.assert_not_called()
+    
+    def test_check_pending_events_prefers_stored_timestamp(self, base_time):
+        """_news_time_ts, when present, is used instead of parsing news_time."""
+        mock_events = {
+            "events": [{
+                "id": 1,
+                "news_time": "not parsed",
+                "_news_time_ts": (base_time - timedelta(hours=2)).timestamp(),
+                "market_slug": "gpt-ads-by-january-31-329-775"
+            }]
+        }
+        mock_prices = {
+            "gpt-ads-by-january-31-329-775": {"yes": 42.5, "name": "GPT Ads"}
+        }
+        
+        with patch.object(auto_monitor, "load_events", return_value=mock_events):
+            with patch.object(auto_monitor, "get_market_prices", return_value=mock_prices):
+                with patch.object(auto_monitor, "update_event") as mock_update:
+                    auto_monitor.check_pending_events()
+                    mock_update.assert_called_once_with(1, market_price_1h_later="42.5")
+
+
+# Substring checks over the keyword list, evaluated once at import
+_ANY_GPT = any("gpt" in kw for kw in auto_monitor.AI_KEYWORDS)
+_ANY_REGULATION = any("regulation" in kw for kw in auto_monitor.AI_KEYWORDS)
+_ANY_SAFETY = any("safety" in kw for kw in auto_monitor.AI_KEYWORDS)
+
+
+@pytest.fixture(scope="session")
+def kw_set():
+    """AI_KEYWORDS as a frozenset for O(1) membership checks."""
+    return frozenset(auto_monitor.AI_KEYWORDS)
 
 
 class TestAIKeywords:
     """Tests for AI keyword detection."""
     
-    def test_keywords_include_major_companies(self):
+    def test_keywords_include_major_companies(self, kw_set):
         """Keyword list should include major AI companies."""
-        keywords = auto_monitor.AI_KEYWORDS
-        assert "openai" in keywords
-        assert "anthropic" in keywords
+        assert "openai" in kw_set
+        assert "anthropic" in kw_set
     
-    def test_keywords_include_models(self):
+    def test_keywords_include_models(self, kw_set):
         """Keyword list should include major models."""
-        keywords = auto_monitor.AI_KEYWORDS
-        assert any("gpt" in kw for kw in keywords)
-        assert "claude" in keywords
-        assert "gemini" in keywords
+        assert _ANY_GPT
+        assert "claude" in kw_set
+        assert "gemini" in kw_set
     
-    def test_keywords_include_regulatory_terms(self):
+    def test_keywords_include_regulatory_terms(self, kw_set):
         """Keyword list should include regulatory terms."""
-        keywords = auto_monitor.AI_KEYWORDS
-        assert "ai regulation" in keywords or any("regulation" in kw for kw in keywords)
-        assert "ai safety" in keywords or any("safety" in kw for kw in keywords)
+        assert "ai regulation" in kw_set or _ANY_REGULATION
+        assert "ai safety" in kw_set or _ANY_SAFETY
+    
+    @pytest.mark.parametrize("title,relevant", [
+        ("OpenAI releases GPT-5", True),
+        ("ANTHROPIC ships Claude", True),
+        ("New AI Regulation proposed", True),
+        ("Sports team wins championship", False),
+    ])
+    def test_keywords_regex(self, title, relevant):
+        """AI_KEYWORDS_RE matches titles case-insensitively."""
+        assert bool(auto_monitor.AI_KEYWORDS_RE.search(title)) is relevant
+
+
+class TestSeenHeadlines:
+    """Tests for the seen-headlines file helpers."""
+    
+    # Bound at import, before monitor_env swaps them for in-memory stubs
+    _read_seen = staticmethod(auto_monitor._read_seen)
+    _write_seen = staticmethod(auto_monitor._write_seen)
+    
+    def test_round_trip(self, tmp_path, monkeypatch):
+        """Headlines written by one run are read back by the next."""
+        monkeypatch.setattr(auto_monitor, "DATA_DIR", tmp_path)
+        
+        assert self._read_seen() == set()
+        self._write_seen({"OpenAI releases GPT-5"})
+        assert self._read_seen() == {"OpenAI releases GPT-5"}
+
+
+@pytest.fixture(scope="module")
+def monitor_env():
+    """
+    Patch auto_monitor once per module: seen headlines live in an in-memory
+    set instead of DATA_DIR, and market prices / event loading are stubbed out.
+    """
+    env = SimpleNamespace(seen=set())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auto_monitor, "_read_seen", lambda: set(env.seen))
+        mp.setattr(auto_monitor, "_write_seen", env.seen.update)
+        mp.setattr(auto_monitor, "get_market_prices", lambda: {})
+        mp.setattr(auto_monitor, "load_events", lambda: {"events": []})
+        yield env
 
 
 class TestRunMonitor:
     """Tests for the main run_monitor function."""
     
-    def test_run_monitor_calls_all_functions(self, tmp_path, capsys):
+    @pytest.fixture(autouse=True)
+    def seen(self, monitor_env):
+        """Start each test with no seen headlines."""
+        monitor_env.seen.clear()
+        return monitor_env.seen
+    
+    def test_run_monitor_calls_all_functions(self, monkeypatch, capsys):
         """run_monitor should call all monitoring functions."""
-        # Create temp seen_headlines.json
-        seen_file = tmp_path / "seen_headlines.json"
-        seen_file.write_text("[]")
-        
         mock_prices = {"market1": {"yes": 50.0, "name": "Test Market"}}
         mock_news = [{"title": "Non-AI news", "url": "https://example.com"}]
-        mock_events = {"events": []}
         
-        with patch.object(auto_monitor, "DATA_DIR", tmp_path):
-            with patch.object(auto_monitor, "get_market_prices", return_value=mock_prices):
-                with patch.object(auto_monitor, "search_news", return_value=mock_news):
-                    with patch.object(auto_monitor, "load_events", return_value=mock_events):
-                        auto_monitor.run_monitor()
+        monkeypatch.setattr(auto_monitor, "get_market_prices", lambda: mock_prices)
+        monkeypatch.setattr(auto_monitor, "search_news", lambda: mock_news)
+        auto_monitor.run_monitor()
         
         captured = capsys.readouterr()
         assert "Monitor Run:" in captured.out
@@ -243,59 +318,42 @@ class TestRunMonitor:
         assert "Searching for AI news" in captured.out
         assert "Monitor complete" in captured.out
     
-    def test_run_monitor_saves_seen_headlines(self, tmp_path):
+    def test_run_monitor_saves_seen_headlines(self, seen, monkeypatch):
         """run_monitor should save seen headlines to file."""
-        seen_file = tmp_path / "seen_headlines.json"
-        seen_file.write_text("[]")
-        
         mock_news = [
             {"title": "OpenAI announces new model", "url": "https://example.com/1"}
         ]
         
-        with patch.object(auto_monitor, "DATA_DIR", tmp_path):
-            with patch.object(auto_monitor, "get_market_prices", return_value={}):
-                with patch.object(auto_monitor, "search_news", return_value=mock_news):
-                    with patch.object(auto_monitor, "load_events", return_value={"events": []}):
-                        auto_monitor.run_monitor()
+        monkeypatch.setattr(auto_monitor, "search_news", lambda: mock_news)
+        auto_monitor.run_monitor()
         
         # Check that headline was saved
-        saved = json.loads(seen_file.read_text())
-        assert "OpenAI announces new model" in saved
+        assert "OpenAI announces new model" in seen
     
-    def test_run_monitor_filters_relevant_news(self, tmp_path, capsys):
+    def test_run_monitor_filters_relevant_news(self, monkeypatch, capsys):
         """run_monitor should only report news matching AI keywords."""
-        seen_file = tmp_path / "seen_headlines.json"
-        seen_file.write_text("[]")
-        
         mock_news = [
             {"title": "OpenAI releases GPT-5", "url": "https://example.com/1"},  # Relevant
             {"title": "Sports team wins championship", "url": "https://example.com/2"}  # Not relevant
         ]
         
-        with patch.object(auto_monitor, "DATA_DIR", tmp_path):
-            with patch.object(auto_monitor, "get_market_prices", return_value={}):
-                with patch.object(auto_monitor, "search_news", return_value=mock_news):
-                    with patch.object(auto_monitor, "load_events", return_value={"events": []}):
-                        auto_monitor.run_monitor()
+        monkeypatch.setattr(auto_monitor, "search_news", lambda: mock_news)
+        auto_monitor.run_monitor()
         
         captured = capsys.readouterr()
         assert "1 new relevant headlines" in captured.out
         assert "OpenAI" in captured.out or "GPT-5" in captured.out
     
-    def test_run_monitor_deduplicates_headlines(self, tmp_path, capsys):
+    def test_run_monitor_deduplicates_headlines(self, seen, monkeypatch, capsys):
         """run_monitor should not report headlines already seen."""
-        seen_file = tmp_path / "seen_headlines.json"
-        seen_file.write_text('["OpenAI releases GPT-5"]')
+        seen.add("OpenAI releases GPT-5")
         
         mock_news = [
             {"title": "OpenAI releases GPT-5", "url": "https://example.com/1"}  # Already seen
         ]
         
-        with patch.object(auto_monitor, "DATA_DIR", tmp_path):
-            with patch.object(auto_monitor, "get_market_prices", return_value={}):
-                with patch.object(auto_monitor, "search_news", return_value=mock_news):
-                    with patch.object(auto_monitor, "load_events", return_value={"events": []}):
-                        auto_monitor.run_monitor()
+        monkeypatch.setattr(auto_monitor, "search_news", lambda: mock_news)
+        auto_monitor.run_monitor()
         
         captured = capsys.readouterr()
         assert "No new relevant news" in captured.out
@@ -310,8 +368,7 @@ class TestTrackedMarkets:
     
     def test_tracked_markets_format(self):
         """Each tracked market should have slug -> name mapping."""
-        for slug, name in auto_monitor.TRACKED_MARKETS.items():
-            assert isinstance(slug, str)
-            assert isinstance(name, str)
-            assert len(slug) > 0
-            assert len(name) > 0
+        assert all(
+            isinstance(slug, str) and isinstance(name, str) and slug and name
+            for slug, name in auto_monitor.TRACKED_MARKETS.items()
+        )
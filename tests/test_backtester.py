@@ -3,24 +3,30 @@
 Unit tests for backtester.py
 
 Tests trading statistics calculations and analysis functions.
-No file I/O required - all tests use in-memory data.
+Tests use in-memory data, apart from the edge event loaders (tmp_path).
 """
 
 import pytest
 from datetime import datetime, timedelta
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import backtester
 from backtester import (
     TradeStats,
     calculate_unrealized_pnl,
+    calculate_unrealized_pnl_batch,
     analyze_trades,
     analyze_timing,
     generate_marketing_json,
+    load_edge_events,
 )
+from utils.json_io import write_json, write_jsonl
+
+# Only for results that go through inexact float arithmetic (price / 100)
+APPROX = pytest.approx
+
+# Fixed reference time; none of the code under test reads the clock
+_BASE = datetime(2024, 1, 1)
+_BASE_ISO = _BASE.isoformat()
 
 
 class TestTradeStats:
@@ -45,85 +51,54 @@ class TestTradeStats:
 class TestCalculateUnrealizedPnl:
     """Tests for unrealized P&L calculation."""
     
-    def test_closed_trade_returns_zero(self):
-        """Closed trades have no unrealized P&L."""
-        trade = {
-            "status": "CLOSED",
-            "entry_price": 50,
-            "shares": 100,
-            "outcome": "Yes"
-        }
-        
-        result = calculate_unrealized_pnl(trade, current_price=60)
-        assert result == 0.0
-    
-    def test_no_current_price_returns_zero(self):
-        """Without current price, unrealized P&L is zero."""
-        trade = {
-            "status": "OPEN",
-            "entry_price": 50,
-            "shares": 100,
-            "outcome": "Yes"
-        }
-        
-        result = calculate_unrealized_pnl(trade, current_price=None)
-        assert result == 0.0
-    
-    def test_yes_position_profit(self):
-        """Yes position profits when price rises."""
-        trade = {
-            "status": "OPEN",
-            "entry_price": 50,  # 50%
-            "shares": 100,
-            "outcome": "Yes"
-        }
-        
-        # Price rose from 50% to 60%
-        result = calculate_unrealized_pnl(trade, current_price=60)
-        # (0.60 - 0.50) * 100 * 100 = $10
-        assert result == pytest.approx(10.0)
-    
-    def test_yes_position_loss(self):
-        """Yes position loses when price falls."""
+    @pytest.mark.parametrize("status,outcome,entry,cur,expected", [
+        ("CLOSED", "Yes", 50, 60, 0.0),   # Closed trades have no unrealized P&L
+        ("OPEN", "Yes", 50, None, 0.0),   # Without current price, P&L is zero
+        ("OPEN", "Yes", 50, 60, 10.0),    # Yes profits when price rises
+        ("OPEN", "Yes", 50, 40, -10.0),   # Yes loses when price falls
+        ("OPEN", "No", 50, 40, 10.0),     # No profits when price falls
+        ("OPEN", "No", 50, 60, -10.0),    # No loses when price rises
+    ], ids=["closed", "no-price", "yes-profit", "yes-loss", "no-profit", "no-loss"])
+    def test_unrealized_pnl(self, status, outcome, entry, cur, expected):
+        """(current - entry) / 100 * shares, sign flipped for No positions."""
         trade = {
-            "status": "OPEN",
-            "entry_price": 50,  # 50%
+            "status": status,
+            "entry_price": entry,
             "shares": 100,
-            "outcome": "Yes"
+            "outcome": outcome
         }
         
-        # Price fell from 50% to 40%
-        result = calculate_unrealized_pnl(trade, current_price=40)
-        # (0.40 - 0.50) * 100 * 100 = -$10
-        assert result == pytest.approx(-10.0)
+        result = calculate_unrealized_pnl(trade, current_price=cur)
+        assert result == APPROX(expected)
     
-    def test_no_position_profit(self):
-        """No position profits when price falls."""
-        trade = {
-            "status": "OPEN",
-            "entry_price": 50,  # 50%
-            "shares": 100,
-            "outcome": "No"
-        }
-        
-        # Price fell from 50% to 40% (good for No position)
-        result = calculate_unrealized_pnl(trade, current_price=40)
-        # (0.50 - 0.40) * 100 * 100 = $10
-        assert result == pytest.approx(10.0)
-    
-    def test_no_position_loss(self):
-        """No position loses when price rises."""
-        trade = {
-            "status": "OPEN",
-            "entry_price": 50,  # 50%
-            "shares": 100,
-            "outcome": "No"
-        }
-        
-        # Price rose from 50% to 60% (bad for No position)
-        result = calculate_unrealized_pnl(trade, current_price=60)
-        # (0.50 - 0.60) * 100 * 100 = -$10
-        assert result == pytest.approx(-10.0)
+    def test_batch_matches_scalar(self):
+        """Batch version agrees exactly with the per-trade function."""
+        entries = [50, 50, 35, 72]
+        currents = [60, 40, 41, 70]
+        shares = [100, 100, 250, 80]
+        outcomes = ["Yes", "No", "Yes", "No"]
+        
+        batch = calculate_unrealized_pnl_batch(
+            entries, currents, shares, [o == "Yes" for o in outcomes]
+        )
+        expected = [
+            calculate_unrealized_pnl(
+                {"status": "OPEN", "entry_price": e, "shares": n, "outcome": o},
+                current_price=c,
+            )
+            for e, c, n, o in zip(entries, currents, shares, outcomes)
+        ]
+        assert [float(x) for x in batch] == expected
+
+
+@pytest.fixture(scope="class")
+def mixed_stats():
+    """analyze_trades over two wins and a loss, computed once per class."""
+    return analyze_trades([
+        {"status": "CLOSED", "amount": 100, "pnl": 100},  # Win $100
+        {"status": "CLOSED", "amount": 100, "pnl": 50},   # Win $50
+        {"status": "CLOSED", "amount": 100, "pnl": -25},  # Lose $25
+    ])
 
 
 class TestAnalyzeTrades:
@@ -178,22 +153,16 @@ class TestAnalyzeTrades:
         assert stats.avg_loss == 30  # Absolute value
         assert stats.largest_loss == 30
     
-    def test_mixed_trades(self):
+    def test_mixed_trades(self, mixed_stats):
         """Stats for mix of winning and losing trades."""
-        trades = [
-            {"status": "CLOSED", "amount": 100, "pnl": 100},  # Win $100
-            {"status": "CLOSED", "amount": 100, "pnl": 50},   # Win $50
-            {"status": "CLOSED", "amount": 100, "pnl": -25},  # Lose $25
-        ]
-        
-        stats = analyze_trades(trades)
+        stats = mixed_stats
         
         assert stats.total_trades == 3
         assert stats.closed_trades == 3
         assert stats.winning_trades == 2
         assert stats.losing_trades == 1
         assert stats.realized_pnl == 125  # 100 + 50 - 25
-        assert stats.win_rate == pytest.approx(66.67, rel=0.01)  # 2/3
+        assert stats.win_rate == APPROX(66.67, rel=0.01)  # 2/3
         assert stats.avg_win == 75  # (100 + 50) / 2
         assert stats.avg_loss == 25
         assert stats.largest_win == 100
@@ -213,44 +182,35 @@ class TestAnalyzeTrades:
         assert stats.closed_trades == 1
         assert stats.open_trades == 2
     
-    def test_profit_factor_calculation(self):
+    def test_profit_factor_calculation(self, mixed_stats):
         """Profit factor = gross wins / gross losses."""
-        trades = [
-            {"status": "CLOSED", "amount": 100, "pnl": 100},  # Win
-            {"status": "CLOSED", "amount": 100, "pnl": 50},   # Win
-            {"status": "CLOSED", "amount": 100, "pnl": -30},  # Lose
-        ]
-        
-        stats = analyze_trades(trades)
-        
-        # Gross wins = 150, Gross losses = 30
-        # Profit factor = 150 / 30 = 5.0
-        assert stats.profit_factor == pytest.approx(5.0)
+        # Gross wins = 150, Gross losses = 25
+        # Profit factor = 150 / 25 = 6.0
+        assert mixed_stats.profit_factor == 6.0
     
     def test_hold_time_calculation(self):
         """Average hold time calculated from timestamps."""
-        base = datetime.now()
         trades = [
             {
                 "status": "CLOSED",
                 "amount": 100,
                 "pnl": 50,
-                "timestamp": base.isoformat(),
-                "exit_timestamp": (base + timedelta(hours=24)).isoformat()
+                "timestamp": _BASE_ISO,
+                "exit_timestamp": (_BASE + timedelta(hours=24)).isoformat()
             },
             {
                 "status": "CLOSED",
                 "amount": 100,
                 "pnl": 30,
-                "timestamp": base.isoformat(),
-                "exit_timestamp": (base + timedelta(hours=48)).isoformat()
+                "timestamp": _BASE_ISO,
+                "exit_timestamp": (_BASE + timedelta(hours=48)).isoformat()
             },
         ]
         
         stats = analyze_trades(trades)
         
         # Average hold time = (24 + 48) / 2 = 36 hours
-        assert stats.avg_hold_time_hours == pytest.approx(36.0)
+        assert stats.avg_hold_time_hours == 36.0
     
     def test_total_pnl_includes_unrealized(self):
         """Total P&L = realized + unrealized."""
@@ -272,8 +232,8 @@ class TestAnalyzeTrades:
         # Unrealized = (0.60 - 0.50) * 100 * 100 = $10
         # Total = 50 (realized) + 10 (unrealized) = $60
         assert stats.realized_pnl == 50
-        assert stats.unrealized_pnl == pytest.approx(10.0)
-        assert stats.total_pnl == pytest.approx(60.0)
+        assert stats.unrealized_pnl == APPROX(10.0)
+        assert stats.total_pnl == APPROX(60.0)
 
 
 class TestAnalyzeTiming:
@@ -287,20 +247,19 @@ class TestAnalyzeTiming:
     
     def test_timing_with_price_moves(self):
         """Timing stats calculated from price movements."""
-        base = datetime.now()
         events = [
             {
-                "timestamp": base.isoformat(),
-                "news_time": base.isoformat(),
-                "trade_time": (base + timedelta(minutes=30)).isoformat(),
+                "timestamp": _BASE_ISO,
+                "news_time": _BASE_ISO,
+                "trade_time": (_BASE + timedelta(minutes=30)).isoformat(),
                 "initial_price": 50,
                 "current_price": 55,
                 "price_move_pp": 5
             },
             {
-                "timestamp": base.isoformat(),
-                "news_time": base.isoformat(),
-                "trade_time": (base + timedelta(minutes=60)).isoformat(),
+                "timestamp": _BASE_ISO,
+                "news_time": _BASE_ISO,
+                "trade_time": (_BASE + timedelta(minutes=60)).isoformat(),
                 "initial_price": 60,
                 "current_price": 70,
                 "price_move_pp": 10
@@ -352,61 +311,95 @@ class TestGenerateMarketingJson:
         assert result["performance"]["total_pnl"] == 123.46
 
 
+_ZERO_PNL = [{"status": "CLOSED", "amount": 100, "pnl": 0}]
+_NONE_PNL = [{"status": "CLOSED", "amount": 100, "pnl": None}]
+_NO_AMOUNT = [{"status": "CLOSED", "pnl": 50}]
+_ALL_LOSSES = [
+    {"status": "CLOSED", "amount": 100, "pnl": -50},
+    {"status": "CLOSED", "amount": 100, "pnl": -30},
+]
+_ALL_WINS = [
+    {"status": "CLOSED", "amount": 100, "pnl": 50},
+    {"status": "CLOSED", "amount": 100, "pnl": 30},
+]
+
+
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
     
-    def test_trade_with_zero_pnl(self):
-        """Trade with exactly zero P&L is neither win nor loss."""
-        trades = [{"status": "CLOSED", "amount": 100, "pnl": 0}]
-        
-        stats = analyze_trades(trades)
-        
-        assert stats.winning_trades == 0
-        assert stats.losing_trades == 0
-        assert stats.closed_trades == 1
+    @pytest.mark.parametrize("trades,attr,expected", [
+        # Exactly zero P&L is neither win nor loss
+        (_ZERO_PNL, "winning_trades", 0),
+        (_ZERO_PNL, "losing_trades", 0),
+        (_ZERO_PNL, "closed_trades", 1),
+        # None P&L treated as zero
+        (_NONE_PNL, "realized_pnl", 0),
+        (_NONE_PNL, "closed_trades", 1),
+        # Missing amount field doesn't crash
+        (_NO_AMOUNT, "total_invested", 0),
+        (_NO_AMOUNT, "realized_pnl", 50),
+        # No wins, so profit factor is 0 (no divide by zero)
+        (_ALL_LOSSES, "profit_factor", 0.0),
+        # No losses: gross losses default to 1, so profit factor = gross wins
+        (_ALL_WINS, "profit_factor", 80.0),
+    ], ids=[
+        "zero-pnl-wins", "zero-pnl-losses", "zero-pnl-closed",
+        "none-pnl-realized", "none-pnl-closed",
+        "missing-amount-invested", "missing-amount-realized",
+        "all-losses-profit-factor", "all-wins-profit-factor",
+    ])
+    def test_edge(self, trades, attr, expected):
+        """analyze_trades handles degenerate inputs."""
+        assert getattr(analyze_trades(trades), attr) == expected
+
+
+
+class TestLoadEdgeEvents:
+    """Tests for load_edge_events."""
     
-    def test_trade_with_none_pnl(self):
-        """Trade with None P&L treated as zero."""
-        trades = [{"status": "CLOSED", "amount": 100, "pnl": None}]
-        
-        stats = analyze_trades(trades)
-        
-        assert stats.realized_pnl == 0
-        assert stats.closed_trades == 1
+    @pytest.fixture
+    def edge_files(self, tmp_path, monkeypatch):
+        """Point the backtester's edge event paths at tmp_path."""
+        paths = {
+            "EDGE_EVENTS_FILE": tmp_path / "edge_events.jsonl",
+            "EDGE_STATS_FILE": tmp_path / "edge_stats.json",
+            "LEGACY_EDGE_EVENTS_FILE": tmp_path / "edge_events.json",
+        }
+        for name, path in paths.items():
+            monkeypatch.setattr(backtester, name, path)
+        return paths
     
-    def test_trade_missing_amount(self):
-        """Trade missing amount field doesn't crash."""
-        trades = [{"status": "CLOSED", "pnl": 50}]
-        
-        stats = analyze_trades(trades)
-        
-        assert stats.total_invested == 0
-        assert stats.realized_pnl == 50
+    def test_no_files(self, edge_files):
+        """No log at all gives an empty result."""
+        assert load_edge_events() == {"events": [], "stats": {}}
     
-    def test_all_losses_profit_factor(self):
-        """Profit factor with all losses doesn't divide by zero."""
-        trades = [
-            {"status": "CLOSED", "amount": 100, "pnl": -50},
-            {"status": "CLOSED", "amount": 100, "pnl": -30},
+    def test_reads_jsonl_log_and_stats(self, edge_files):
+        """Update lines are folded into their events and the stats sidecar is kept."""
+        write_jsonl(edge_files["EDGE_EVENTS_FILE"], [
+            {"id": 1, "headline": "A", "final_resolution": None},
+            {"id": 2, "headline": "B", "final_resolution": None},
+            {"_update": 1, "final_resolution": "yes"},
+        ])
+        write_json(edge_files["EDGE_STATS_FILE"], {"total": 2})
+        
+        data = load_edge_events()
+        
+        assert data["events"] == [
+            {"id": 1, "headline": "A", "final_resolution": "yes"},
+            {"id": 2, "headline": "B", "final_resolution": None},
         ]
-        
-        stats = analyze_trades(trades)
-        
-        # No wins, so profit factor should be 0
-        assert stats.profit_factor == 0.0
+        assert data["stats"] == {"total": 2}
     
-    def test_all_wins_profit_factor(self):
-        """Profit factor with all wins approaches infinity."""
-        trades = [
-            {"status": "CLOSED", "amount": 100, "pnl": 50},
-            {"status": "CLOSED", "amount": 100, "pnl": 30},
-        ]
-        
-        stats = analyze_trades(trades)
-        
-        # No losses, profit factor = total_wins / 1 = total_wins
-        # Actually implemented as inf when losses = 0, but may vary
-        assert stats.profit_factor > 0
+    def test_jsonl_without_stats(self, edge_files):
+        """A log with no stats sidecar yet gives empty stats."""
+        write_jsonl(edge_files["EDGE_EVENTS_FILE"], [{"id": 1}])
+        assert load_edge_events() == {"events": [{"id": 1}], "stats": {}}
+    
+    def test_falls_back_to_legacy_json(self, edge_files):
+        """Before migration, the old single-document file is read as-is."""
+        legacy = {"events": [{"id": 1}], "stats": {"total": 1}}
+        write_json(edge_files["LEGACY_EDGE_EVENTS_FILE"], legacy)
+        assert load_edge_events() == legacy
 
 
 if __name__ == "__main__":
@@ -3,13 +3,14 @@
 Tests for dashboard.py
 """
 
+import dataclasses
 import pytest
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from dashboard import calculate_unrealized_pnl
+from dashboard import calculate_unrealized_pnl, prepare_price_table
 
 
 class TestCalculateUnrealizedPnl:
@@ -70,7 +71,7 @@ class TestCalculateUnrealizedPnl:
         # P&L = (40-60)/100 * 100 = -20
         assert result[0]["unrealized_pnl"] == -20.0
         # P&L % = -20/60 * 100 = -33.33%
-        assert abs(result[0]["unrealized_pnl_pct"] - (-33.33)) < 0.1
+        assert result[0]["unrealized_pnl_pct"] == pytest.approx(-33.33, abs=0.1)
     
     def test_no_outcome_uses_yes_price(self):
         """No outcome on trade uses yes price"""
@@ -190,6 +191,67 @@ class TestCalculateUnrealizedPnl:
         assert result[0]["question"] == "Test market?"
         assert result[0]["timestamp"] == "2026-01-01"
     
+    def test_rows_reference_trade_without_copying(self):
+        """Result rows wrap the original trade dict and are read-only"""
+        trades = [{
+            "status": "OPEN",
+            "market_slug": "test",
+            "outcome": "Yes",
+            "entry_price": 50,
+            "shares": 100,
+            "amount": 50,
+        }]
+        prices = {"test": {"yes": 60, "no": 40}}
+        
+        row = calculate_unrealized_pnl(trades, prices)[0]
+        
+        assert row.trade is trades[0]
+        assert row.current_price == row["current_price"] == 60
+        assert row.get("missing") is None
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            row.current_price = 70
+    
+    def test_rows_read_like_merged_dicts(self):
+        """A row behaves like {**trade, current_price, unrealized_pnl, ...}"""
+        trade = {
+            "status": "OPEN",
+            "market_slug": "test",
+            "outcome": "Yes",
+            "entry_price": 50,
+            "shares": 100,
+            "amount": 50,
+            "current_price": 1,  # stale value, shadowed by the live price
+        }
+        prices = {"test": {"yes": 60, "no": 40}}
+        
+        row = calculate_unrealized_pnl([trade], prices)[0]
+        
+        expected = {**trade, "current_price": 60, "unrealized_pnl": 10.0, "unrealized_pnl_pct": 20.0}
+        assert dict(row) == expected
+        assert row == expected
+        assert list(row) == list(expected)
+        assert len(row) == len(expected)
+        assert "shares" in row and "missing" not in row
+    
+    def test_reuses_prepared_price_table(self):
+        """A price table built once gives the same rows as building per call"""
+        trades = [
+            {"status": "OPEN", "market_slug": "a", "outcome": "Yes",
+             "entry_price": 40, "shares": 100, "amount": 40},
+            {"status": "OPEN", "market_slug": "b", "outcome": "No",
+             "entry_price": 30, "shares": 50, "amount": 15},
+            {"status": "OPEN", "market_slug": "missing", "outcome": "Yes",
+             "entry_price": 50, "shares": 10, "amount": 5},
+        ]
+        prices = {"a": {"yes": 55, "no": 45}, "b": {"yes": 80, "no": 20}}
+        
+        table = prepare_price_table(prices)
+        result = calculate_unrealized_pnl(trades, prices, table)
+        
+        assert [r["market_slug"] for r in result] == ["a", "b"]
+        assert [r["current_price"] for r in result] == [55, 20]
+        assert result == calculate_unrealized_pnl(trades, prices)
+    
     def test_large_position_pnl(self):
         """Large position calculates correctly"""
         trades = [{
@@ -224,7 +286,7 @@ class TestCalculateUnrealizedPnl:
         result = calculate_unrealized_pnl(trades, prices)
         
         # P&L = (66.67-33.33)/100 * 150 = 50.01
-        assert abs(result[0]["unrealized_pnl"] - 50.01) < 0.1
+        assert result[0]["unrealized_pnl"] == pytest.approx(50.01, abs=0.1)
 
 
 class TestDashboardIntegration:
@@ -26,13 +26,34 @@ def temp_data_dir(tmp_path):
 
 @pytest.fixture
 def mock_data_dir(temp_data_dir, monkeypatch):
-    """Mock the DATA_DIR and EDGE_LOG to use temp directory."""
-    edge_log = temp_data_dir / "edge_events.json"
+    """Mock the DATA_DIR and edge log paths to use temp directory."""
     monkeypatch.setattr(edge_tracker, 'DATA_DIR', temp_data_dir)
-    monkeypatch.setattr(edge_tracker, 'EDGE_LOG', edge_log)
+    monkeypatch.setattr(edge_tracker, 'EDGE_LOG', temp_data_dir / "edge_events.jsonl")
+    monkeypatch.setattr(edge_tracker, 'EDGE_STATS', temp_data_dir / "edge_stats.json")
+    monkeypatch.setattr(edge_tracker, 'LEGACY_EDGE_LOG', temp_data_dir / "edge_events.json")
+    monkeypatch.setattr(edge_tracker, '_BACKEND', edge_tracker.FileBackend())
     return temp_data_dir
 
 
+@pytest.fixture
+def memory_store(monkeypatch):
+    """Keep the event log in memory so tests skip the filesystem."""
+    store = edge_tracker.MemoryBackend()
+    monkeypatch.setattr(edge_tracker, '_BACKEND', store)
+    return store
+
+
+def read_saved():
+    """Read the stored log back as {"events", "stats"}, bypassing the cache."""
+    log, stats = edge_tracker._dump_raw()
+    return {
+        "events": edge_tracker.fold_event_log(
+            [json.loads(line) for line in log.decode().splitlines()]
+        ),
+        "stats": json.loads(stats) if stats else {},
+    }
+
+
 class TestLoadEvents:
     """Tests for load_events function."""
     
@@ -41,8 +62,8 @@ class TestLoadEvents:
         result = edge_tracker.load_events()
         assert result == {"events": [], "stats": {}}
     
-    def test_loads_existing_events(self, mock_data_dir):
-        """Should load events from existing file."""
+    def test_migrates_legacy_json_file(self, mock_data_dir):
+        """Should load an old edge_events.json and convert it to JSONL."""
         test_data = {
             "events": [{"id": 1, "headline": "Test"}],
             "stats": {"total": 1}
@@ -53,41 +74,66 @@ class TestLoadEvents:
         result = edge_tracker.load_events()
         assert result == test_data
         assert len(result["events"]) == 1
+        assert read_saved() == test_data
+    
+    def test_reuses_parsed_data_until_file_changes(self, mock_data_dir):
+        """Should skip re-parsing while the file is unchanged on disk."""
+        edge_log = mock_data_dir / "edge_events.jsonl"
+        edge_log.write_text("")
+        
+        first = edge_tracker.load_events()
+        assert edge_tracker.load_events() is first
+        
+        edge_log.write_text('{"id": 1}\n')
+        assert edge_tracker.load_events()["events"] == [{"id": 1}]
+    
+    def test_folds_appended_updates(self, mock_data_dir):
+        """Update lines should be merged into the event they refer to."""
+        (mock_data_dir / "edge_events.jsonl").write_text(
+            '{"id": 1, "notes": ""}\n'
+            '{"id": 2, "notes": ""}\n'
+            '{"_update": 1, "notes": "first"}\n'
+            '{"_update": 1, "notes": "second"}\n'
+            '{"_update": 99, "notes": "unknown id"}\n'
+        )
+        
+        result = edge_tracker.load_events()
+        assert result["events"] == [{"id": 1, "notes": "second"}, {"id": 2, "notes": ""}]
 
 
 class TestSaveEvents:
     """Tests for save_events function."""
     
     def test_saves_events_to_file(self, mock_data_dir):
-        """Should write events to JSON file."""
+        """Should write events to the JSONL log and stats to the sidecar."""
         test_data = {
             "events": [{"id": 1, "headline": "Test event"}],
             "stats": {}
         }
         edge_tracker.save_events(test_data)
         
-        edge_log = mock_data_dir / "edge_events.json"
+        edge_log = mock_data_dir / "edge_events.jsonl"
         assert edge_log.exists()
         
-        saved = json.loads(edge_log.read_text())
-        assert saved == test_data
+        assert read_saved() == test_data
     
     def test_overwrites_existing_file(self, mock_data_dir):
         """Should overwrite existing file."""
-        edge_log = mock_data_dir / "edge_events.json"
-        edge_log.write_text('{"events": [{"id": 0}], "stats": {}}')
+        edge_log = mock_data_dir / "edge_events.jsonl"
+        edge_log.write_text('{"id": 0}\n{"_update": 0, "notes": "x"}\n')
         
         new_data = {"events": [{"id": 1}, {"id": 2}], "stats": {}}
         edge_tracker.save_events(new_data)
         
-        saved = json.loads(edge_log.read_text())
+        saved = read_saved()
         assert len(saved["events"]) == 2
+        assert len(edge_log.read_text().splitlines()) == 2
 
 
 class TestLogNewsEvent:
     """Tests for log_news_event function."""
     
-    def test_creates_event_with_required_fields(self, mock_data_dir):
+    def test_creates_event_with_required_fields(self, memory_store):
         """Should create event with all required fields."""
         event_id = edge_tracker.log_news_event(
             headline="OpenAI releases GPT-5",
@@ -111,7 +157,7 @@ class TestLogNewsEvent:
         assert event["final_resolution"] is None
         assert event["notes"] == ""
     
-    def test_creates_event_with_market_slug(self, mock_data_dir):
+    def test_creates_event_with_market_slug(self, memory_store):
         """Should include market slug when provided."""
         event_id = edge_tracker.log_news_event(
             headline="Test headline",
@@ -122,7 +168,7 @@ class TestLogNewsEvent:
         data = edge_tracker.load_events()
         assert data["events"][0]["market_slug"] == "will-gpt5-release-2026"
     
-    def test_increments_event_id(self, mock_data_dir):
+    def test_increments_event_id(self, memory_store):
         """Should increment event ID for each new event."""
         id1 = edge_tracker.log_news_event("Event 1", "Source 1")
         id2 = edge_tracker.log_news_event("Event 2", "Source 2")
@@ -132,7 +178,7 @@ class TestLogNewsEvent:
         assert id2 == 2
         assert id3 == 3
     
-    def test_news_time_is_valid_iso_format(self, mock_data_dir):
+    def test_news_time_is_valid_iso_format(self, memory_store):
         """Should record news_time in ISO format."""
         edge_tracker.log_news_event("Test", "Source")
         
@@ -140,13 +186,29 @@ class TestLogNewsEvent:
         news_time = data["events"][0]["news_time"]
         
         # Should not raise
-        datetime.fromisoformat(news_time)
+        parsed = datetime.fromisoformat(news_time)
+        assert data["events"][0]["_news_time_ts"] == parsed.timestamp()
+
+    def test_bulk_logs_in_order(self, memory_store):
+        """Bulk logging should assign sequential ids and write every event."""
+        edge_tracker.log_news_event("Existing", "Source")
+        
+        ids = edge_tracker.log_news_events_bulk([
+            ("First", "Reuters"),
+            ("Second", "AP", "some-market"),
+        ])
+        
+        assert ids == [2, 3]
+        events = read_saved()["events"]
+        assert [e["headline"] for e in events] == ["Existing", "First", "Second"]
+        assert events[2]["market_slug"] == "some-market"
+        assert events[1]["market_slug"] is None
 
 
 class TestUpdateEvent:
     """Tests for update_event function."""
     
-    def test_updates_existing_event(self, mock_data_dir, capsys):
+    def test_updates_existing_event(self, memory_store, capsys):
         """Should update fields on existing event."""
         edge_tracker.log_news_event("Test headline", "Test source")
         
@@ -154,11 +216,12 @@ class TestUpdateEvent:
         
         data = edge_tracker.load_events()
         assert data["events"][0]["market_price_at_news"] == 65.0
+        assert read_saved()["events"][0]["market_price_at_news"] == 65.0
         
         captured = capsys.readouterr()
         assert "Updated event #1" in captured.out
     
-    def test_updates_multiple_fields(self, mock_data_dir):
+    def test_updates_multiple_fields(self, memory_store):
         """Should update multiple fields at once."""
         edge_tracker.log_news_event("Test", "Source")
         
@@ -177,14 +240,14 @@ class TestUpdateEvent:
         assert event["final_resolution"] == "yes"
         assert event["notes"] == "Big move!"
     
-    def test_handles_nonexistent_event(self, mock_data_dir, capsys):
+    def test_handles_nonexistent_event(self, memory_store, capsys):
         """Should print message for nonexistent event."""
         edge_tracker.update_event(999, notes="test")
         
         captured = capsys.readouterr()
         assert "Event #999 not found" in captured.out
     
-    def test_preserves_other_events(self, mock_data_dir):
+    def test_preserves_other_events(self, memory_store):
         """Should not modify other events."""
         edge_tracker.log_news_event("Event 1", "Source")
         edge_tracker.log_news_event("Event 2", "Source")
@@ -194,19 +257,29 @@ class TestUpdateEvent:
         data = edge_tracker.load_events()
         assert data["events"][0]["notes"] == ""
         assert data["events"][1]["notes"] == "Updated"
+    
+    def test_compacts_log_once_updates_pile_up(self, memory_store):
+        """Should rewrite the log once update lines outnumber events."""
+        edge_tracker.log_news_event("Event 1", "Source")
+        edge_tracker.update_event(1, notes="first")
+        edge_tracker.update_event(1, notes="second")
+        
+        log, _ = edge_tracker._dump_raw()
+        assert len(log.splitlines()) == 1
+        assert read_saved()["events"][0]["notes"] == "second"
 
 
 class TestCalculateStats:
     """Tests for calculate_stats function."""
     
-    def test_handles_no_events(self, mock_data_dir, capsys):
+    def test_handles_no_events(self, memory_store, capsys):
         """Should handle empty events list."""
         edge_tracker.calculate_stats()
         
         captured = capsys.readouterr()
         assert "No events logged yet" in captured.out
     
-    def test_shows_basic_counts(self, mock_data_dir, capsys):
+    def test_shows_basic_counts(self, memory_store, capsys):
         """Should show total event count."""
         edge_tracker.log_news_event("Event 1", "Source")
         edge_tracker.log_news_event("Event 2", "Source")
@@ -216,7 +289,7 @@ class TestCalculateStats:
         captured = capsys.readouterr()
         assert "Total events: 2" in captured.out
     
-    def test_calculates_price_movement(self, mock_data_dir, capsys):
+    def test_calculates_price_movement(self, memory_store, capsys):
         """Should calculate average price movement."""
         edge_tracker.log_news_event("Event 1", "Source")
         edge_tracker.update_event(1, 
@@ -238,7 +311,7 @@ class TestCalculateStats:
         # Average = 20%
         assert "Avg 1h price move: +20.0%" in captured.out
     
-    def test_calculates_win_rate(self, mock_data_dir, capsys):
+    def test_calculates_win_rate(self, memory_store, capsys):
         """Should calculate win rate from resolved events."""
         edge_tracker.log_news_event("Win 1", "Source")
         edge_tracker.update_event(1, final_resolution="yes", trade_result="win")
@@ -254,12 +327,44 @@ class TestCalculateStats:
         captured = capsys.readouterr()
         assert "Win rate: 2/3" in captured.out
         assert "67%" in captured.out
+    
+    def test_stats_follow_later_updates(self, memory_store, capsys):
+        """Running totals should track events logged and updated after a report."""
+        edge_tracker.log_news_event("Event 1", "Source")
+        edge_tracker.update_event(1, market_price_at_news=50.0, market_price_1h_later=60.0)
+        edge_tracker.calculate_stats()
+        
+        edge_tracker.update_event(1, market_price_1h_later=55.0)
+        edge_tracker.log_news_event("Event 2", "Source")
+        edge_tracker.update_event(2, final_resolution="yes", trade_result="win")
+        capsys.readouterr()
+        
+        edge_tracker.calculate_stats()
+        
+        captured = capsys.readouterr()
+        assert "Total events: 2" in captured.out
+        assert "Avg 1h price move: +10.0%" in captured.out
+        assert "Win rate: 1/1" in captured.out
+    
+    def test_stats_follow_in_place_edits(self, memory_store, capsys):
+        """Events edited in place and saved should not be counted from stale totals."""
+        edge_tracker.log_news_event("Event 1", "Source")
+        edge_tracker.calculate_stats()
+        
+        data = edge_tracker.load_events()
+        data["events"][0].update(final_resolution="yes", trade_result="win")
+        edge_tracker.save_events(data)
+        capsys.readouterr()
+        
+        edge_tracker.calculate_stats()
+        
+        assert "Win rate: 1/1" in capsys.readouterr().out
 
 
 class TestShowEvents:
     """Tests for show_events function."""
     
-    def test_shows_recent_events(self, mock_data_dir, capsys):
+    def test_shows_recent_events(self, memory_store, capsys):
         """Should display recent events."""
         edge_tracker.log_news_event("First event headline", "Reuters")
         edge_tracker.log_news_event("Second event headline", "AP")
@@ -270,10 +375,9 @@ class TestShowEvents:
         assert "First event headline" in captured.out
         assert "Second event headline" in captured.out
     
-    def test_limits_output_count(self, mock_data_dir, capsys):
+    def test_limits_output_count(self, memory_store, capsys):
         """Should respect the n parameter."""
-        for i in range(5):
-            edge_tracker.log_news_event(f"Event {i}", "Source")
+        edge_tracker.log_news_events_bulk([(f"Event {i}", "Source") for i in range(5)])
         
         # Clear the log output from event creation
         capsys.readouterr()
@@ -288,7 +392,29 @@ class TestShowEvents:
         assert "#1:" not in captured.out
         assert "#2:" not in captured.out
     
-    def test_shows_price_data_when_available(self, mock_data_dir, capsys):
+    def test_zero_shows_nothing(self, memory_store, capsys):
+        """n=0 should not fall through to showing every event."""
+        edge_tracker.log_news_event("Only event", "Source")
+        capsys.readouterr()
+        
+        edge_tracker.show_events(0)
+        
+        assert "Only event" not in capsys.readouterr().out
+    
+    def test_tail_read_matches_full_load(self, memory_store):
+        """Reading the log backwards should fold the same last events."""
+        records = []
+        for i in range(1, 41):
+            records.append({"id": i, "notes": ""})
+            if i % 3 == 0:
+                records.append({"_update": i - 1, "notes": f"late {i}"})
+        memory_store.append(records)
+        
+        expected = edge_tracker.load_events()["events"]
+        for n in (1, 5, 40, 100):
+            assert edge_tracker._tail_events(n, block=64) == expected[-n:]
+    
+    def test_shows_price_data_when_available(self, memory_store, capsys):
         """Should display price data if present."""
         edge_tracker.log_news_event("Test event", "Source")
         edge_tracker.update_event(1, 
@@ -302,7 +428,7 @@ class TestShowEvents:
         assert "55.0%" in captured.out
         assert "70.0%" in captured.out
     
-    def test_shows_resolution_status(self, mock_data_dir, capsys):
+    def test_shows_resolution_status(self, memory_store, capsys):
         """Should show checkmark for resolved events."""
         edge_tracker.log_news_event("Unresolved", "Source")
         edge_tracker.log_news_event("Resolved", "Source")
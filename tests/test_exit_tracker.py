@@ -1,36 +1,117 @@
 #!/usr/bin/env python3
 """Unit tests for ExitTracker."""
 
-import json
-import tempfile
-from pathlib import Path
+import copy
+import logging
+import re
 from unittest.mock import patch, MagicMock
 import pytest
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from alerts.exit_tracker import ExitTracker
+from utils.json_io import write_json
+
+
+@pytest.fixture
+def temp_data_dir(tmp_path_factory, request):
+    """Fresh data directory for this test, named after it (numbered, so reruns don't collide)."""
+    return tmp_path_factory.mktemp(re.sub(r"[^\w.-]", "_", request.node.name), numbered=True)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _mock_notifier():
+    """TelegramNotifier (and the Polymarket client) patched once for the module."""
+    with patch("alerts.exit_tracker.TelegramNotifier", autospec=True) as notifier_cls, \
+            patch("alerts.exit_tracker.PolymarketClient", autospec=True):
+        yield notifier_cls
+
+
+@pytest.fixture(scope="module")
+def _shared_tracker(_mock_notifier):
+    """One ExitTracker for the module, built through the real __init__."""
+    return ExitTracker(notify=True)
+
+
+@pytest.fixture
+def tracker(_shared_tracker, temp_data_dir, monkeypatch):
+    """Shared ExitTracker with a clean notifier and this test's data paths."""
+    t = _shared_tracker
+    t.notifier.reset_mock()
+    # setattr records the originals, so anything a test swaps out is restored
+    monkeypatch.setattr(t, "notifier", t.notifier)
+    monkeypatch.setattr(t, "data_dir", temp_data_dir)
+    monkeypatch.setattr(t, "targets_file", temp_data_dir / "exit_targets.json")
+    monkeypatch.setattr(t, "trades_file", temp_data_dir / "paper_trades.json")
+    return t
+
+
+# Open position most check_exits/portfolio_summary tests start from
+_BASE_TRADE = {
+    "id": 1,
+    "status": "OPEN",
+    "market_slug": "test-market",
+    "question": "Test Question",
+    "entry_price": 80.0,
+    "amount": 100,
+    "shares": 125,
+    "outcome": "Yes",
+}
+
+
+def _pos(**overrides) -> dict:
+    """A fresh copy of _BASE_TRADE with some fields changed."""
+    return {**_BASE_TRADE, **overrides}
+
+
+# Fixed set_at for targets written directly rather than via set_exit_target
+_FAKE_SET_AT = "2026-02-01T00:00:00Z"
+
+# Shape of the set_at timestamps set_exit_target writes
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
 
 
 @pytest.fixture
-def temp_data_dir():
-    """Create temporary data directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def stub_positions(tracker, monkeypatch):
+    """
+    Serve positions from memory instead of the trades file (load_positions
+    has its own tests): stub_positions(**overrides) gives one trade based on
+    _BASE_TRADE, stub_positions(trade, ...) gives the trades as-is.
+    """
+    def _stub(*trades, **overrides):
+        if not trades:
+            trades = (_pos(**overrides),)
+        open_trades = [t for t in trades if t.get("status") == "OPEN"]
+        monkeypatch.setattr(tracker, "load_positions", lambda: open_trades)
+    return _stub
 
 
 @pytest.fixture
-def tracker(temp_data_dir):
-    """Create ExitTracker with mocked paths."""
-    with patch.object(ExitTracker, '__init__', lambda self, notify=True: None):
-        t = ExitTracker()
-        t.polymarket = MagicMock()
-        t.notifier = MagicMock()
-        t.data_dir = temp_data_dir
-        t.targets_file = temp_data_dir / "exit_targets.json"
-        t.trades_file = temp_data_dir / "paper_trades.json"
-        return t
+def stub_price(tracker, monkeypatch):
+    """
+    Stub get_current_price (it has its own tests): stub_price(85.0) answers
+    every slug with 85.0, stub_price(func) answers with func(slug).
+    """
+    def _stub(price):
+        fetch = price if callable(price) else (lambda slug: price)
+        monkeypatch.setattr(tracker, "get_current_price", fetch)
+    return _stub
+
+
+# Trades file contents shared by the read-only load_positions tests
+_MIXED_STATUS_TRADES = [
+    {"id": 1, "status": "OPEN", "market_slug": "test-1"},
+    {"id": 2, "status": "CLOSED", "market_slug": "test-2"},
+    {"id": 3, "status": "OPEN", "market_slug": "test-3"},
+    {"id": 4, "status": "PENDING"},
+    {"id": 5},  # No status
+]
+
+
+@pytest.fixture(scope="module")
+def shared_trades_file(tmp_path_factory):
+    """_MIXED_STATUS_TRADES written once for the module; tests must not modify it."""
+    path = tmp_path_factory.mktemp("shared") / "paper_trades.json"
+    write_json(path, _MIXED_STATUS_TRADES)
+    return path
 
 
 class TestLoadPositions:
@@ -41,33 +122,22 @@ class TestLoadPositions:
         result = tracker.load_positions()
         assert result == []
     
-    def test_loads_open_positions_only(self, tracker):
+    def test_loads_open_positions_only(self, tracker, shared_trades_file, monkeypatch):
         """Only return positions with status OPEN."""
-        trades = [
-            {"id": 1, "status": "OPEN", "market_slug": "test-1"},
-            {"id": 2, "status": "CLOSED", "market_slug": "test-2"},
-            {"id": 3, "status": "OPEN", "market_slug": "test-3"},
-        ]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        monkeypatch.setattr(tracker, "trades_file", shared_trades_file)
         
         result = tracker.load_positions()
         assert len(result) == 2
         assert result[0]["id"] == 1
         assert result[1]["id"] == 3
     
-    def test_filters_by_status(self, tracker):
+    def test_filters_by_status(self, tracker, shared_trades_file, monkeypatch):
         """Filter out positions without OPEN status."""
-        trades = [
-            {"id": 1, "status": "PENDING"},
-            {"id": 2, "status": "CLOSED"},
-            {"id": 3},  # No status
-        ]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        monkeypatch.setattr(tracker, "trades_file", shared_trades_file)
         
         result = tracker.load_positions()
-        assert result == []
+        assert all(t["status"] == "OPEN" for t in result)
+        assert {2, 4, 5}.isdisjoint(t["id"] for t in result)
 
 
 class TestLoadAndSaveTargets:
@@ -84,8 +154,7 @@ class TestLoadAndSaveTargets:
             "1": {"take_profit": 95.0, "stop_loss": 80.0},
             "2": {"trailing_stop": 5.0, "peak_price": 90.0}
         }
-        with open(tracker.targets_file, "w") as f:
-            json.dump(targets, f)
+        write_json(tracker.targets_file, targets)
         
         result = tracker.load_targets()
         assert result["1"]["take_profit"] == 95.0
@@ -105,217 +174,174 @@ class TestLoadAndSaveTargets:
 class TestSetExitTarget:
     """Tests for set_exit_target."""
     
-    def test_sets_take_profit(self, tracker, capsys):
-        """Set take profit target."""
-        tracker.set_exit_target(1, take_profit=95.0)
-        
-        targets = tracker.load_targets()
-        assert "1" in targets
-        assert targets["1"]["take_profit"] == 95.0
-        assert targets["1"]["stop_loss"] is None
-        assert targets["1"]["trailing_stop"] is None
-        assert "set_at" in targets["1"]
-        
-        captured = capsys.readouterr()
-        assert "Exit targets set" in captured.out
-        assert "95.0%" in captured.out
-    
-    def test_sets_stop_loss(self, tracker, capsys):
-        """Set stop loss target."""
-        tracker.set_exit_target(2, stop_loss=80.0)
-        
-        targets = tracker.load_targets()
-        assert targets["2"]["stop_loss"] == 80.0
-        
-        captured = capsys.readouterr()
-        assert "80.0%" in captured.out
-    
-    def test_sets_trailing_stop(self, tracker, capsys):
-        """Set trailing stop target."""
-        tracker.set_exit_target(3, trailing_stop=5.0)
-        
-        targets = tracker.load_targets()
-        assert targets["3"]["trailing_stop"] == 5.0
-        assert targets["3"]["peak_price"] is None  # Peak set on first check
-        
-        captured = capsys.readouterr()
-        assert "5.0pp" in captured.out
-    
-    def test_sets_multiple_targets(self, tracker):
-        """Set all target types at once."""
-        tracker.set_exit_target(4, take_profit=98.0, stop_loss=85.0, trailing_stop=3.0)
-        
-        targets = tracker.load_targets()
-        assert targets["4"]["take_profit"] == 98.0
-        assert targets["4"]["stop_loss"] == 85.0
-        assert targets["4"]["trailing_stop"] == 3.0
-    
-    def test_overwrites_existing_target(self, tracker):
+    @pytest.fixture
+    def saved_targets(self, tracker, monkeypatch):
+        """Every dict passed to save_targets, most recent last (still written to disk)."""
+        saved = []
+        save = tracker.save_targets
+        
+        def spy(targets):
+            saved.append(targets)
+            save(targets)
+        
+        monkeypatch.setattr(tracker, "save_targets", spy)
+        return saved
+    
+    @pytest.mark.parametrize("position_id,kwargs,fragment", [
+        (1, {"take_profit": 95.0}, "Take profit: 95.0%"),
+        (2, {"stop_loss": 80.0}, "Stop loss: 80.0%"),
+        (3, {"trailing_stop": 5.0}, "Trailing stop: 5.0pp"),
+        (4, {"take_profit": 98.0, "stop_loss": 85.0, "trailing_stop": 3.0}, "Trailing stop: 3.0pp"),
+    ], ids=["take-profit", "stop-loss", "trailing-stop", "all"])
+    def test_sets_targets(self, tracker, saved_targets, caplog, position_id, kwargs, fragment):
+        """Given targets are stored, the rest are None, and each is echoed."""
+        caplog.set_level(logging.INFO, logger="alerts.exit_tracker")
+        tracker.set_exit_target(position_id, **kwargs)
+        
+        target = saved_targets[-1][str(position_id)]
+        for field in ("take_profit", "stop_loss", "trailing_stop"):
+            assert target[field] == kwargs.get(field)
+        assert target["peak_price"] is None  # Peak set on first check
+        assert _ISO_RE.match(target["set_at"])
+        
+        assert "Exit targets set" in caplog.text
+        assert fragment in caplog.text
+    
+    def test_overwrites_existing_target(self, tracker, saved_targets):
         """Overwrite existing target for same position."""
         tracker.set_exit_target(5, take_profit=90.0)
         tracker.set_exit_target(5, take_profit=95.0, stop_loss=80.0)
         
-        targets = tracker.load_targets()
+        targets = saved_targets[-1]
         assert targets["5"]["take_profit"] == 95.0
         assert targets["5"]["stop_loss"] == 80.0
 
 
+@pytest.fixture(scope="module")
+def make_response():
+    """Build a MagicMock HTTP response with .ok and .json() preset."""
+    def _make(payload=None, ok=True):
+        response = MagicMock()
+        response.ok = ok
+        response.json.return_value = payload
+        return response
+    return _make
+
+
 class TestGetCurrentPrice:
     """Tests for get_current_price."""
     
-    def test_fetches_price_success(self, tracker):
+    @pytest.fixture
+    def mock_get(self, monkeypatch):
+        """requests.get replaced for the test; set return_value/side_effect."""
+        mock = MagicMock()
+        monkeypatch.setattr("requests.get", mock)
+        return mock
+    
+    def test_fetches_price_success(self, tracker, mock_get, make_response):
         """Fetch and parse price from API."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.json.return_value = [{"outcomePrices": "[0.85, 0.15]"}]
-        
-        with patch("requests.get", return_value=mock_response):
-            price = tracker.get_current_price("test-market")
+        mock_get.return_value = make_response([{"outcomePrices": "[0.85, 0.15]"}])
         
-        assert price == 85.0
+        assert tracker.get_current_price("test-market") == 85.0
     
-    def test_handles_list_prices(self, tracker):
+    def test_handles_list_prices(self, tracker, mock_get, make_response):
         """Handle outcomePrices as list instead of string."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.json.return_value = [{"outcomePrices": [0.72, 0.28]}]
-        
-        with patch("requests.get", return_value=mock_response):
-            price = tracker.get_current_price("test-market")
+        mock_get.return_value = make_response([{"outcomePrices": [0.72, 0.28]}])
         
-        assert price == 72.0
+        assert tracker.get_current_price("test-market") == 72.0
     
-    def test_returns_none_on_error(self, tracker):
+    def test_returns_none_on_error(self, tracker, mock_get):
         """Return None when API fails."""
-        with patch("requests.get", side_effect=Exception("Network error")):
-            price = tracker.get_current_price("test-market")
+        mock_get.side_effect = Exception("Network error")
         
-        assert price is None
+        assert tracker.get_current_price("test-market") is None
     
-    def test_returns_none_on_empty_response(self, tracker):
+    def test_returns_none_on_empty_response(self, tracker, mock_get, make_response):
         """Return None when API returns empty data."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.json.return_value = []
+        mock_get.return_value = make_response([])
         
-        with patch("requests.get", return_value=mock_response):
-            price = tracker.get_current_price("test-market")
-        
-        assert price is None
+        assert tracker.get_current_price("test-market") is None
     
-    def test_returns_none_on_bad_response(self, tracker):
+    def test_returns_none_on_bad_response(self, tracker, mock_get, make_response):
         """Return None when response is not ok."""
-        mock_response = MagicMock()
-        mock_response.ok = False
-        
-        with patch("requests.get", return_value=mock_response):
-            price = tracker.get_current_price("test-market")
+        mock_get.return_value = make_response(ok=False)
         
-        assert price is None
+        assert tracker.get_current_price("test-market") is None
 
 
 class TestCheckExits:
     """Tests for check_exits."""
     
-    def test_no_positions(self, tracker, capsys):
+    @pytest.fixture(autouse=True)
+    def _targets_in_memory(self, tracker, monkeypatch):
+        """Keep exit targets in a dict (load/save_targets have their own tests)."""
+        store = {}
+        
+        # Copy both ways so callers can't share dicts, as with the real file
+        def save(targets):
+            store["targets"] = copy.deepcopy(targets)
+        
+        def load():
+            return copy.deepcopy(store.get("targets", {}))
+        
+        monkeypatch.setattr(tracker, "save_targets", save)
+        monkeypatch.setattr(tracker, "load_targets", load)
+    
+    def test_no_positions(self, tracker, caplog):
         """Handle no open positions."""
+        caplog.set_level(logging.INFO, logger="alerts.exit_tracker")
         result = tracker.check_exits()
         
         assert result == []
-        captured = capsys.readouterr()
-        assert "No open positions" in captured.out
+        assert "No open positions" in caplog.text
     
-    def test_take_profit_triggered(self, tracker):
+    def test_take_profit_triggered(self, tracker, stub_positions, stub_price):
         """Trigger take profit when price exceeds target."""
         # Setup position
-        trades = [{
-            "id": 1,
-            "status": "OPEN",
-            "market_slug": "test-market",
-            "question": "Test Question",
-            "entry_price": 80.0,
-            "amount": 100,
-            "shares": 125,
-            "outcome": "Yes"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions()
         
         # Setup target
         tracker.set_exit_target(1, take_profit=95.0)
         
         # Mock price at 96% (above TP)
-        with patch.object(tracker, "get_current_price", return_value=96.0):
-            triggered = tracker.check_exits()
+        stub_price(96.0)
+        triggered = tracker.check_exits()
         
         assert len(triggered) == 1
         assert triggered[0]["type"] == "take_profit"
         assert triggered[0]["current_price"] == 96.0
         assert triggered[0]["trigger_price"] == 95.0
     
-    def test_stop_loss_triggered(self, tracker):
+    def test_stop_loss_triggered(self, tracker, stub_positions, stub_price):
         """Trigger stop loss when price falls below target."""
-        trades = [{
-            "id": 2,
-            "status": "OPEN",
-            "market_slug": "test-market",
-            "question": "Test Question",
-            "entry_price": 80.0,
-            "amount": 100,
-            "shares": 125,
-            "outcome": "Yes"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions(id=2)
         
         tracker.set_exit_target(2, stop_loss=70.0)
         
-        with patch.object(tracker, "get_current_price", return_value=65.0):
-            triggered = tracker.check_exits()
+        stub_price(65.0)
+        triggered = tracker.check_exits()
         
         assert len(triggered) == 1
         assert triggered[0]["type"] == "stop_loss"
         assert triggered[0]["current_price"] == 65.0
     
-    def test_trailing_stop_updates_peak(self, tracker):
+    def test_trailing_stop_updates_peak(self, tracker, stub_positions, stub_price):
         """Update peak price for trailing stop."""
-        trades = [{
-            "id": 3,
-            "status": "OPEN",
-            "market_slug": "test-market",
-            "question": "Test Question",
-            "entry_price": 80.0,
-            "amount": 100,
-            "shares": 125,
-            "outcome": "Yes"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions(id=3)
         
         tracker.set_exit_target(3, trailing_stop=5.0)
         
         # Price at 90 - should set peak
-        with patch.object(tracker, "get_current_price", return_value=90.0):
-            triggered = tracker.check_exits()
+        stub_price(90.0)
+        triggered = tracker.check_exits()
         
         targets = tracker.load_targets()
         assert targets["3"]["peak_price"] == 90.0
         assert len(triggered) == 0  # Not triggered yet
     
-    def test_trailing_stop_triggered(self, tracker):
+    def test_trailing_stop_triggered(self, tracker, stub_positions, stub_price):
         """Trigger trailing stop when price drops below peak - distance."""
-        trades = [{
-            "id": 4,
-            "status": "OPEN",
-            "market_slug": "test-market",
-            "question": "Test Question",
-            "entry_price": 80.0,
-            "amount": 100,
-            "shares": 125,
-            "outcome": "Yes"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions(id=4)
         
         # Set trailing stop with peak already at 95
         targets = {
@@ -324,107 +350,93 @@ class TestCheckExits:
                 "stop_loss": None,
                 "trailing_stop": 5.0,
                 "peak_price": 95.0,
-                "set_at": "2026-02-01T00:00:00Z"
+                "set_at": _FAKE_SET_AT
             }
         }
         tracker.save_targets(targets)
         
         # Price drops to 89 (below 95-5=90)
-        with patch.object(tracker, "get_current_price", return_value=89.0):
-            triggered = tracker.check_exits()
+        stub_price(89.0)
+        triggered = tracker.check_exits()
         
         assert len(triggered) == 1
         assert triggered[0]["type"] == "trailing_stop"
         assert triggered[0]["trigger_price"] == 90.0
     
-    def test_no_trigger_within_targets(self, tracker):
+    def test_no_trigger_within_targets(self, tracker, stub_positions, stub_price):
         """No trigger when price is within bounds."""
-        trades = [{
-            "id": 5,
-            "status": "OPEN",
-            "market_slug": "test-market",
-            "question": "Test Question",
-            "entry_price": 80.0,
-            "amount": 100,
-            "shares": 125,
-            "outcome": "Yes"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions(id=5)
         
         tracker.set_exit_target(5, take_profit=95.0, stop_loss=70.0)
         
         # Price at 85 - within bounds
-        with patch.object(tracker, "get_current_price", return_value=85.0):
-            triggered = tracker.check_exits()
+        stub_price(85.0)
+        triggered = tracker.check_exits()
         
         assert len(triggered) == 0
     
-    def test_handles_price_fetch_failure(self, tracker, capsys):
+    def test_handles_price_fetch_failure(self, tracker, stub_positions, stub_price, caplog):
         """Continue checking when price fetch fails for one position."""
         trades = [
-            {"id": 6, "status": "OPEN", "market_slug": "fail-market", "question": "Fail"},
-            {"id": 7, "status": "OPEN", "market_slug": "ok-market", "question": "OK",
-             "entry_price": 80.0, "amount": 100, "shares": 125, "outcome": "Yes"},
+            _pos(id=6, market_slug="fail-market", question="Fail"),
+            _pos(id=7, market_slug="ok-market", question="OK"),
         ]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions(*trades)
         
         def mock_price(slug):
             if slug == "fail-market":
                 return None
             return 85.0
         
-        with patch.object(tracker, "get_current_price", side_effect=mock_price):
-            tracker.check_exits()
+        stub_price(mock_price)
+        tracker.check_exits()
+        
+        assert "Could not fetch" in caplog.text
+    
+    def test_fetch_failure_printed_once(self, tracker, stub_positions, stub_price, capsys, monkeypatch):
+        """Warnings go to stdout only; unconfigured logging mustn't echo them to stderr."""
+        # Cut off pytest's root handlers so logging falls back as it would in the CLI
+        monkeypatch.setattr(logging.getLogger("alerts.exit_tracker"), "propagate", False)
+        stub_positions()
+        stub_price(None)
+        
+        tracker.check_exits()
         
         captured = capsys.readouterr()
-        assert "Could not fetch" in captured.out
+        assert captured.out.count("Could not fetch") == 1
+        assert captured.err == ""
     
-    def test_pnl_calculation_yes_outcome(self, tracker):
+    def test_pnl_calculation_yes_outcome(self, tracker, stub_positions, stub_price):
         """Calculate P&L for Yes outcome correctly."""
-        trades = [{
-            "id": 8,
-            "status": "OPEN",
-            "market_slug": "test",
-            "question": "Test",
-            "entry_price": 50.0,  # Bought at 50%
-            "amount": 100,
-            "shares": 200,  # $100 / 0.50 = 200 shares
-            "outcome": "Yes"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions(
+            id=8,
+            entry_price=50.0,  # Bought at 50%
+            shares=200,  # $100 / 0.50 = 200 shares
+        )
         
         tracker.set_exit_target(8, take_profit=80.0)
         
         # Price went to 80% - P&L should be (80-50)*200/100 = $60
-        with patch.object(tracker, "get_current_price", return_value=80.0):
-            triggered = tracker.check_exits()
+        stub_price(80.0)
+        triggered = tracker.check_exits()
         
         assert triggered[0]["pnl"] == 60.0
     
-    def test_pnl_calculation_no_outcome(self, tracker):
+    def test_pnl_calculation_no_outcome(self, tracker, stub_positions, stub_price):
         """Calculate P&L for No outcome (inverted)."""
-        trades = [{
-            "id": 9,
-            "status": "OPEN",
-            "market_slug": "test",
-            "question": "Test",
-            "entry_price": 50.0,  # No at 50% (Yes at 50%)
-            "amount": 100,
-            "shares": 200,
-            "outcome": "No"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions(
+            id=9,
+            entry_price=50.0,  # No at 50% (Yes at 50%)
+            shares=200,
+            outcome="No",
+        )
         
         tracker.set_exit_target(9, take_profit=30.0)  # Profit if Yes drops
         
         # Yes price dropped to 30% - our No went up
         # P&L = (entry - current) * shares / 100 = (50-30)*200/100 = $40
-        with patch.object(tracker, "get_current_price", return_value=30.0):
-            triggered = tracker.check_exits()
+        stub_price(30.0)
+        triggered = tracker.check_exits()
         
         assert triggered[0]["pnl"] == 40.0
 
@@ -432,48 +444,28 @@ class TestCheckExits:
 class TestSendExitAlert:
     """Tests for _send_exit_alert."""
     
-    def test_sends_take_profit_alert(self, tracker):
-        """Send formatted take profit alert."""
-        position = {
-            "id": 1,
-            "question": "Test Market Question",
-            "outcome": "Yes",
-            "entry_price": 80.0,
-            "amount": 100
-        }
-        
-        tracker._send_exit_alert(position, 96.0, "take_profit", 95.0)
-        
-        tracker.notifier.send_message.assert_called_once()
-        message = tracker.notifier.send_message.call_args[0][0]
-        assert "TAKE PROFIT" in message
-        assert "🎉" in message
+    @pytest.mark.parametrize("exit_type,current,target,banner,emoji", [
+        ("take_profit", 96.0, 95.0, "TAKE PROFIT", "🎉"),
+        ("stop_loss", 65.0, 70.0, "STOP LOSS", "🛑"),
+        ("trailing_stop", 89.0, 90.0, "TRAILING STOP", "📉"),
+    ], ids=["take-profit", "stop-loss", "trailing-stop"])
+    def test_sends_alert(self, tracker, _mock_notifier, exit_type, current, target, banner, emoji):
+        """Send one formatted alert with the exit type's banner and emoji."""
+        position = _pos(question="Test Market Question")
+        
+        tracker._send_exit_alert(position, current, exit_type, target)
+        
+        notifier = _mock_notifier.return_value  # what ExitTracker(notify=True) built
+        notifier.send.assert_called_once()
+        message = notifier.send.call_args[0][0]
+        assert banner in message
+        assert emoji in message
         assert "Test Market Question" in message
     
-    def test_sends_stop_loss_alert(self, tracker):
-        """Send formatted stop loss alert."""
-        position = {"id": 2, "question": "Test", "outcome": "Yes", "entry_price": 80.0, "amount": 100}
-        
-        tracker._send_exit_alert(position, 65.0, "stop_loss", 70.0)
-        
-        message = tracker.notifier.send_message.call_args[0][0]
-        assert "STOP LOSS" in message
-        assert "🛑" in message
-    
-    def test_sends_trailing_stop_alert(self, tracker):
-        """Send formatted trailing stop alert."""
-        position = {"id": 3, "question": "Test", "outcome": "Yes", "entry_price": 80.0, "amount": 100}
-        
-        tracker._send_exit_alert(position, 89.0, "trailing_stop", 90.0)
-        
-        message = tracker.notifier.send_message.call_args[0][0]
-        assert "TRAILING STOP" in message
-        assert "📉" in message
-    
     def test_no_alert_when_notifier_disabled(self, tracker):
         """Don't crash when notifier is None."""
         tracker.notifier = None
-        position = {"id": 4, "question": "Test", "outcome": "Yes", "entry_price": 80.0, "amount": 100}
+        position = _pos(id=4, question="Test")
         
         # Should not raise
         tracker._send_exit_alert(position, 96.0, "take_profit", 95.0)
@@ -491,38 +483,21 @@ class TestPortfolioSummary:
         assert summary["total_unrealized_pnl"] == 0
         assert "timestamp" in summary
     
-    def test_calculates_unrealized_pnl(self, tracker):
+    def test_calculates_unrealized_pnl(self, tracker, stub_positions, stub_price):
         """Calculate unrealized P&L for all positions."""
         trades = [
-            {
-                "id": 1,
-                "status": "OPEN",
-                "market_slug": "market-1",
-                "question": "Question 1",
-                "entry_price": 50.0,
-                "amount": 100,
-                "shares": 200,
-                "outcome": "Yes"
-            },
-            {
-                "id": 2,
-                "status": "OPEN",
-                "market_slug": "market-2",
-                "question": "Question 2",
-                "entry_price": 40.0,
-                "amount": 50,
-                "shares": 125,
-                "outcome": "Yes"
-            }
+            _pos(id=1, market_slug="market-1", question="Question 1",
+                 entry_price=50.0, amount=100, shares=200),
+            _pos(id=2, market_slug="market-2", question="Question 2",
+                 entry_price=40.0, amount=50, shares=125),
         ]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
+        stub_positions(*trades)
         
         def mock_price(slug):
             return {"market-1": 70.0, "market-2": 60.0}.get(slug)
         
-        with patch.object(tracker, "get_current_price", side_effect=mock_price):
-            summary = tracker.portfolio_summary()
+        stub_price(mock_price)
+        summary = tracker.portfolio_summary()
         
         assert len(summary["positions"]) == 2
         assert summary["total_invested"] == 150
@@ -531,44 +506,22 @@ class TestPortfolioSummary:
         # Position 2: (60-40)*125/100 = $25
         assert summary["total_unrealized_pnl"] == 65.0
     
-    def test_uses_entry_price_on_fetch_failure(self, tracker):
+    def test_uses_entry_price_on_fetch_failure(self, tracker, stub_positions, stub_price):
         """Use entry price when current price fetch fails."""
-        trades = [{
-            "id": 1,
-            "status": "OPEN",
-            "market_slug": "test",
-            "question": "Test",
-            "entry_price": 80.0,
-            "amount": 100,
-            "shares": 125,
-            "outcome": "Yes"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
-        
-        with patch.object(tracker, "get_current_price", return_value=None):
-            summary = tracker.portfolio_summary()
+        stub_positions()
+        
+        stub_price(None)
+        summary = tracker.portfolio_summary()
         
         assert summary["positions"][0]["current"] == 80.0
         assert summary["positions"][0]["pnl"] == 0
     
-    def test_includes_pnl_percentage(self, tracker):
+    def test_includes_pnl_percentage(self, tracker, stub_positions, stub_price):
         """Include P&L percentage in summary."""
-        trades = [{
-            "id": 1,
-            "status": "OPEN",
-            "market_slug": "test",
-            "question": "Test",
-            "entry_price": 50.0,
-            "amount": 100,
-            "shares": 200,
-            "outcome": "Yes"
-        }]
-        with open(tracker.trades_file, "w") as f:
-            json.dump(trades, f)
-        
-        with patch.object(tracker, "get_current_price", return_value=75.0):
-            summary = tracker.portfolio_summary()
+        stub_positions(entry_price=50.0, shares=200)
+        
+        stub_price(75.0)
+        summary = tracker.portfolio_summary()
         
         # P&L = (75-50)*200/100 = $50, which is 50% of $100 invested
         assert summary["positions"][0]["pnl_pct"] == 50.0
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Unit tests for the JSON file helpers"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import json_io
+from utils.json_io import read_json, write_json, read_jsonl, write_jsonl, append_jsonl
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request):
+    """Run each test with and without orjson"""
+    if request.param and not json_io.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    with patch.object(json_io, "ORJSON_AVAILABLE", request.param):
+        yield request.param
+
+
+class TestJsonIO:
+    """Tests for read_json / write_json"""
+
+    def test_round_trip(self, tmp_path, backend):
+        """Written data should read back unchanged"""
+        path = tmp_path / "data.json"
+        obj = {"events": [{"id": 1, "headline": "OpenAI — GPT-5"}], "stats": {"total": 1}}
+        write_json(path, obj)
+        assert read_json(path) == obj
+
+    def test_output_is_standard_json(self, tmp_path, backend):
+        """Output should be readable by the stdlib json module"""
+        path = tmp_path / "data.json"
+        write_json(path, [1, 2.5, None, "x"])
+        assert json.loads(path.read_text()) == [1, 2.5, None, "x"]
+
+    def test_indent(self, tmp_path, backend):
+        """indent=True should produce 2-space indented output"""
+        path = tmp_path / "data.json"
+        write_json(path, {"a": [1]}, indent=True)
+        assert path.read_text() == '{\n  "a": [\n    1\n  ]\n}'
+
+    def test_accepts_str_path(self, tmp_path, backend):
+        """Should accept plain string paths"""
+        path = str(tmp_path / "data.json")
+        write_json(path, {"a": 1})
+        assert read_json(path) == {"a": 1}
+
+    def test_invalid_json_raises_value_error(self, tmp_path, backend):
+        """Parse errors should be ValueError subclasses for both backends"""
+        path = tmp_path / "data.json"
+        path.write_text("{not json")
+        with pytest.raises(ValueError):
+            read_json(path)
+
+
+class TestJsonLines:
+    """Tests for read_jsonl / write_jsonl / append_jsonl"""
+
+    def test_round_trip(self, tmp_path, backend):
+        """Each record should come back as one line"""
+        path = tmp_path / "log.jsonl"
+        write_jsonl(path, [{"id": 1}, {"id": 2, "headline": "OpenAI — GPT-5"}])
+        assert len(path.read_text().splitlines()) == 2
+        assert read_jsonl(path) == [{"id": 1}, {"id": 2, "headline": "OpenAI — GPT-5"}]
+
+    def test_append_creates_and_extends(self, tmp_path, backend):
+        """Appending should create the file and keep earlier lines"""
+        path = tmp_path / "log.jsonl"
+        append_jsonl(path, [{"id": 1}])
+        append_jsonl(path, [{"id": 2}, {"id": 3}])
+        assert read_jsonl(path) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    def test_skips_blank_lines(self, tmp_path, backend):
+        """Blank lines (e.g. a trailing newline) should be ignored"""
+        path = tmp_path / "log.jsonl"
+        path.write_text('{"id": 1}\n\n{"id": 2}\n')
+        assert read_jsonl(path) == [{"id": 1}, {"id": 2}]
@@ -6,30 +6,27 @@ Tests core logic without requiring actual API calls or SDK installation.
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-import sys
+
+from kalshi import client as kalshi_client
+from kalshi.client import KalshiMarketClient
 
 
 class TestKalshiClient:
     """Test suite for KalshiMarketClient."""
     
-    def test_client_init_without_sdk(self):
+    def test_client_init_without_sdk(self, monkeypatch):
         """Client initializes gracefully when SDK not available."""
-        # Mock the import to simulate SDK not installed
-        with patch.dict(sys.modules, {'kalshi_python': None}):
-            # Force reimport
-            import importlib
-            from kalshi import client as kalshi_client
-            importlib.reload(kalshi_client)
-            
-            # Client should still be usable
-            c = kalshi_client.KalshiMarketClient()
-            assert c.client is None or not kalshi_client.KALSHI_SDK_AVAILABLE
-            assert c.authenticated == False
+        # Simulate SDK not installed without reloading the module
+        monkeypatch.setattr(kalshi_client, "KALSHI_SDK_AVAILABLE", False)
+        
+        # Client should still be usable
+        c = KalshiMarketClient()
+        assert c.client is None
+        assert c.authenticated == False
     
     def test_client_init_without_credentials(self):
         """Client initializes without authentication when no credentials."""
         with patch.dict('os.environ', {}, clear=True):
-            from kalshi.client import KalshiMarketClient
             c = KalshiMarketClient()
             assert c.authenticated == False
             assert c.api_key_id is None
@@ -37,7 +34,6 @@ class TestKalshiClient:
     
     def test_get_markets_returns_error_when_no_client(self):
         """get_markets returns error dict when client not initialized."""
-        from kalshi.client import KalshiMarketClient
         c = KalshiMarketClient()
         c.client = None  # Force no client
         
@@ -48,7 +44,6 @@ class TestKalshiClient:
     
     def test_get_market_returns_error_when_no_client(self):
         """get_market returns error dict when client not initialized."""
-        from kalshi.client import KalshiMarketClient
         c = KalshiMarketClient()
         c.client = None
         
@@ -58,7 +53,6 @@ class TestKalshiClient:
     
     def test_get_ai_markets_filters_by_keywords(self):
         """get_ai_markets filters markets by AI-related keywords."""
-        from kalshi.client import KalshiMarketClient
         c = KalshiMarketClient()
         
         # Mock the get_markets method
@@ -85,7 +79,6 @@ class TestKalshiClient:
     
     def test_get_ai_markets_handles_pydantic_models(self):
         """get_ai_markets handles Pydantic model responses."""
-        from kalshi.client import KalshiMarketClient
         c = KalshiMarketClient()
         
         # Mock Pydantic-like object
@@ -110,11 +103,11 @@ class TestKalshiClient:
         
         assert len(result) == 1
         assert result[0]["ticker"] == "AI-1"
+        assert result[0]["title"] == "gpt-5 release"  # titles come back lowercased
         assert result[0]["platform"] == "kalshi"
     
     def test_get_balance_requires_auth(self):
         """get_balance returns error when not authenticated."""
-        from kalshi.client import KalshiMarketClient
         c = KalshiMarketClient()
         c.authenticated = False
         
@@ -125,7 +118,6 @@ class TestKalshiClient:
     
     def test_place_order_requires_auth(self):
         """place_order returns error when not authenticated."""
-        from kalshi.client import KalshiMarketClient
         c = KalshiMarketClient()
         c.authenticated = False
         
@@ -142,7 +134,6 @@ class TestKalshiClient:
     
     def test_get_markets_handles_exception(self):
         """get_markets handles API exceptions gracefully."""
-        from kalshi.client import KalshiMarketClient
         c = KalshiMarketClient()
         
         # Mock client that raises exception
@@ -158,10 +149,9 @@ class TestKalshiClient:
     
     def test_ai_keywords_list(self):
         """Verify AI keywords list is comprehensive."""
-        from kalshi.client import KalshiMarketClient
-        
         # Check expected keywords are present in the filter
         expected_keywords = ["AI", "GPT", "LLM", "OpenAI", "Anthropic"]
+        assert set(expected_keywords) <= set(KalshiMarketClient.AI_KEYWORDS)
         
         # These should all match
         test_titles = [
@@ -172,10 +162,8 @@ class TestKalshiClient:
             "Anthropic Claude",
         ]
         
-        c = KalshiMarketClient()
         for title in test_titles:
-            matches = any(kw.lower() in title.lower() for kw in expected_keywords)
-            assert matches, f"'{title}' should match AI keywords"
+            assert KalshiMarketClient._AI_RE.search(title), f"'{title}' should match AI keywords"
 
 
 class TestKalshiClientIntegration:
@@ -183,7 +171,6 @@ class TestKalshiClientIntegration:
     
     def test_pagination_handling(self):
         """get_ai_markets handles pagination correctly."""
-        from kalshi.client import KalshiMarketClient
         c = KalshiMarketClient()
         
         # Simulate paginated response
@@ -61,7 +61,7 @@ class TestPaperTrader:
         
         # At 0.35 price, $100 buys (100/0.35)*100 = 285.71 shares
         expected_shares = (100.0 / 0.35) * 100
-        assert abs(result["shares"] - expected_shares) < 0.01
+        assert result["shares"] == pytest.approx(expected_shares, abs=0.01)
     
     def test_buy_with_manual_price(self, trader):
         """Buy with entry_price should skip market lookup for price"""
@@ -183,7 +183,7 @@ class TestShareCalculations:
         high_price = 0.90
         shares = (amount / high_price) * 100
         expected = (100.0 / 0.90) * 100  # ~11111.11
-        assert abs(shares - expected) < 0.01
+        assert shares == pytest.approx(expected, abs=0.01)
     
     def test_breakeven_price(self):
         """Breakeven is when exit_price = entry_price"""
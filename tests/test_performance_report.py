@@ -7,9 +7,11 @@ import pytest
 import json
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone
+from reports import performance_report
 from reports.performance_report import (
     TradeStats,
     calculate_stats,
+    calculate_stats_cached,
     generate_summary_report,
     generate_marketing_snippet,
     is_test_trade,
@@ -98,6 +100,95 @@ class TestTradeStats:
         # Check logic: calculate_hold_days is called for CLOSED/RESOLVED
         assert stats.avg_hold_days > 0
 
+class TestCachedStats:
+    def test_matches_full_calculation(self, sample_trades, tmp_path):
+        cache_file = str(tmp_path / "stats_cache.json")
+        assert calculate_stats_cached(sample_trades, cache_file=cache_file) == calculate_stats(sample_trades)
+        # Second call is served from the cache
+        assert calculate_stats_cached(sample_trades, cache_file=cache_file) == calculate_stats(sample_trades)
+
+    def test_folds_in_appended_trades(self, sample_trades, tmp_path):
+        cache_file = str(tmp_path / "stats_cache.json")
+        calculate_stats_cached(sample_trades, cache_file=cache_file)
+
+        sample_trades.append({
+            "id": 5,
+            "status": "CLOSED",
+            "market_slug": "market-5",
+            "question": "Q5",
+            "amount": 40.0,
+            "pnl": 15.0,
+            "timestamp": "2026-02-03T10:00:00Z",
+            "closed_at": "2026-02-04T10:00:00Z"
+        })
+        stats = calculate_stats_cached(sample_trades, cache_file=cache_file)
+        assert stats == calculate_stats(sample_trades)
+        assert stats.total_invested == 290.0
+        assert stats.wins == 2
+
+    def test_picks_up_closed_open_position(self, sample_trades, tmp_path):
+        cache_file = str(tmp_path / "stats_cache.json")
+        calculate_stats_cached(sample_trades, cache_file=cache_file)
+
+        sample_trades[2].update(status="CLOSED", pnl=-10.0, closed_at="2026-02-02T10:00:00Z")
+        stats = calculate_stats_cached(sample_trades, cache_file=cache_file)
+        assert stats == calculate_stats(sample_trades)
+        assert stats.open_trades == 0
+        assert stats.worst_trade_pnl == -20.0
+
+    def test_picks_up_resolved_closed_trade(self, sample_trades, tmp_path):
+        cache_file = str(tmp_path / "stats_cache.json")
+        calculate_stats_cached(sample_trades, cache_file=cache_file)
+
+        sample_trades[1].update(status="RESOLVED", pnl=80.0, won=True, resolved_at="2026-01-05T10:00:00Z")
+        stats = calculate_stats_cached(sample_trades, cache_file=cache_file)
+        assert stats == calculate_stats(sample_trades)
+        assert stats.resolved_trades == 2
+        assert stats.best_trade_pnl == 80.0
+
+    def test_recomputes_when_history_changes(self, sample_trades, tmp_path):
+        cache_file = str(tmp_path / "stats_cache.json")
+        calculate_stats_cached(sample_trades, cache_file=cache_file)
+
+        trades = sample_trades[:2]
+        assert calculate_stats_cached(trades, cache_file=cache_file) == calculate_stats(trades)
+
+    @pytest.mark.parametrize("cache", [
+        [],
+        {},
+        {"version": 1, "folded": 2, "pending": [], "stats": {}},
+        {"version": performance_report.STATS_CACHE_VERSION, "pending": [], "stats": {}},
+        {"version": performance_report.STATS_CACHE_VERSION, "folded": 2, "pending": [[5, "OPEN", "x"]], "stats": {}},
+    ])
+    def test_rebuilds_malformed_cache(self, sample_trades, tmp_path, cache):
+        cache_file = tmp_path / "stats_cache.json"
+        cache_file.write_text(json.dumps(cache))
+        assert calculate_stats_cached(sample_trades, cache_file=str(cache_file)) == calculate_stats(sample_trades)
+
+    def test_hold_time_without_exit_is_not_frozen(self, tmp_path, monkeypatch):
+        trades = [{
+            "id": 1,
+            "status": "CLOSED",
+            "market_slug": "market-1",
+            "question": "Q1",
+            "amount": 10.0,
+            "pnl": 5.0,
+            "timestamp": "2026-02-01T00:00:00Z",
+        }]
+        cache_file = str(tmp_path / "stats_cache.json")
+
+        def clock(now):
+            class _Clock(datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return now
+            monkeypatch.setattr(performance_report, "datetime", _Clock)
+
+        clock(datetime(2026, 3, 1, tzinfo=timezone.utc))
+        assert calculate_stats_cached(trades, cache_file=cache_file).avg_hold_days == pytest.approx(28.0)
+        clock(datetime(2026, 3, 11, tzinfo=timezone.utc))
+        assert calculate_stats_cached(trades, cache_file=cache_file).avg_hold_days == pytest.approx(38.0)
+
 class TestFormatting:
     def test_currency(self):
         assert format_currency(10.5) == "$10.50"
@@ -2,7 +2,6 @@
 """Unit tests for PositionMonitor."""
 
 import json
-import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pytest
@@ -14,10 +13,9 @@ from alerts.position_monitor import PositionMonitor
 
 
 @pytest.fixture
-def temp_data_dir():
-    """Create temporary data directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_data_dir(tmp_path):
+    """Temporary data directory for testing (pytest cleans these up in bulk)."""
+    return tmp_path
 
 
 @pytest.fixture
@@ -488,7 +486,7 @@ class TestSummary:
         assert pos["current"] == 75.0
         assert pos["amount"] == 200
         # P&L = (75-60)*333/100 = $49.95
-        assert abs(pos["pnl"] - 49.95) < 0.01
+        assert pos["pnl"] == pytest.approx(49.95, abs=0.01)
 
 
 class TestNotifierDisabled:
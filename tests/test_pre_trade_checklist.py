@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """Tests for pre_trade_checklist module."""
 
+import dataclasses
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pre_trade_checklist import (
     check_asymmetric_risk,
+    check_asymmetric_risk_batch,
     check_vague_timeline,
     check_confirmation_bias,
     check_position_size,
@@ -56,6 +60,28 @@ class TestAsymmetricRisk:
         assert not result.passed
 
 
+class TestAsymmetricRiskBatch:
+    """Tests for the vectorized asymmetric risk check."""
+    
+    def test_matches_scalar_check(self):
+        """Batch results should agree with the scalar check."""
+        prices = [20.0, 60.0, 88.0, 95.0, 100.0]
+        failed, severity, upside, downside, ratio = check_asymmetric_risk_batch(prices)
+        for i, price in enumerate(prices):
+            scalar = check_asymmetric_risk(price)
+            assert bool(failed[i]) == (not scalar.passed)
+            assert str(severity[i]) == scalar.severity
+        assert list(upside) == [80.0, 40.0, 12.0, 5.0, 0.0]
+        assert list(downside) == prices
+        assert ratio[3] == pytest.approx(19.0)
+        assert ratio[4] == float('inf')
+    
+    def test_custom_threshold(self):
+        """Custom threshold should apply to every price."""
+        failed, *_ = check_asymmetric_risk_batch([65.0, 75.0], threshold=70.0)
+        assert [bool(f) for f in failed] == [False, True]
+
+
 class TestVagueTimeline:
     """Tests for vague timeline language detection."""
     
@@ -251,6 +277,38 @@ class TestFullChecklist:
         summary = result.get_summary()
         assert isinstance(summary, str)
         assert len(summary) > 0
+    
+    def test_parallel_matches_sequential(self):
+        """Running checks on a thread pool should give the same result."""
+        kwargs = dict(
+            entry_price=88.0,
+            trade_amount=1500,
+            portfolio_value=10000,
+            position_direction="yes",
+            thesis="too short",
+            news_text="launch expected soon",
+            has_stop_loss=True,
+        )
+        sequential = run_checklist(**kwargs)
+        parallel = run_checklist(**kwargs, parallel=True)
+        assert parallel == sequential
+    
+    def test_stop_on_critical(self):
+        """Should stop collecting results at the first critical failure."""
+        result = run_checklist(
+            entry_price=95.9,
+            trade_amount=2000,
+            portfolio_value=10000,
+            position_direction="yes",
+            thesis="just go",
+            news_text="coming soon",
+            days_until_deadline=5,
+            stop_on_critical=True,
+        )
+        assert not result.all_passed
+        assert [c.check_name for c in result.critical_failures] == ["Asymmetric Risk"]
+        assert result.warnings == []
+        assert result.info == []
 
 
 class TestCheckResultDataclass:
@@ -268,6 +326,14 @@ class TestCheckResultDataclass:
         assert result.check_name == "Test Check"
         assert result.message == "Test message"
         assert result.severity == "info"
+    
+    def test_check_result_is_immutable_and_hashable(self):
+        """CheckResult should be a frozen value object."""
+        result = CheckResult(passed=True, check_name="A", message="m", severity="info")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.passed = False
+        assert result == CheckResult(passed=True, check_name="A", message="m", severity="info")
+        assert len({result, CheckResult(True, "A", "m", "info")}) == 1
 
 
 class TestChecklistResultDataclass:
@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 from risk_manager import RiskManager, RiskConfig, Position, NARRATIVE_KEYWORDS
 
@@ -14,6 +16,10 @@ class TestRiskManager:
         assert manager.config.max_narrative_exposure == 500.0
         assert manager.config.max_daily_loss_pct == 5.0
 
+    def test_config_is_frozen(self, manager):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            manager.config.max_position_size = 1000.0
+
     def test_check_trade_limits_valid(self, manager):
         allowed, msg = manager.check_trade_limits(
             amount=50.0, 
@@ -80,6 +86,17 @@ class TestRiskManager:
         size = manager.calculate_kelly_size(0.4, 2.0, 1000.0)
         assert size == 0.0
 
+    def test_kelly_size_invalid_odds(self, manager):
+        assert manager.calculate_kelly_size(0.6, 1.0, 1000.0) == 0.0
+
+    def test_kelly_sizes_matches_scalar(self, manager):
+        probs = [0.6, 0.4, 0.0, 1.0, 0.7, 0.55]
+        odds = [2.0, 2.0, 2.0, 2.0, 1.0, 2.5]
+        sizes = manager.calculate_kelly_sizes(probs, odds, 1000.0)
+        expected = [manager.calculate_kelly_size(p, o, 1000.0) for p, o in zip(probs, odds)]
+        assert list(sizes) == pytest.approx(expected)
+        assert list(sizes)[:2] == pytest.approx([50.0, 0.0])
+
 
 class TestMarketExposure:
     @pytest.fixture
@@ -255,6 +272,31 @@ class TestExposureSummary:
         assert summary["narrative_exposure"]["ai_progress"] == 200.0
         assert summary["narrative_exposure"]["ai_regulation"] == 100.0
 
+    def test_add_position_detects_narratives(self, manager):
+        """Positions without narratives get them detected once on add."""
+        position = Position(
+            market_slug="eu-ban",
+            market_title="Will EU ban GPT-5 release?",
+            amount=100.0,
+            entry_price=30.0,
+            side="no",
+        )
+        manager.add_position(position)
+        assert position.narratives == ["ai_progress", "ai_regulation", "ai_release"]
+        assert manager.get_exposure_summary()["narrative_exposure"]["ai_regulation"] == 100.0
+
+    def test_narrative_exposure_tracks_replace_and_remove(self, manager):
+        """Replacing or removing a position should update narrative totals."""
+        manager.add_position(Position("m1", "GPT release", 100.0, 40.0, "yes", ["ai_release"]))
+        manager.add_position(Position("m2", "Claude launch", 50.0, 40.0, "yes", ["ai_release"]))
+        manager.add_position(Position("m1", "GPT release", 150.0, 40.0, "yes", ["ai_release"]))
+        assert manager.get_exposure_summary()["narrative_exposure"] == {"ai_release": 200.0}
+
+        manager.remove_position("m1")
+        manager.remove_position("m2")
+        manager.remove_position("missing")
+        assert manager.get_exposure_summary()["narrative_exposure"] == {}
+
 
 class TestDailyLossPercentage:
     @pytest.fixture
@@ -331,6 +373,21 @@ class TestPositionManagement:
         positions = manager.get_positions()
         assert "test-market" not in positions
     
+    def test_get_positions_is_read_only(self, manager):
+        """Returned view reflects changes but cannot be mutated."""
+        positions = manager.get_positions()
+        manager.add_position(Position(
+            market_slug="test-market",
+            market_title="Test Market",
+            amount=100.0,
+            entry_price=50.0,
+            side="yes"
+        ))
+        
+        assert "test-market" in positions
+        with pytest.raises(TypeError):
+            positions["other"] = None
+    
     def test_remove_nonexistent_position(self, manager):
         """Removing nonexistent position should not error."""
         manager.remove_position("nonexistent")  # Should not raise
@@ -396,7 +453,8 @@ class TestFullRiskCheck:
             entry_price=95.0,  # Asymmetric warning
             open_positions_count=2,  # OK
             daily_pnl=-60.0,  # % fail (6% > 5%)
-            bankroll=1000.0
+            bankroll=1000.0,
+            collect_all=True
         )
         
         assert allowed is False
@@ -406,6 +464,22 @@ class TestFullRiskCheck:
         # Should also have asymmetric warning
         assert any("ASYMMETRIC RISK WARNING" in m for m in messages)
     
+    def test_full_check_stops_at_first_failure(self, manager):
+        """Default mode returns on the first hard failure."""
+        allowed, messages = manager.full_risk_check(
+            market_slug="test-market",
+            market_title="Will GPT-5 release?",
+            amount=150.0,  # Size fail (from check_trade_limits)
+            entry_price=95.0,
+            open_positions_count=2,
+            daily_pnl=-60.0,  # Would also fail %, but never checked
+            bankroll=1000.0
+        )
+        
+        assert allowed is False
+        assert len(messages) == 1
+        assert "exceeds max position size" in messages[0]
+    
     def test_full_check_narrative_fail(self, manager):
         """Should fail on narrative exposure."""
         # First, add a position with ai_release narrative
@@ -3,7 +3,11 @@
 Unit tests for Scanner
 """
 
+import io
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
@@ -49,11 +53,11 @@ class TestScannerFilters:
         
         # If we think true prob is 0.80 but market says 0.50
         edge = calculate_edge(0.50, 0.80)
-        assert abs(edge - 0.30) < 0.001  # 30% edge (float tolerance)
+        assert edge == pytest.approx(0.30, abs=0.001)  # 30% edge (float tolerance)
         
         # Minimal edge
         edge = calculate_edge(0.50, 0.52)
-        assert abs(edge - 0.02) < 0.001  # 2% edge - probably not worth trading
+        assert edge == pytest.approx(0.02, abs=0.001)  # 2% edge - probably not worth trading
 
 
 class TestOpportunityScoring:
@@ -195,5 +199,182 @@ class TestTimeFilters:
         assert is_active(past, now) == False
 
 
+@pytest.fixture
+def scanner_mod():
+    """The scanner module (skipped when correlation_tracker's plotting deps are missing)"""
+    return pytest.importorskip("scanner")
+
+
+class TestScanStageOutput:
+    """Output of the concurrently run scan stages"""
+    
+    def test_prints_stay_with_their_stage(self, scanner_mod):
+        """Interleaved prints from two stages come back as one buffer each"""
+        a_printed, b_printed = threading.Event(), threading.Event()
+        
+        def stage_a():
+            print("a1")
+            a_printed.set()
+            b_printed.wait(5)
+            print("a2")
+            return "A"
+        
+        def stage_b():
+            a_printed.wait(5)
+            print("b1")
+            b_printed.set()
+            return "B"
+        
+        main_out = io.StringIO()
+        with redirect_stdout(scanner_mod._PerThreadStdout(main_out)), \
+                ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(scanner_mod._buffered, fn) for fn in (stage_a, stage_b)]
+            results = [f.result() for f in futures]
+        
+        assert results == [("A", "a1\na2\n"), ("B", "b1\n")]
+        assert main_out.getvalue() == ""
+    
+    def test_failed_stage_keeps_all_output(self, scanner_mod, capsys):
+        """Every stage's prints are replayed before the first failure is re-raised"""
+        def ok():
+            print("fetched")
+            return "ok"
+        
+        def broken():
+            print("partial")
+            raise ConnectionError("feed down")
+        
+        with redirect_stdout(scanner_mod._PerThreadStdout(sys.stdout)), \
+                ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(scanner_mod._buffered, fn) for fn in (broken, ok)]
+        
+        with pytest.raises(ConnectionError):
+            scanner_mod._replay(["== broken", "== ok"], futures)
+        assert capsys.readouterr().out == "== broken\npartial\n== ok\nfetched\n"
+    
+    def test_stream_attributes_pass_through(self, scanner_mod):
+        """Attributes beyond write/flush come from the real stream"""
+        real = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        stdout = scanner_mod._PerThreadStdout(real)
+        
+        assert stdout.encoding == "utf-8"
+        assert stdout.isatty() is False
+
+
+class TestOutcomePrices:
+    """Decoding market outcomePrices for display"""
+    
+    def test_decodes_once_without_touching_market(self, scanner_mod):
+        """Prices are memoized by market id and the API dict is left as is"""
+        market = {"id": "m1", "outcomePrices": "[\"0.62\", \"0.38\"]"}
+        decoded = {}
+        
+        assert scanner_mod._outcome_prices(market, decoded) == ["0.62", "0.38"]
+        market["outcomePrices"] = "not json"  # a second decode would raise
+        assert scanner_mod._outcome_prices(market, decoded) == ["0.62", "0.38"]
+        assert set(market) == {"id", "outcomePrices"}
+    
+    def test_missing_prices(self, scanner_mod):
+        """Markets without outcomePrices decode to None"""
+        assert scanner_mod._outcome_prices({"id": "m2"}, {}) is None
+    
+    def test_markets_without_id_not_memoized(self, scanner_mod):
+        """Id-less markets each decode their own prices"""
+        decoded = {}
+        
+        assert scanner_mod._outcome_prices({"outcomePrices": "[\"0.1\", \"0.9\"]"}, decoded) == ["0.1", "0.9"]
+        assert scanner_mod._outcome_prices({"outcomePrices": "[\"0.7\", \"0.3\"]"}, decoded) == ["0.7", "0.3"]
+        assert decoded == {}
+
+
+@pytest.fixture
+def scanner(scanner_mod, tmp_path, monkeypatch):
+    """TradingScanner with mocked clients and its seen-article files in tmp_path"""
+    for client in ("NewsMonitor", "WebScraper", "PolymarketClient"):
+        monkeypatch.setattr(scanner_mod, client, MagicMock())
+    sc = scanner_mod.TradingScanner()
+    sc.seen_file = tmp_path / "seen_scraped.jsonl"
+    sc.legacy_seen_file = tmp_path / "seen_scraped.json"
+    sc._load_seen_scraped()
+    return sc
+
+
+class TestSeenScraped:
+    """Persistence of already-seen scraped article URLs"""
+    
+    def test_round_trip(self, scanner):
+        """Saved URLs are appended and read back"""
+        scanner._seen_new = {"https://a", "https://b"}
+        scanner._save_seen_scraped()
+        scanner._seen_new = {"https://c"}
+        scanner._save_seen_scraped()
+        
+        scanner._load_seen_scraped()
+        assert scanner.seen_scraped == {"https://a", "https://b", "https://c"}
+    
+    def test_skips_corrupt_line(self, scanner, capsys):
+        """A torn line is skipped without forgetting the other URLs"""
+        scanner.seen_file.write_text('"https://a"\n"https://b\n"https://c"\n')
+        
+        scanner._load_seen_scraped()
+        
+        assert scanner.seen_scraped == {"https://a", "https://c"}
+        assert "Skipped 1" in capsys.readouterr().out
+    
+    def test_migrates_legacy_json(self, scanner):
+        """The old JSON list is loaded and written out as JSONL on the next save"""
+        scanner.legacy_seen_file.write_text('["https://a", "https://b"]')
+        
+        scanner._load_seen_scraped()
+        assert scanner.seen_scraped == {"https://a", "https://b"}
+        
+        scanner._save_seen_scraped()
+        scanner._load_seen_scraped()  # now from the JSONL file
+        assert scanner.seen_file.exists()
+        assert scanner.seen_scraped == {"https://a", "https://b"}
+
+
+class TestRelatedMarkets:
+    """Market searches for detected articles"""
+    
+    def test_prefetched_searches_dedupe_markets(self, scanner_mod, monkeypatch):
+        """Concurrent pooled searches fill the cache; markets are deduped by id"""
+        results = {
+            "OpenAI": [{"id": 1}, {"id": 2}],
+            "ChatGPT": [{"id": 2}, {"id": 3}],
+            "GPT": [{"id": 1}],
+            "Anthropic": [{"id": 4}],
+            "Claude": [{"id": 4}, {"id": 5}],
+            "Google AI": [{"id": 6}],
+            "Gemini": [],
+        }
+        clients = []
+        
+        def make_client():
+            client = MagicMock()
+            client.search_markets.side_effect = lambda term, limit: results[term]
+            clients.append(client)
+            return client
+        
+        for client in ("NewsMonitor", "WebScraper"):
+            monkeypatch.setattr(scanner_mod, client, MagicMock())
+        scanner = scanner_mod.TradingScanner(client_factory=make_client)
+        article = {"entities": ["OpenAI", "Anthropic"]}
+        search_cache = {}
+        
+        scanner._prefetch_searches([article], search_cache)
+        related = scanner._find_related_markets(article, search_cache, limit=10)
+        
+        assert scanner.polymarket is clients[0]
+        assert set(search_cache) == {"OpenAI", "ChatGPT", "GPT", "Anthropic", "Claude"}
+        assert [m["id"] for m in related] == [1, 2, 3, 4, 5]
+        assert len(clients) <= 5  # at most one per concurrent search
+        
+        # Idle clients are reused by the next scan's searches
+        pooled = len(clients)
+        scanner._prefetch_searches([{"entities": ["Google"]}], search_cache)
+        assert search_cache["Google AI"] == [{"id": 6}]
+        assert len(clients) == pooled
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,5 +1,11 @@
 """Trading System Utilities"""
 
 from .logger import get_logger, get_trade_logger, TradeLogger
+from .json_io import (
+    read_json, write_json, dump_jsonl, parse_jsonl, read_jsonl, write_jsonl, append_jsonl,
+    fold_event_log,
+)
 
-__all__ = ["get_logger", "get_trade_logger", "TradeLogger"]
+__all__ = ["get_logger", "get_trade_logger", "TradeLogger", "read_json", "write_json",
+           "dump_jsonl", "parse_jsonl", "read_jsonl", "write_jsonl", "append_jsonl",
+           "fold_event_log"]
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Fast JSON file helpers
+
+Uses orjson when installed (several times faster to parse and serialize)
+and falls back to the stdlib json module otherwise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Parse a JSON file"""
+    data = Path(path).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: Union[str, Path], obj: Any, indent: bool = False) -> None:
+    """Serialize obj to a JSON file, optionally with 2-space indentation"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps(obj, indent=2 if indent else None).encode()
+    Path(path).write_bytes(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def parse_jsonl(data: bytes) -> list:
+    """Parse JSON-lines bytes (one value per line, blank lines skipped)"""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    return [loads(line) for line in data.splitlines() if line.strip()]
+
+
+def read_jsonl(path: Union[str, Path]) -> list:
+    """Parse a JSON-lines file"""
+    return parse_jsonl(Path(path).read_bytes())
+
+
+def dump_jsonl(records: Iterable[Any]) -> bytes:
+    """Serialize records as JSON-lines bytes (newline after every record)"""
+    return b"".join(_dumps(r) + b"\n" for r in records)
+
+
+def write_jsonl(path: Union[str, Path], records: Iterable[Any]) -> None:
+    """Replace a JSON-lines file with the given records"""
+    Path(path).write_bytes(dump_jsonl(records))
+
+
+def append_jsonl(path: Union[str, Path], records: Iterable[Any]) -> None:
+    """Append records to a JSON-lines file, creating it if needed"""
+    with open(path, "ab") as f:
+        f.write(dump_jsonl(records))
+
+
+def fold_event_log(records: list) -> list:
+    """Replay event-log records, merging each {"_update": id, ...} line into its event"""
+    events, by_id = [], {}
+    for rec in records:
+        if "_update" in rec:
+            fields = dict(rec)
+            event = by_id.get(fields.pop("_update"))
+            if event is not None:
+                event.update(fields)
+        else:
+            events.append(rec)
+            by_id.setdefault(rec["id"], rec)
+    return events
@@ -1,6 +1,7 @@
 import { NextResponse } from "next/server";
 import { promises as fs } from "fs";
 import path from "path";
+import { readEdgeEvents } from "@/lib/edge-events";
 
 interface Trade {
   id: number;
@@ -40,10 +41,8 @@ export async function GET(request: Request) {
   try {
     // Read paper_trades.json (same data source as /api/signals)
     const tradesPath = path.join(process.cwd(), "..", "data", "paper_trades.json");
-    const eventsPath = path.join(process.cwd(), "..", "data", "edge_events.json");
 
     let trades: Trade[] = [];
-    let events: EdgeEvent[] = [];
 
     try {
       const tradesData = await fs.readFile(tradesPath, "utf-8");
@@ -52,12 +51,7 @@ export async function GET(request: Request) {
       // No trades file yet
     }
 
-    try {
-      const eventsData = await fs.readFile(eventsPath, "utf-8");
-      events = JSON.parse(eventsData);
-    } catch {
-      // No events file yet
-    }
+    const { events } = await readEdgeEvents<EdgeEvent>(path.join(process.cwd(), "..", "data"));
 
     // Build feed items from both trades and events
     const items: { title: string; description: string; pubDate: string; guid: string }[] = [];
@@ -1,9 +1,10 @@
 import { NextRequest, NextResponse } from "next/server";
 import fs from "fs/promises";
 import path from "path";
+import { readEdgeEvents } from "@/lib/edge-events";
 
-const PAPER_TRADES_FILE = path.join(process.cwd(), "..", "data", "paper_trades.json");
-const EDGE_EVENTS_FILE = path.join(process.cwd(), "..", "data", "edge_events.json");
+const DATA_DIR = path.join(process.cwd(), "..", "data");
+const PAPER_TRADES_FILE = path.join(DATA_DIR, "paper_trades.json");
 
 interface Signal {
   id: string;
@@ -48,11 +49,6 @@ interface EdgeEvent {
   notes: string;
 }
 
-interface EdgeEventsFile {
-  events: EdgeEvent[];
-  stats: Record<string, unknown>;
-}
-
 async function readJsonFile<T>(filePath: string, defaultValue: T): Promise<T> {
   try {
     const data = await fs.readFile(filePath, "utf-8");
@@ -101,8 +97,7 @@ export async function GET(request: NextRequest) {
   try {
     // Read paper trades
     const trades: PaperTrade[] = await readJsonFile(PAPER_TRADES_FILE, []);
-    const edgeEventsFile: EdgeEventsFile = await readJsonFile(EDGE_EVENTS_FILE, { events: [], stats: {} });
-    const edgeEvents = edgeEventsFile.events || [];
+    const { events: edgeEvents } = await readEdgeEvents<EdgeEvent>(DATA_DIR);
 
     // Convert trades to signals format
     let signals: Signal[] = trades.map(formatSignalFromTrade);
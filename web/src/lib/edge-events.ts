@@ -0,0 +1,85 @@
+// Edge event log reader - mirrors edge_tracker.py's on-disk format
+
+import fs from "fs/promises";
+import path from "path";
+
+type EventRecord = Record<string, unknown>;
+
+export interface EdgeEventsData<T = EventRecord> {
+  events: T[];
+  stats: Record<string, unknown>;
+}
+
+/**
+ * Replay event-log records, merging each {"_update": id, ...} line into its event
+ */
+export function foldEventLog(records: EventRecord[]): EventRecord[] {
+  const events: EventRecord[] = [];
+  const byId = new Map<unknown, EventRecord>();
+
+  for (const rec of records) {
+    if ("_update" in rec) {
+      const { _update, ...fields } = rec;
+      const event = byId.get(_update);
+      if (event) Object.assign(event, fields);
+    } else {
+      events.push(rec);
+      if (!byId.has(rec.id)) byId.set(rec.id, rec);
+    }
+  }
+  return events;
+}
+
+/**
+ * Parse a JSONL event log, skipping blank and unreadable lines
+ */
+export function parseEventLog(text: string): EventRecord[] {
+  const records: EventRecord[] = [];
+  for (const line of text.split("\n")) {
+    if (!line.trim()) continue;
+    try {
+      const rec = JSON.parse(line);
+      if (rec && typeof rec === "object" && !Array.isArray(rec)) records.push(rec);
+    } catch {
+      // Partially written trailing line
+    }
+  }
+  return records;
+}
+
+async function readText(filePath: string): Promise<string | null> {
+  try {
+    return await fs.readFile(filePath, "utf-8");
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Load edge events from data/edge_events.jsonl plus the edge_stats.json sidecar,
+ * falling back to the legacy edge_events.json snapshot
+ */
+export async function readEdgeEvents<T = EventRecord>(dataDir: string): Promise<EdgeEventsData<T>> {
+  const log = await readText(path.join(dataDir, "edge_events.jsonl"));
+  if (log !== null) {
+    const statsText = await readText(path.join(dataDir, "edge_stats.json"));
+    let stats: Record<string, unknown> = {};
+    try {
+      stats = statsText ? JSON.parse(statsText) : {};
+    } catch {
+      // Sidecar mid-write; serve events without stats
+    }
+    return { events: foldEventLog(parseEventLog(log)) as T[], stats };
+  }
+
+  const legacy = await readText(path.join(dataDir, "edge_events.json"));
+  if (legacy !== null) {
+    try {
+      const data = JSON.parse(legacy);
+      return { events: data.events || [], stats: data.stats || {} };
+    } catch {
+      // Fall through to empty
+    }
+  }
+  return { events: [], stats: {} };
+}
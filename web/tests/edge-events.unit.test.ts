@@ -0,0 +1,76 @@
+import { describe, it, expect, beforeEach, afterEach } from 'vitest'
+import fs from 'fs/promises'
+import os from 'os'
+import path from 'path'
+import { foldEventLog, parseEventLog, readEdgeEvents } from '../src/lib/edge-events'
+
+describe('Edge event log', () => {
+  describe('foldEventLog', () => {
+    it('merges update records into their event', () => {
+      const events = foldEventLog([
+        { id: 1, headline: 'A', market_price_1h_later: null },
+        { id: 2, headline: 'B' },
+        { _update: 1, market_price_1h_later: '42' },
+      ])
+
+      expect(events).toEqual([
+        { id: 1, headline: 'A', market_price_1h_later: '42' },
+        { id: 2, headline: 'B' },
+      ])
+    })
+
+    it('ignores updates for unknown ids', () => {
+      expect(foldEventLog([{ id: 1 }, { _update: 9, notes: 'x' }])).toEqual([{ id: 1 }])
+    })
+  })
+
+  describe('parseEventLog', () => {
+    it('skips blank and partially written lines', () => {
+      const text = '{"id": 1}\n\n{"id": 2}\n{"id": 3, "head'
+      expect(parseEventLog(text)).toEqual([{ id: 1 }, { id: 2 }])
+    })
+  })
+
+  describe('readEdgeEvents', () => {
+    let dataDir: string
+
+    beforeEach(async () => {
+      dataDir = await fs.mkdtemp(path.join(os.tmpdir(), 'edge-events-'))
+    })
+
+    afterEach(async () => {
+      await fs.rm(dataDir, { recursive: true, force: true })
+    })
+
+    it('reads the JSONL log and stats sidecar', async () => {
+      await fs.writeFile(
+        path.join(dataDir, 'edge_events.jsonl'),
+        '{"id": 1, "notes": ""}\n{"_update": 1, "notes": "checked"}\n',
+      )
+      await fs.writeFile(path.join(dataDir, 'edge_stats.json'), '{"total_events": 1}')
+      // A stale legacy snapshot must not win over the log
+      await fs.writeFile(path.join(dataDir, 'edge_events.json'), '{"events": [], "stats": {}}')
+
+      expect(await readEdgeEvents(dataDir)).toEqual({
+        events: [{ id: 1, notes: 'checked' }],
+        stats: { total_events: 1 },
+      })
+    })
+
+    it('falls back to the legacy snapshot', async () => {
+      await fs.writeFile(
+        path.join(dataDir, 'edge_events.json'),
+        '{"events": [{"id": 7}], "stats": {"total_events": 1}}',
+      )
+
+      expect(await readEdgeEvents(dataDir)).toEqual({
+        events: [{ id: 7 }],
+        stats: { total_events: 1 },
+      })
+    })
+
+    it('returns empty data when nothing is on disk', async () => {
+      expect(await readEdgeEvents(dataDir)).toEqual({ events: [], stats: {} })
+    })
+  })
+})